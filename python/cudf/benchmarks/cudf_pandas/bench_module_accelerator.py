@@ -0,0 +1,70 @@
+# Copyright (c) 2024, NVIDIA CORPORATION.
+
+"""Benchmarks of the overhead of the cudf.pandas module accelerator.
+
+Each benchmark runs in a subprocess, since cudf.pandas must be enabled
+before pandas is first imported, and compares against plain pandas.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+NUMBER = 1_000 if "CUDF_BENCHMARKS_DEBUG_ONLY" in os.environ else 1_000_000
+
+
+def _run(script, accelerated):
+    args = [sys.executable]
+    if accelerated:
+        args += ["-m", "cudf.pandas"]
+    result = subprocess.run(
+        [*args, script], capture_output=True, text=True, check=True
+    )
+    return float(result.stdout)
+
+
+@pytest.mark.pandas_incompatible
+@pytest.mark.parametrize("accelerated", [False, True])
+def bench_module_attribute_access(benchmark, tmp_path, accelerated):
+    """Time looking up `pd.DataFrame` from user code."""
+    script = tmp_path / "script.py"
+    script.write_text(
+        "import timeit\n"
+        "import pandas as pd\n"
+        f"print(timeit.timeit('pd.DataFrame', globals={{'pd': pd}}, "
+        f"number={NUMBER}) / {NUMBER})\n"
+    )
+    per_access = benchmark.pedantic(
+        _run, args=(str(script), accelerated), rounds=1, iterations=1
+    )
+    benchmark.extra_info["seconds_per_access"] = per_access
+
+
+@pytest.mark.pandas_incompatible
+@pytest.mark.parametrize("accelerated", [False, True])
+@pytest.mark.parametrize("num_threads", [1, 4])
+def bench_concurrent_fallbacks(benchmark, tmp_path, accelerated, num_threads):
+    """Time `num_threads` threads each running a slow fallback.
+
+    The fallback spends its time in `time.sleep`, which releases the
+    GIL, so the wall time should not grow with the number of threads.
+    """
+    script = tmp_path / "script.py"
+    script.write_text(
+        "import time\n"
+        "from concurrent.futures import ThreadPoolExecutor\n"
+        "import pandas as pd\n"
+        "def fallback(_):\n"
+        "    # cudf can't compile this UDF, so it runs with pandas\n"
+        "    pd.Series(range(10)).apply(lambda x: time.sleep(0.01) or x)\n"
+        "start = time.perf_counter()\n"
+        f"with ThreadPoolExecutor({num_threads}) as executor:\n"
+        f"    list(executor.map(fallback, range({num_threads})))\n"
+        "print(time.perf_counter() - start)\n"
+    )
+    wall_time = benchmark.pedantic(
+        _run, args=(str(script), accelerated), rounds=1, iterations=1
+    )
+    benchmark.extra_info["wall_time"] = wall_time
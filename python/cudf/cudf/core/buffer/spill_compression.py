@@ -0,0 +1,94 @@
+# Copyright (c) 2024, NVIDIA CORPORATION.
+
+from __future__ import annotations
+
+import zlib
+from functools import partial
+from typing import Callable, NamedTuple
+
+import numpy
+
+
+class Codec(NamedTuple):
+    """Compression codec of spilled host memory
+
+    `decompress` is called with the compressed data and the size of the
+    decompressed data, and returns a writable memoryview of the latter.
+    """
+
+    name: str
+    compress: Callable[[memoryview], bytes]
+    decompress: Callable[[bytes, int], memoryview]
+
+
+def _zlib_decompress(data: bytes, nbytes: int) -> memoryview:
+    # zlib can't decompress into a given buffer
+    return memoryview(bytearray(zlib.decompress(data, bufsize=nbytes)))
+
+
+def _zlib() -> Codec:
+    # Favor speed, spilling is on the critical path
+    return Codec("zlib", partial(zlib.compress, level=1), _zlib_decompress)
+
+
+def _lz4() -> Codec:
+    import lz4.frame
+
+    def decompress(data: bytes, nbytes: int) -> memoryview:
+        return memoryview(lz4.frame.decompress(data, return_bytearray=True))
+
+    return Codec("lz4", lz4.frame.compress, decompress)
+
+
+def _zstd() -> Codec:
+    import zstandard
+
+    def decompress(data: bytes, nbytes: int) -> memoryview:
+        # Uninitialized, see `cudf.core.buffer.buffer.host_memory_allocation`
+        ret = memoryview(numpy.empty(nbytes, dtype="u1"))
+        dst = ret
+        with zstandard.ZstdDecompressor().stream_reader(data) as reader:
+            while dst.nbytes > 0:
+                n = reader.readinto(dst)
+                if not n:
+                    raise EOFError("Truncated spilled data")
+                dst = dst[n:]
+        return ret
+
+    return Codec("zstd", partial(zstandard.compress, level=1), decompress)
+
+
+_CODECS: dict[str, Callable[[], Codec]] = {
+    "zlib": _zlib,
+    "lz4": _lz4,
+    "zstd": _zstd,
+}
+
+
+def get_codec(name: str) -> Codec:
+    """Get the compression codec `name`
+
+    Parameters
+    ----------
+    name : str
+        One of "zlib", "lz4" (requires the lz4 package) or "zstd"
+        (requires the zstandard package).
+
+    Return
+    ------
+    Codec
+        The compression and decompression functions.
+    """
+    try:
+        factory = _CODECS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown spill compression codec: {name}. "
+            f"Must be one of {sorted(_CODECS)}."
+        ) from None
+    try:
+        return factory()
+    except ImportError as e:
+        raise ValueError(
+            f"The spill compression codec {name} isn't available: {e}"
+        ) from e
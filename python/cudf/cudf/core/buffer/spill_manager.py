@@ -2,26 +2,34 @@
 
 from __future__ import annotations
 
+import collections.abc
 import gc
 import io
 import textwrap
 import threading
+import time
 import traceback
 import warnings
 import weakref
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import contextmanager
 from dataclasses import dataclass
 from functools import partial
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import rmm.mr
 
+from cudf.core.buffer.spill_compression import get_codec
+from cudf.core.buffer.spill_policy import SpillPolicy, get_spill_policy
 from cudf.options import get_option
 from cudf.utils.performance_tracking import _performance_tracking
 from cudf.utils.string import format_bytes
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Container, Iterable, Iterator
+
+    from cudf.core.buffer.spill_compression import Codec
     from cudf.core.buffer.spillable_buffer import SpillableBufferOwner
 
 _spill_cudf_nvtx_annotate = partial(
@@ -29,6 +37,28 @@ _spill_cudf_nvtx_annotate = partial(
 )
 
 
+def _append_key(keys: list[int], ref: _BufferRef) -> None:
+    # Weak reference callback of the buffers managed by a SpillManager
+    keys.append(ref.key)
+
+
+def _spill_to_host(buf: SpillableBufferOwner) -> int:
+    # Spill a locked device buffer to host memory, return the bytes freed
+    if not buf.is_spilled and buf.spillable:
+        buf.spill(target="cpu")
+        return buf.size
+    return 0
+
+
+def _spill_to_disk(buf: SpillableBufferOwner) -> int:
+    # Spill a locked buffer in host memory to disk, return the bytes freed
+    if buf.location == "cpu" and buf.spillable:
+        freed = buf.location_nbytes
+        buf.spill(target="disk")
+        return freed
+    return 0
+
+
 def get_traceback() -> str:
     """Pretty print current traceback to a string"""
     with io.StringIO() as f:
@@ -63,7 +93,8 @@ class SpillStatistics:
 
     Levels of information gathered:
       0  - disabled (no overhead).
-      1+ - duration and number of bytes spilled (very low overhead).
+      1+ - duration and number of bytes spilled, and compressed (very low
+           overhead).
       2+ - a traceback for each time a spillable buffer is exposed
            permanently (potential high overhead).
 
@@ -100,11 +131,20 @@ class SpillStatistics:
         spilled_nbytes: int = 0
 
     spill_totals: dict[tuple[str, str], tuple[int, float]]
+    compression_totals: dict[str, tuple[int, int, float, float]]
+    background_totals: dict[str, tuple[int, int, float]]
 
     def __init__(self, level) -> None:
         self.lock = threading.Lock()
         self.level = level
         self.spill_totals = defaultdict(lambda: (0, 0))
+        # Maps each codec to the number of bytes compressed, the number
+        # of bytes they compressed to, and the time spent compressing
+        # and decompressing
+        self.compression_totals = defaultdict(lambda: (0, 0, 0.0, 0.0))
+        # Maps each kind of background task, "spill" or "prefetch", to the
+        # number of tasks, the number of bytes they moved, and their time
+        self.background_totals = defaultdict(lambda: (0, 0, 0.0))
         # Maps each traceback to a Expose
         self.exposes: dict[str, SpillStatistics.Expose] = {}
 
@@ -131,6 +171,77 @@ class SpillStatistics:
                 total_time + time,
             )
 
+    def log_compression(
+        self, codec: str, nbytes: int, compressed_nbytes: int, time: float
+    ) -> None:
+        """Log a compression of spilled data
+
+        Parameters
+        ----------
+        codec : str
+            The compression codec.
+        nbytes : int
+            Number of bytes compressed.
+        compressed_nbytes : int
+            Number of bytes of the compressed data.
+        time : float
+            Elapsed time the compression took in seconds.
+        """
+        if self.level < 1:
+            return
+        with self.lock:
+            total, compressed, ctime, dtime = self.compression_totals[codec]
+            self.compression_totals[codec] = (
+                total + nbytes,
+                compressed + compressed_nbytes,
+                ctime + time,
+                dtime,
+            )
+
+    def log_decompression(self, codec: str, time: float) -> None:
+        """Log a decompression of spilled data
+
+        Parameters
+        ----------
+        codec : str
+            The compression codec.
+        time : float
+            Elapsed time the decompression took in seconds.
+        """
+        if self.level < 1:
+            return
+        with self.lock:
+            total, compressed, ctime, dtime = self.compression_totals[codec]
+            self.compression_totals[codec] = (
+                total,
+                compressed,
+                ctime,
+                dtime + time,
+            )
+
+    def log_background(self, kind: str, nbytes: int, time: float) -> None:
+        """Log a task of the background spilling
+
+        Parameters
+        ----------
+        kind : str
+            "spill" for spilling down to the watermark or "prefetch" for
+            unspilling prefetched buffers.
+        nbytes : int
+            Number of bytes (un-)spilled.
+        time : float
+            Elapsed time the task took in seconds.
+        """
+        if self.level < 1:
+            return
+        with self.lock:
+            count, total_nbytes, total_time = self.background_totals[kind]
+            self.background_totals[kind] = (
+                count + 1,
+                total_nbytes + nbytes,
+                total_time + time,
+            )
+
     def log_expose(self, buf: SpillableBufferOwner) -> None:
         """Log an expose event
 
@@ -174,9 +285,31 @@ class SpillStatistics:
             if len(self.spill_totals) == 0:
                 ret += " None"
             ret += "\n"
-            for (src, dst), (nbytes, time) in self.spill_totals.items():
+            for (src, dst), (nbytes, seconds) in self.spill_totals.items():
                 ret += f"    {src} => {dst}: "
-                ret += f"{format_bytes(nbytes)} in {time:.3f}s\n"
+                ret += f"{format_bytes(nbytes)} in {seconds:.3f}s\n"
+
+            # Print compression stats
+            if len(self.compression_totals) > 0:
+                ret += "  Compression (level >= 1):\n"
+            for codec, totals in self.compression_totals.items():
+                nbytes, compressed, ctime, dtime = totals
+                ratio = nbytes / compressed if compressed else 0
+                ret += (
+                    f"    {codec}: {format_bytes(nbytes)} => "
+                    f"{format_bytes(compressed)} ({ratio:.1f}x) "
+                    f"in {ctime:.3f}s, decompressed in {dtime:.3f}s\n"
+                )
+
+            # Print background stats
+            if len(self.background_totals) > 0:
+                ret += "  Background (level >= 1):\n"
+            for kind, totals in self.background_totals.items():
+                count, nbytes, seconds = totals
+                ret += (
+                    f"    {kind}: {count} tasks, "
+                    f"{format_bytes(nbytes)} in {seconds:.3f}s\n"
+                )
 
             # Print expose stats
             ret += "  Exposed buffers (level >= 2): "
@@ -198,6 +331,83 @@ class SpillStatistics:
             return ret[:-1]  # Remove last `\n`
 
 
+class _BufferRef(weakref.ref):
+    """Weak reference to a managed buffer and its bookkeeping
+
+    The location and the number of bytes the buffer occupies there are
+    kept here, so that the memory of a buffer can be accounted for after
+    the buffer has been garbage collected.
+    """
+
+    __slots__ = ("key", "nbytes", "location")
+
+
+class _SpillWorker(threading.Thread):
+    """Daemon thread spilling device memory down to the watermark
+
+    The thread sleeps until woken up by `wake()` and exits once its
+    manager has been garbage collected, or `stop()` is called.
+    """
+
+    def __init__(self, manager: SpillManager):
+        super().__init__(name="cudf-spill-worker", daemon=True)
+        self._manager = weakref.ref(manager)
+        self._wakeup = threading.Event()
+        self._stopped = False
+        weakref.finalize(manager, self.stop)
+
+    def wake(self) -> None:
+        self._wakeup.set()
+
+    def stop(self) -> None:
+        self._stopped = True
+        self._wakeup.set()
+
+    def run(self):
+        while True:
+            self._wakeup.wait()
+            self._wakeup.clear()
+            manager = self._manager()
+            if self._stopped or manager is None:
+                return
+            manager._spill_to_watermark()
+            del manager
+
+
+def _spillable_owners(obj: Any) -> Iterator[SpillableBufferOwner]:
+    """Generate the spillable buffers of `obj`
+
+    `obj` is a buffer, a column, a frame (including its index) or an
+    iterable of those.
+    """
+    from cudf.core.buffer.spillable_buffer import (
+        SpillableBuffer,
+        SpillableBufferOwner,
+    )
+    from cudf.core.column import ColumnBase
+    from cudf.core.frame import Frame
+    from cudf.core.indexed_frame import IndexedFrame
+
+    if isinstance(obj, SpillableBufferOwner):
+        yield obj
+    elif isinstance(obj, SpillableBuffer):
+        yield obj.owner
+    elif isinstance(obj, ColumnBase):
+        for buf in (obj.base_data, obj.base_mask):
+            if buf is not None:
+                yield from _spillable_owners(buf)
+        for child in obj.base_children:
+            yield from _spillable_owners(child)
+    elif isinstance(obj, Frame):
+        for col in obj._columns:
+            yield from _spillable_owners(col)
+        if isinstance(obj, IndexedFrame):
+            yield from _spillable_owners(obj.index)
+    elif isinstance(obj, collections.abc.Iterable):
+        for item in obj:
+            yield from _spillable_owners(item)
+
+
 class SpillManager:
     """Manager of spillable buffers.
 
@@ -207,34 +417,118 @@ class SpillManager:
     When `device_memory_limit=<limit-in-bytes>`, the manager will try keep
     the device memory usage below the specified limit by spilling of spillable
     buffers continuously, which will introduce a modest overhead.
+    To keep this overhead independent of the number of buffers, the manager
+    maintains the number of bytes in each location (device, host or disk)
+    incrementally and keeps the buffers of each location ordered by access
+    time, so that finding the buffers to spill only visits the least
+    recently accessed of them. Which buffers are spilled first is decided
+    by a `SpillPolicy`, the least recently accessed by default.
+
+    When `spill_watermark=<watermark-in-bytes>`, a background thread spills
+    buffers whenever the device memory usage exceeds the watermark, so that
+    allocations seldom have to wait for spilling. Spilled buffers about to
+    be used can be unspilled in the background by `prefetch()`.
     Notice, this is a soft limit. The memory usage might exceed the limit if
     too many buffers are unspillable.
 
+    Similarly, when `host_memory_limit=<limit-in-bytes>`, the manager will
+    try to keep the host memory used by spilled buffers below the specified
+    limit by moving the least recently accessed of them to disk.
+
     Parameters
     ----------
     device_memory_limit: int, optional
         If not None, this is the device memory limit in bytes that triggers
         device to host spilling. The global manager sets this to the value
         of `CUDF_SPILL_DEVICE_LIMIT` or None.
+    host_memory_limit: int, optional
+        If not None, this is the limit in bytes of host memory used by
+        spilled buffers that triggers host to disk spilling. The global
+        manager sets this to the value of `CUDF_SPILL_HOST_LIMIT` or None.
+    spill_directory: str, optional
+        The directory of the files buffers are spilled to. If None, the
+        default temporary directory is used. The global manager sets this
+        to the value of `CUDF_SPILL_DIRECTORY` or None.
+    compression: str, optional
+        If not None, the codec compressing the data spilled to host memory
+        and disk, see `cudf.core.buffer.spill_compression.get_codec`. The
+        global manager sets this to the value of `CUDF_SPILL_COMPRESSION`
+        or None.
+    compression_threshold: int, optional
+        The minimum size in bytes of the buffers compressed. The global
+        manager sets this to the value of `CUDF_SPILL_COMPRESSION_THRESHOLD`
+        or 64KiB.
+    spill_watermark: int, optional
+        If not None, the device memory usage in bytes above which a
+        background thread starts spilling. The global manager sets this to
+        the value of `CUDF_SPILL_WATERMARK` or None.
+    spill_policy: str or SpillPolicy, optional
+        The policy choosing the buffers to spill first, or the name of a
+        registered policy, see `cudf.core.buffer.spill_policy`. The global
+        manager sets this to the value of `CUDF_SPILL_POLICY` or "lru".
     statistic_level: int, optional
         If not 0, enables statistics at the specified level. See
         SpillStatistics for the different levels.
+    device_backend: optional
+        The device memory of the buffers, RMM if None. See
+        `cudf.core.buffer.spillable_buffer.RMMBackend`.
     """
 
-    _buffers: weakref.WeakValueDictionary[int, SpillableBufferOwner]
+    _buffers: dict[int, _BufferRef]
+    _lru: dict[str, OrderedDict[int, None]]
+    _nbytes: dict[str, int]
     statistics: SpillStatistics
 
     def __init__(
         self,
         *,
         device_memory_limit: int | None = None,
+        host_memory_limit: int | None = None,
+        spill_directory: str | None = None,
+        compression: str | None = None,
+        compression_threshold: int = 2**16,
+        spill_watermark: int | None = None,
+        spill_policy: str | SpillPolicy = "lru",
         statistic_level: int = 0,
+        device_backend: Any = None,
     ) -> None:
         self._lock = threading.Lock()
-        self._buffers = weakref.WeakValueDictionary()
-        self._id_counter = 0
+        # All managed buffers by `id()`. The id of a garbage collected
+        # buffer can be reused before its entry is removed, which is why
+        # entries are always checked to be alive.
+        self._buffers = {}
+        # Keys of the buffers in each location, ordered by access time
+        # (least recently accessed first). Buffers exposed permanently are
+        # dropped from these lazily, since they can never be spilled.
+        self._lru = {loc: OrderedDict() for loc in ("gpu", "cpu", "disk")}
+        # Total size of the buffers in each location
+        self._nbytes = {loc: 0 for loc in self._lru}
+        # Keys of garbage collected buffers. Weak reference callbacks can
+        # run at any time, even while `self._lock` is held by the same
+        # thread, so they only record the key here.
+        self._finalized: list[int] = []
+        self._on_finalize = partial(_append_key, self._finalized)
         self._device_memory_limit = device_memory_limit
+        self._host_memory_limit = host_memory_limit
+        self.spill_directory = spill_directory
+        if isinstance(spill_policy, str):
+            spill_policy = get_spill_policy(spill_policy)
+        self.spill_policy = spill_policy
+        self.compression = compression
+        self.compression_threshold = compression_threshold
+        self._codec = None if compression is None else get_codec(compression)
+        if device_backend is None:
+            from cudf.core.buffer.spillable_buffer import RMMBackend
+
+            device_backend = RMMBackend()
+        self.device_backend = device_backend
         self.statistics = SpillStatistics(statistic_level)
+        self._spill_watermark = spill_watermark
+        self._worker: _SpillWorker | None = None
+        if spill_watermark is not None:
+            self._worker = _SpillWorker(self)
+            self._worker.start()
+        self._prefetcher: ThreadPoolExecutor | None = None
 
     def _out_of_memory_handle(self, nbytes: int, *, retry_once=True) -> bool:
         """Try to handle an out-of-memory error by spilling
@@ -280,6 +574,88 @@ class SpillManager:
         )
         return False  # Since we didn't find anything to spill, we give up
 
+    def compress(self, data: memoryview) -> tuple[Codec, bytes] | None:
+        """Compress data being spilled to host memory or disk
+
+        Parameters
+        ----------
+        data : memoryview
+            The data to compress.
+
+        Return
+        ------
+        tuple or None
+            The codec and the compressed data or None, if compression is
+            disabled, the data is below the compression threshold or
+            doesn't compress.
+        """
+        if self._codec is None or data.nbytes < self.compression_threshold:
+            return None
+        time_start = time.perf_counter()
+        ret = self._codec.compress(data)
+        self.statistics.log_compression(
+            self.compression,
+            nbytes=data.nbytes,
+            compressed_nbytes=len(ret),
+            time=time.perf_counter() - time_start,
+        )
+        if len(ret) >= data.nbytes:
+            return None
+        return self._codec, ret
+
+    def decompress(self, codec: Codec, data: bytes, nbytes: int) -> memoryview:
+        """Decompress data compressed by `compress`
+
+        Parameters
+        ----------
+        codec : Codec
+            The codec returned by `compress`.
+        data : bytes
+            The compressed data.
+        nbytes : int
+            The size of the decompressed data.
+
+        Return
+        ------
+        memoryview
+            The decompressed data, writable.
+        """
+        time_start = time.perf_counter()
+        ret = codec.decompress(data, nbytes)
+        self.statistics.log_decompression(
+            codec.name, time=time.perf_counter() - time_start
+        )
+        return ret
+
+    def _remove_finalized(self) -> None:
+        """Forget the garbage collected buffers
+
+        Must be called with `self._lock` held.
+        """
+        while self._finalized:
+            self._discard(self._finalized.pop())
+
+    def _discard(self, key: int) -> None:
+        """Forget the buffer of `key` if it has been garbage collected
+
+        Must be called with `self._lock` held.
+        """
+        ref = self._buffers.get(key)
+        if ref is not None and ref() is None:
+            del self._buffers[key]
+            self._nbytes[ref.location] -= ref.nbytes
+            self._lru[ref.location].pop(key, None)
+
+    def _get_ref(self, buffer: SpillableBufferOwner) -> _BufferRef | None:
+        """Get the entry of `buffer` or None, if it isn't managed
+
+        Must be called with `self._lock` held.
+        """
+        ref = self._buffers.get(id(buffer))
+        if ref is None or ref() is not buffer:
+            return None
+        return ref
+
     def add(self, buffer: SpillableBufferOwner) -> None:
         """Add buffer to the set of managed buffers
 
@@ -291,10 +667,204 @@ class SpillManager:
             The buffer to manage
         """
         if buffer.size > 0 and not buffer.exposed:
+            ref = _BufferRef(buffer, self._on_finalize)
+            ref.key = id(buffer)
+            ref.nbytes = buffer.location_nbytes
+            ref.location = buffer.location
             with self._lock:
-                self._buffers[self._id_counter] = buffer
-                self._id_counter += 1
+                self._remove_finalized()
+                # A dead buffer might not have been removed yet
+                self._discard(ref.key)
+                self._buffers[ref.key] = ref
+                self._lru[ref.location][ref.key] = None
+                self._nbytes[ref.location] += ref.nbytes
+            if ref.location == "gpu":
+                self._wake_worker()
         self.spill_to_device_limit()
+        if buffer.is_spilled:
+            self.spill_to_host_limit()
+
+    def log_access(self, buffer: SpillableBufferOwner) -> None:
+        """Mark `buffer` as the most recently accessed buffer
+
+        Parameters
+        ----------
+        buffer : SpillableBufferOwner
+            The accessed buffer, ignored if not managed.
+        """
+        with self._lock:
+            ref = self._get_ref(buffer)
+            if ref is not None:
+                lru = self._lru[ref.location]
+                if ref.key in lru:
+                    lru.move_to_end(ref.key)
+
+    def log_spill(
+        self, buffer: SpillableBufferOwner, src: str, dst: str
+    ) -> None:
+        """Record that `buffer` moved from `src` to `dst`
+
+        Also used, with `src == dst`, when the number of bytes the buffer
+        occupies changes, e.g., when decompressed in host memory.
+
+        Parameters
+        ----------
+        buffer : SpillableBufferOwner
+            The moved buffer, ignored if not managed.
+        src : str
+            The location the buffer was in.
+        dst : str
+            The location the buffer is in now.
+        """
+        with self._lock:
+            ref = self._get_ref(buffer)
+            if ref is not None and ref.location == src:
+                key = ref.key
+                self._nbytes[src] -= ref.nbytes
+                ref.location = dst
+                ref.nbytes = buffer.location_nbytes
+                self._nbytes[dst] += ref.nbytes
+                self._lru[src].pop(key, None)
+                self._lru[dst][key] = None
+        if dst == "gpu":
+            self._wake_worker()
+
+    def _wake_worker(self) -> None:
+        """Wake up the background spilling if above the watermark"""
+        if (
+            self._worker is not None
+            and self._nbytes["gpu"] > self._spill_watermark
+        ):
+            self._worker.wake()
+
+    def _spill_to_watermark(self) -> None:
+        """Spill device memory down to the watermark, see `_SpillWorker`"""
+        time_start = time.perf_counter()
+        spilled = self.spill_to_device_limit(self._spill_watermark)
+        if spilled > 0:
+            self.statistics.log_background(
+                "spill", spilled, time.perf_counter() - time_start
+            )
+
+    def prefetch(self, obj: Any) -> Future:
+        """Unspill buffers in the background
+
+        The buffers are also marked as the most recently accessed, so they
+        are the last to be spilled again.
+
+        Parameters
+        ----------
+        obj : Any
+            The buffers to unspill: a buffer, a column, a frame (all the
+            columns and the index of it) or an iterable of those.
+
+        Return
+        ------
+        Future
+            Resolves to the number of bytes unspilled.
+        """
+        buffers = list(_spillable_owners(obj))
+        with self._lock:
+            if self._prefetcher is None:
+                self._prefetcher = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="cudf-spill-prefetch"
+                )
+        return self._prefetcher.submit(self._prefetch, buffers)
+
+    def _prefetch(self, buffers: Iterable[SpillableBufferOwner]) -> int:
+        time_start = time.perf_counter()
+        unspilled = 0
+        for buf in buffers:
+            with buf.lock:
+                if buf.is_spilled:
+                    buf.spill(target="gpu")
+                    unspilled += buf.size
+            self.log_access(buf)
+        self.statistics.log_background(
+            "prefetch", unspilled, time.perf_counter() - time_start
+        )
+        return unspilled
+
+    def _spillable(
+        self, location: str, exposed: list[int], exclude: Container[int]
+    ) -> Iterator[SpillableBufferOwner]:
+        """Generate the spillable buffers in `location` in access order
+
+        The buffers whose keys are in `exclude` are skipped and the keys of
+        exposed buffers found are appended to `exposed`. Must be called with
+        `self._lock` held.
+        """
+        for key in self._lru[location]:
+            if key in exclude:
+                continue
+            buf = self._buffers[key]()
+            if buf is None:
+                continue
+            if buf.exposed:
+                exposed.append(key)
+            elif buf.spillable:
+                yield buf
+
+    def _spill_candidates(
+        self, location: str, nbytes: int, exclude: Container[int] = ()
+    ) -> list[SpillableBufferOwner]:
+        """Get the spillable buffers in `location` to spill first
+
+        Visits the buffers of `location`, except those whose keys are in
+        `exclude`, in the order of the spill policy until finding buffers
+        of a total size of at least `nbytes`.
+        """
+        ret = []
+        total = 0
+        with self._lock:
+            self._remove_finalized()
+            exposed: list[int] = []
+            for buf in self.spill_policy.order(
+                self._spillable(location, exposed, exclude),
+                location=location,
+                statistics=self.statistics,
+            ):
+                if ret and total >= nbytes:
+                    break
+                ret.append(buf)
+                total += buf.location_nbytes
+            lru = self._lru[location]
+            for key in exposed:
+                lru.pop(key, None)
+        return ret
+
+    def _spill(
+        self,
+        location: str,
+        nbytes: int,
+        spill: Callable[[SpillableBufferOwner], int],
+    ) -> int:
+        """Spill buffers in `location` until `nbytes` bytes are freed
+
+        Candidates are taken from `_spill_candidates` until `spill`, called
+        with each candidate locked, reports freeing at least `nbytes` bytes
+        in total or no candidates are left. Buffers already locked are
+        skipped, so this is safe to call doing spill-on-demand.
+        """
+        spilled = 0
+        # The buffers visited by `id()`, kept alive so ids aren't reused
+        visited: dict[int, SpillableBufferOwner] = {}
+        while spilled < nbytes:
+            candidates = self._spill_candidates(
+                location, nbytes - spilled, visited
+            )
+            if not candidates:
+                break
+            for buf in candidates:
+                visited[id(buf)] = buf
+                if buf.lock.acquire(blocking=False):
+                    try:
+                        spilled += spill(buf)
+                    finally:
+                        buf.lock.release()
+                    if spilled >= nbytes:
+                        break
+        return spilled
 
     def buffers(
         self, order_by_access_time: bool = False
@@ -312,7 +882,12 @@ class SpillManager:
             Tuple of buffers
         """
         with self._lock:
-            ret = tuple(self._buffers.values())
+            self._remove_finalized()
+            ret = tuple(
+                buf
+                for buf in (ref() for ref in self._buffers.values())
+                if buf is not None
+            )
         if order_by_access_time:
             ret = tuple(sorted(ret, key=lambda b: b.last_accessed))
         return ret
@@ -334,17 +909,9 @@ class SpillManager:
         int
             Number of actually bytes spilled.
         """
-        spilled = 0
-        for buf in self.buffers(order_by_access_time=True):
-            if buf.lock.acquire(blocking=False):
-                try:
-                    if not buf.is_spilled and buf.spillable:
-                        buf.spill(target="cpu")
-                        spilled += buf.size
-                        if spilled >= nbytes:
-                            break
-                finally:
-                    buf.lock.release()
+        spilled = self._spill("gpu", nbytes, _spill_to_host)
+        if spilled > 0:
+            self.spill_to_host_limit()
         return spilled
 
     def spill_to_device_limit(self, device_limit: int | None = None) -> int:
@@ -369,16 +936,51 @@ class SpillManager:
         )
         if limit is None:
             return 0
-        unspilled = sum(
-            buf.size for buf in self.buffers() if not buf.is_spilled
-        )
+        with self._lock:
+            self._remove_finalized()
+            unspilled = self._nbytes["gpu"]
+        if unspilled <= limit:
+            return 0
         return self.spill_device_memory(nbytes=unspilled - limit)
 
+    @_spill_cudf_nvtx_annotate
+    def spill_to_host_limit(self, host_limit: int | None = None) -> int:
+        """Try to spill host memory to disk until host limit
+
+        Only the host memory of spilled buffers counts towards the limit.
+        Notice, by default this is a no-op.
+
+        This function is safe to call doing spill-on-demand
+        since it does not lock buffers already locked.
+
+        Parameters
+        ----------
+        host_limit : int, optional
+            Limit in bytes. If None, the value of the environment variable
+            `CUDF_SPILL_HOST_LIMIT` is used. If this is not set, the method
+            does nothing and returns 0.
+
+        Return
+        ------
+        int
+            The number of bytes of host memory freed.
+        """
+        limit = self._host_memory_limit if host_limit is None else host_limit
+        if limit is None:
+            return 0
+        with self._lock:
+            self._remove_finalized()
+            nbytes = self._nbytes["cpu"] - limit
+        if nbytes <= 0:
+            return 0
+        return self._spill("cpu", nbytes, _spill_to_disk)
+
     def __repr__(self) -> str:
-        spilled = sum(buf.size for buf in self.buffers() if buf.is_spilled)
-        unspilled = sum(
-            buf.size for buf in self.buffers() if not buf.is_spilled
-        )
+        with self._lock:
+            self._remove_finalized()
+            unspilled = self._nbytes["gpu"]
+            on_disk = self._nbytes["disk"]
+            spilled = self._nbytes["cpu"] + on_disk
         unspillable = 0
         for buf in self.buffers():
             if not (buf.is_spilled or buf.spillable):
@@ -391,7 +993,8 @@ class SpillManager:
 
         return (
             f"<SpillManager device_memory_limit={dev_limit} | "
-            f"{format_bytes(spilled)} spilled | "
+            f"{format_bytes(spilled)} spilled "
+            f"({format_bytes(on_disk)} on disk) | "
             f"{format_bytes(unspilled)} ({unspillable_ratio:.0%}) "
             f"unspilled (unspillable)>"
         )
@@ -426,6 +1029,14 @@ def get_global_manager() -> SpillManager | None:
         if get_option("spill"):
             manager = SpillManager(
                 device_memory_limit=get_option("spill_device_limit"),
+                host_memory_limit=get_option("spill_host_limit"),
+                spill_directory=get_option("spill_directory"),
+                compression=get_option("spill_compression"),
+                compression_threshold=get_option(
+                    "spill_compression_threshold"
+                ),
+                spill_watermark=get_option("spill_watermark"),
+                spill_policy=get_option("spill_policy"),
                 statistic_level=get_option("spill_stats"),
             )
             set_global_manager(manager)
@@ -0,0 +1,192 @@
+# Copyright (c) 2024, NVIDIA CORPORATION.
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from cudf.core.buffer.spill_manager import SpillStatistics
+    from cudf.core.buffer.spillable_buffer import SpillableBufferOwner
+
+
+# The location each location is spilled to
+_SPILL_TARGET = {"gpu": "cpu", "cpu": "disk"}
+
+
+class SpillPolicy:
+    """Policy choosing the buffers a `SpillManager` spills first
+
+    Subclasses implement `order()`, which is called by the manager with
+    its lock held, so it must not call methods of the manager.
+    """
+
+    def order(
+        self,
+        buffers: Iterable[SpillableBufferOwner],
+        *,
+        location: str,
+        statistics: SpillStatistics,
+    ) -> Iterable[SpillableBufferOwner]:
+        """Order buffers by spilling priority
+
+        Parameters
+        ----------
+        buffers : iterable of SpillableBufferOwner
+            The spillable buffers in `location`, least recently accessed
+            first. This is generated lazily, consuming only the first
+            buffers of it is cheaper than consuming all of them.
+        location : str
+            Where the buffers are, "gpu" (spilled to host memory) or "cpu"
+            (spilled to disk).
+        statistics : SpillStatistics
+            The statistics of the manager.
+
+        Return
+        ------
+        iterable of SpillableBufferOwner
+            The buffers, the first to spill first. The manager consumes
+            it until enough memory is found.
+        """
+        raise NotImplementedError()
+
+
+class LRUPolicy(SpillPolicy):
+    """Spill the least recently accessed buffers first
+
+    This is the default policy. Only the buffers spilled are visited.
+    """
+
+    def order(self, buffers, *, location, statistics):
+        return buffers
+
+
+class SizeWeightedLRUPolicy(SpillPolicy):
+    """Spill the buffers with the largest size times idle time first
+
+    Large buffers are spilled before small buffers accessed at the same
+    time, which frees the memory requested with fewer spills.
+    """
+
+    def order(self, buffers, *, location, statistics):
+        now = time.monotonic()
+        return sorted(
+            buffers, key=lambda buf: -(now - buf.last_accessed) * buf.size
+        )
+
+
+class LFUPolicy(SpillPolicy):
+    """Spill the least frequently accessed buffers first
+
+    Ties are broken by access time, least recently accessed first.
+    """
+
+    def order(self, buffers, *, location, statistics):
+        return sorted(
+            buffers, key=lambda buf: (buf.access_count, buf.last_accessed)
+        )
+
+
+class CostAwarePolicy(SpillPolicy):
+    """Spill the buffers expected to cost the least time per byte first
+
+    The cost of spilling a buffer is the time to spill it plus, weighted
+    by the likelihood that it is accessed again, the time to unspill it.
+    The likelihood is estimated from the number of accesses of the buffer,
+    discounted by the time since the last one. Transfer times are
+    estimated from the bandwidths recorded by the statistics of the manager
+    when enabled (see `SpillStatistics`) and `bandwidth` otherwise.
+
+    Since every transfer has a fixed `latency`, large rarely accessed
+    buffers are spilled first and small frequently accessed buffers last.
+
+    Parameters
+    ----------
+    latency : float, optional
+        The fixed time in seconds of a transfer.
+    bandwidth : float, optional
+        The bandwidth in bytes per second of transfers without statistics.
+    """
+
+    def __init__(self, latency: float = 1e-5, bandwidth: float = 1e10):
+        self.latency = latency
+        self.bandwidth = bandwidth
+
+    def _transfer_time(
+        self, statistics: SpillStatistics, src: str, dst: str, nbytes: int
+    ) -> float:
+        bandwidth = self.bandwidth
+        with statistics.lock:
+            total_nbytes, total_time = statistics.spill_totals.get(
+                (src, dst), (0, 0)
+            )
+        if total_nbytes > 0 and total_time > 0:
+            bandwidth = total_nbytes / total_time
+        return self.latency + nbytes / bandwidth
+
+    def order(self, buffers, *, location, statistics):
+        now = time.monotonic()
+        target = _SPILL_TARGET[location]
+
+        def cost_per_byte(buf: SpillableBufferOwner) -> float:
+            likelihood = buf.access_count / (1 + now - buf.last_accessed)
+            cost = self._transfer_time(
+                statistics, location, target, buf.size
+            ) + likelihood * self._transfer_time(
+                statistics, target, location, buf.size
+            )
+            return cost / buf.size
+
+        return sorted(buffers, key=cost_per_byte)
+
+
+_SPILL_POLICIES: dict[str, Callable[[], SpillPolicy]] = {
+    "lru": LRUPolicy,
+    "size_weighted_lru": SizeWeightedLRUPolicy,
+    "lfu": LFUPolicy,
+    "cost_aware": CostAwarePolicy,
+}
+
+
+def register_spill_policy(
+    name: str, factory: Callable[[], SpillPolicy]
+) -> None:
+    """Register a spill policy
+
+    Makes the policy available to `SpillManager` and the "spill_policy"
+    option under `name`.
+
+    Parameters
+    ----------
+    name : str
+        The name of the policy, replacing any policy of the same name.
+    factory : callable
+        Called without arguments to create the policy, e.g., a subclass
+        of `SpillPolicy`.
+    """
+    _SPILL_POLICIES[name] = factory
+
+
+def get_spill_policy(name: str) -> SpillPolicy:
+    """Create the spill policy registered under `name`
+
+    Parameters
+    ----------
+    name : str
+        The name of the policy.
+
+    Return
+    ------
+    SpillPolicy
+        A new instance of the policy.
+    """
+    try:
+        factory = _SPILL_POLICIES[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown spill policy: {name}. "
+            f"Must be one of {sorted(_SPILL_POLICIES)}."
+        ) from None
+    return factory()
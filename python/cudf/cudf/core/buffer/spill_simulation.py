@@ -0,0 +1,247 @@
+# Copyright (c) 2024, NVIDIA CORPORATION.
+
+"""
+Simulation of spilling without device memory.
+
+`SimulatedDevice` is a device backend of `SpillManager` (see
+`cudf.core.buffer.spillable_buffer.RMMBackend`) allocating its "device
+memory" in host memory, with a capacity and a transfer bandwidth.
+`replay` runs a trace of allocations, accesses and frees of buffers
+through a `SpillManager` backed by it, which makes it possible to test
+and benchmark spill policies, accounting and statistics on any machine.
+
+A trace is an iterable of events, dicts with the keys:
+
+- ``op``: ``"alloc"``, ``"access"`` or ``"free"``.
+- ``id``: a hashable identifying the buffer.
+- ``nbytes``: the size of the buffer, for ``"alloc"`` only.
+
+`load_trace` reads traces stored as JSON lines.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import json
+import time
+from typing import TYPE_CHECKING, Any, Callable
+
+import numpy
+
+from cudf.core.buffer.spill_manager import (
+    SpillManager,
+    get_global_manager,
+    set_global_manager,
+)
+from cudf.core.buffer.spillable_buffer import SpillableBufferOwner
+from cudf.core.buffer.utils import acquire_spill_lock
+
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Iterable, Iterator
+
+
+class SimulatedDeviceBuffer:
+    """An allocation of a `SimulatedDevice`
+
+    Implements the CUDA Array Interface, pointing to host memory.
+    """
+
+    def __init__(self, device: SimulatedDevice, nbytes: int):
+        self._device = device
+        self._data = numpy.empty(nbytes, dtype="u1")
+        self.ptr = self._data.__array_interface__["data"][0]
+        self.size = nbytes
+        device.used += nbytes
+        device.peak = max(device.peak, device.used)
+
+    def __del__(self):
+        self._device.used -= self.size
+
+    @property
+    def __cuda_array_interface__(self) -> dict:
+        return {
+            "data": (self.ptr, False),
+            "shape": (self.size,),
+            "strides": None,
+            "typestr": "|u1",
+            "version": 0,
+        }
+
+
+class SimulatedDevice:
+    """Device memory simulated in host memory
+
+    Parameters
+    ----------
+    capacity : int
+        The number of bytes that can be allocated.
+    bandwidth : float, optional
+        The transfer bandwidth in bytes per second between the simulated
+        device and host memory.
+    sleep : bool, optional
+        Whether transfers take their simulated time (by sleeping) rather
+        than only accumulating it in `transfer_time`.
+
+    Attributes
+    ----------
+    used : int
+        The number of bytes allocated.
+    peak : int
+        The maximum of `used`.
+    transfer_time : float
+        The simulated time in seconds of all transfers.
+    on_out_of_memory : callable or None
+        Called with the number of bytes of an allocation exceeding the
+        capacity, retrying while it returns True like RMM's
+        `FailureCallbackResourceAdaptor`. Otherwise, MemoryError is raised.
+    """
+
+    def __init__(
+        self, capacity: int, bandwidth: float = 1e10, sleep: bool = False
+    ):
+        self.capacity = capacity
+        self.bandwidth = bandwidth
+        self.sleep = sleep
+        self.used = 0
+        self.peak = 0
+        self.transfer_time = 0.0
+        self.on_out_of_memory: Callable[[int], bool] | None = None
+
+    def allocate(self, nbytes: int) -> SimulatedDeviceBuffer:
+        """Allocate `nbytes` of simulated device memory"""
+        while self.used + nbytes > self.capacity:
+            if self.on_out_of_memory is None or not self.on_out_of_memory(
+                nbytes
+            ):
+                raise MemoryError(
+                    f"Simulated device out of memory allocating {nbytes} "
+                    f"bytes ({self.used} of {self.capacity} bytes used)"
+                )
+        return SimulatedDeviceBuffer(self, nbytes)
+
+    def _transfer(self, nbytes: int) -> None:
+        seconds = nbytes / self.bandwidth
+        self.transfer_time += seconds
+        if self.sleep:
+            time.sleep(seconds)
+
+    def copy_to_host(self, ptr: int, host_mem: memoryview) -> None:
+        """Copy `host_mem.nbytes` bytes of device memory at `ptr`"""
+        dst = numpy.frombuffer(host_mem, dtype="u1")
+        ctypes.memmove(dst.__array_interface__["data"][0], ptr, dst.nbytes)
+        self._transfer(dst.nbytes)
+
+    def to_device(self, host_mem: memoryview) -> SimulatedDeviceBuffer:
+        """Copy host memory to a new device allocation"""
+        src = numpy.frombuffer(host_mem, dtype="u1")
+        ret = self.allocate(src.nbytes)
+        ret._data[:] = src
+        self._transfer(src.nbytes)
+        return ret
+
+
+def load_trace(path: str | os.PathLike) -> Iterator[dict[str, Any]]:
+    """Read a trace stored as JSON lines, one event per line"""
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def replay(
+    trace: Iterable[dict[str, Any]],
+    device: SimulatedDevice,
+    *,
+    spill_on_demand: bool = True,
+    **manager_kwargs,
+) -> dict[str, Any]:
+    """Replay a trace through a `SpillManager` on a simulated device
+
+    The manager temporarily replaces the global spill manager.
+
+    Parameters
+    ----------
+    trace : iterable of dict
+        The events, see the module documentation.
+    device : SimulatedDevice
+        The device the buffers are allocated on.
+    spill_on_demand : bool, optional
+        Whether allocations exceeding the capacity of the device spill
+        buffers, like the "spill_on_demand" option.
+    **manager_kwargs
+        Passed to `SpillManager`, e.g., ``spill_policy`` or
+        ``device_memory_limit``.
+
+    Return
+    ------
+    dict
+        A report with the keys:
+
+        - ``events``: the number of events replayed.
+        - ``failed_allocations``: the number of allocations that failed
+          because the device was out of memory. Later events of their
+          buffers are ignored.
+        - ``failed_accesses``: the number of accesses that failed because
+          the device was out of memory when unspilling.
+        - ``peak_device_nbytes``: the maximum device memory used.
+        - ``transfer_time``: the simulated time in seconds of the copies
+          between device and host memory.
+        - ``spill_totals``: the number of bytes moved between locations,
+          by ``"src => dst"``, if statistics are enabled.
+        - ``manager``: the manager, e.g., to inspect its statistics.
+    """
+    manager = SpillManager(device_backend=device, **manager_kwargs)
+    if spill_on_demand:
+        device.on_out_of_memory = manager._out_of_memory_handle
+    previous = get_global_manager()
+    set_global_manager(manager)
+    buffers: dict[Any, SpillableBufferOwner] = {}
+    events = 0
+    failed = set()
+    failed_accesses = 0
+    try:
+        for event in trace:
+            events += 1
+            op, key = event["op"], event["id"]
+            if key in failed:
+                continue
+            if op == "alloc":
+                try:
+                    data = device.allocate(event["nbytes"])
+                except MemoryError:
+                    failed.add(key)
+                    continue
+                buffers[key] = SpillableBufferOwner.from_device_memory(
+                    data, exposed=False
+                )
+                # Only the buffer may keep the allocation alive
+                del data
+            elif op == "access":
+                try:
+                    with acquire_spill_lock():
+                        buffers[key].get_ptr(mode="read")
+                except MemoryError:
+                    failed_accesses += 1
+            elif op == "free":
+                del buffers[key]
+            else:
+                raise ValueError(f"Unknown trace event: {op}")
+    finally:
+        buffers.clear()
+        device.on_out_of_memory = None
+        set_global_manager(previous)
+    return {
+        "events": events,
+        "failed_allocations": len(failed),
+        "failed_accesses": failed_accesses,
+        "peak_device_nbytes": device.peak,
+        "transfer_time": device.transfer_time,
+        "spill_totals": {
+            f"{src} => {dst}": nbytes
+            for (src, dst), (nbytes, _) in (
+                manager.statistics.spill_totals.items()
+            )
+        },
+        "manager": manager,
+    }
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import collections.abc
+import mmap
 import pickle
+import tempfile
 import time
 import weakref
 from threading import RLock
@@ -33,6 +35,49 @@ class SpillLock:
     pass
 
 
+class RMMBackend:
+    """The device memory of spillable buffers, allocated through RMM
+
+    This is the default backend of `SpillManager`. A backend implements
+    the copies between device and host memory of spilling and unspilling,
+    see `cudf.core.buffer.spill_simulation.SimulatedDevice` for another.
+    """
+
+    @staticmethod
+    def copy_to_host(ptr: int, host_mem: memoryview) -> None:
+        """Copy `host_mem.nbytes` bytes of device memory at `ptr`"""
+        rmm._lib.device_buffer.copy_ptr_to_host(ptr, host_mem)
+
+    @staticmethod
+    def to_device(host_mem: memoryview) -> rmm.DeviceBuffer:
+        """Copy host memory to a new device allocation"""
+        return rmm.DeviceBuffer.to_device(host_mem)
+
+
+def _write_to_disk(data: memoryview, directory: str | None):
+    """Write spilled data to a new anonymous file in `directory`
+
+    The file is removed when the returned file object is closed (or
+    garbage collected).
+    """
+    f = tempfile.TemporaryFile(dir=directory, prefix="cudf-spill-")
+    f.write(data)
+    f.flush()
+    return f
+
+
+def _map_from_disk(f, nbytes: int) -> memoryview:
+    """Map the data of a file written by `_write_to_disk` to memory
+
+    The mapping is private (copy-on-write), so the file is never
+    modified through it.
+    """
+    if nbytes == 0:
+        # Empty files cannot be mapped
+        return host_memory_allocation(0)
+    return memoryview(mmap.mmap(f.fileno(), nbytes, access=mmap.ACCESS_COPY))
+
+
 class DelayedPointerTuple(collections.abc.Sequence):
     """
     A delayed version of the "data" field in __cuda_array_interface__.
@@ -66,10 +111,11 @@ class DelayedPointerTuple(collections.abc.Sequence):
 class SpillableBufferOwner(BufferOwner):
     """A Buffer that supports spilling memory off the GPU to avoid OOMs.
 
-    This buffer supports spilling the represented data to host memory.
-    Spilling can be done manually by calling `.spill(target="cpu")` but
-    usually the associated spilling manager triggers spilling based on current
-    device memory usage see `cudf.core.buffer.spill_manager.SpillManager`.
+    This buffer supports spilling the represented data to host memory or
+    to disk. Spilling can be done manually by calling
+    `.spill(target="cpu")` or `.spill(target="disk")` but usually the
+    associated spilling manager triggers spilling based on current device
+    (and host) memory usage see `cudf.core.buffer.spill_manager.SpillManager`.
     Unspill is triggered automatically when accessing the data of the buffer.
 
     The buffer might not be spillable, which is based on the "expose" status of
@@ -89,6 +135,7 @@ class SpillableBufferOwner(BufferOwner):
     lock: RLock
     _spill_locks: weakref.WeakSet
     _last_accessed: float
+    _access_count: int
     _ptr_desc: dict[str, Any]
     _manager: SpillManager
 
@@ -109,6 +156,7 @@ class SpillableBufferOwner(BufferOwner):
         self.lock = RLock()
         self._spill_locks = weakref.WeakSet()
         self._last_accessed = time.monotonic()
+        self._access_count = 0
         self._ptr_desc = ptr_desc
         manager = get_global_manager()
         if manager is None:
@@ -180,13 +228,18 @@ class SpillableBufferOwner(BufferOwner):
     def is_spilled(self) -> bool:
         return self._ptr_desc["type"] != "gpu"
 
+    @property
+    def location(self) -> str:
+        """Where the data currently is: "gpu", "cpu" or "disk"."""
+        return self._ptr_desc["type"]
+
     def spill(self, target: str = "cpu") -> None:
         """Spill or un-spill this buffer in-place
 
         Parameters
         ----------
         target : str
-            The target of the spilling.
+            The target of the spilling: "gpu", "cpu" or "disk".
         """
 
         time_start = time.perf_counter()
@@ -207,13 +260,13 @@ class SpillableBufferOwner(BufferOwner):
                     domain="cudf_python-spill",
                 ):
                     host_mem = host_memory_allocation(self.size)
-                    rmm._lib.device_buffer.copy_ptr_to_host(
+                    self._manager.device_backend.copy_to_host(
                         self._ptr, host_mem
                     )
-                self._ptr_desc["memoryview"] = host_mem
+                    self._store_host(host_mem)
                 self._ptr = 0
                 self._owner = None
-            elif (ptr_type, target) == ("cpu", "gpu"):
+            elif ptr_type in ("cpu", "disk") and target == "gpu":
                 # Notice, this operation is prone to deadlock because the RMM
                 # allocation might trigger spilling-on-demand which in turn
                 # trigger a new call to this buffer's `spill()`.
@@ -224,16 +277,65 @@ class SpillableBufferOwner(BufferOwner):
                     color=_get_color_for_nvtx("SpillHtoD"),
                     domain="cudf_python-spill",
                 ):
-                    dev_mem = rmm.DeviceBuffer.to_device(
-                        self._ptr_desc.pop("memoryview")
+                    dev_mem = self._manager.device_backend.to_device(
+                        self._load_host()
                     )
+                self._ptr_desc.pop("memoryview", None)
+                self._ptr_desc.pop("compressed", None)
+                self._ptr_desc.pop("codec", None)
+                if (f := self._ptr_desc.pop("file", None)) is not None:
+                    f.close()
                 self._ptr = dev_mem.ptr
                 self._owner = dev_mem
                 assert self._size == dev_mem.size
+            elif ptr_type in ("gpu", "cpu") and target == "disk":
+                with nvtx.annotate(
+                    message="SpillToDisk",
+                    color=_get_color_for_nvtx("SpillToDisk"),
+                    domain="cudf_python-spill",
+                ):
+                    if ptr_type == "gpu":
+                        host_mem = host_memory_allocation(self.size)
+                        self._manager.device_backend.copy_to_host(
+                            self._ptr, host_mem
+                        )
+                        self._store_host(host_mem)
+                        del host_mem
+                    elif "file" not in self._ptr_desc:
+                        if "compressed" not in self._ptr_desc:
+                            self._store_host(self._ptr_desc.pop("memoryview"))
+                    # A file is kept while the data is mapped back to host
+                    # memory. Since spilled data is never modified, it can
+                    # be reused as is.
+                    if "file" not in self._ptr_desc:
+                        self._ptr_desc["file"] = _write_to_disk(
+                            self._ptr_desc.get("compressed")
+                            or self._ptr_desc["memoryview"],
+                            self._manager.spill_directory,
+                        )
+                    self._ptr_desc.pop("memoryview", None)
+                    self._ptr_desc.pop("compressed", None)
+                self._ptr = 0
+                self._owner = None
+            elif (ptr_type, target) == ("disk", "cpu"):
+                with nvtx.annotate(
+                    message="UnspillFromDisk",
+                    color=_get_color_for_nvtx("UnspillFromDisk"),
+                    domain="cudf_python-spill",
+                ):
+                    f = self._ptr_desc["file"]
+                    if "codec" in self._ptr_desc:
+                        # Keep the data compressed in host memory
+                        f.seek(0)
+                        self._ptr_desc["compressed"] = f.read()
+                    else:
+                        self._ptr_desc["memoryview"] = _map_from_disk(
+                            f, self.size
+                        )
             else:
-                # TODO: support moving to disk
                 raise ValueError(f"Unknown target: {target}")
             self._ptr_desc["type"] = target
+            self._manager.log_spill(self, src=ptr_type, dst=target)
 
         time_end = time.perf_counter()
         self._manager.statistics.log_spill(
@@ -243,6 +345,48 @@ class SpillableBufferOwner(BufferOwner):
             time=time_end - time_start,
         )
 
+    def _store_host(self, host_mem: memoryview) -> None:
+        """Store spilled data in host memory, compressed if worthwhile"""
+        compressed = self._manager.compress(host_mem)
+        if compressed is None:
+            self._ptr_desc["memoryview"] = host_mem
+        else:
+            self._ptr_desc["codec"], self._ptr_desc["compressed"] = compressed
+
+    def _load_host(self) -> memoryview:
+        """Get the uncompressed spilled data, in host memory or on disk"""
+        if "memoryview" in self._ptr_desc:
+            return self._ptr_desc["memoryview"]
+        codec = self._ptr_desc.get("codec")
+        if "compressed" in self._ptr_desc:
+            return self._manager.decompress(
+                codec, self._ptr_desc["compressed"], self.size
+            )
+        f = self._ptr_desc["file"]
+        if codec is None:
+            return _map_from_disk(f, self.size)
+        f.seek(0)
+        return self._manager.decompress(codec, f.read(), self.size)
+
+    def _decompress_host(self) -> None:
+        """Make the data spilled to host memory accessible uncompressed"""
+        with self.lock:
+            if "compressed" in self._ptr_desc:
+                self._ptr_desc["memoryview"] = self._load_host()
+                del self._ptr_desc["compressed"]
+                if "file" not in self._ptr_desc:
+                    del self._ptr_desc["codec"]
+                self._manager.log_spill(self, src="cpu", dst="cpu")
+
+    @property
+    def location_nbytes(self) -> int:
+        """Number of bytes the data occupies in host memory if spilled
+        there, possibly compressed, else the size of the buffer
+        """
+        if "compressed" in self._ptr_desc:
+            return len(self._ptr_desc["compressed"])
+        return self.size
+
     def mark_exposed(self) -> None:
         """Mark the buffer as "exposed" and make it unspillable permanently.
 
@@ -255,7 +399,7 @@ class SpillableBufferOwner(BufferOwner):
                 self._manager.statistics.log_expose(self)
             self.spill(target="gpu")
             super().mark_exposed()
-            self._last_accessed = time.monotonic()
+            self._update_last_accessed()
 
     def spill_lock(self, spill_lock: SpillLock) -> None:
         """Spill lock the buffer
@@ -295,7 +439,7 @@ class SpillableBufferOwner(BufferOwner):
             self.mark_exposed()
         else:
             self.spill_lock(spill_lock)
-            self._last_accessed = time.monotonic()
+            self._update_last_accessed()
         return self._ptr
 
     def memory_info(self) -> tuple[int, int, str]:
@@ -305,6 +449,9 @@ class SpillableBufferOwner(BufferOwner):
         spill lock the buffer manually. This method neither exposes
         nor spill locks the buffer.
 
+        Data spilled to disk is mapped back to host memory and compressed
+        data is decompressed.
+
         Return
         ------
         int
@@ -315,6 +462,11 @@ class SpillableBufferOwner(BufferOwner):
             The device type as a string ("cpu" or "gpu")
         """
 
+        if self._ptr_desc["type"] == "disk":
+            # Map the data back to host memory to get a pointer
+            self.spill(target="cpu")
+        if self._ptr_desc["type"] == "cpu":
+            self._decompress_host()
         if self._ptr_desc["type"] == "gpu":
             ptr = self._ptr
         elif self._ptr_desc["type"] == "cpu":
@@ -331,6 +483,15 @@ class SpillableBufferOwner(BufferOwner):
     def last_accessed(self) -> float:
         return self._last_accessed
 
+    @property
+    def access_count(self) -> int:
+        return self._access_count
+
+    def _update_last_accessed(self) -> None:
+        self._last_accessed = time.monotonic()
+        self._access_count += 1
+        self._manager.log_access(self)
+
     @property
     def __cuda_array_interface__(self) -> dict:
         return {
@@ -348,11 +509,12 @@ class SpillableBufferOwner(BufferOwner):
         with self.lock:
             if self.spillable:
                 self.spill(target="cpu")
+                self._decompress_host()
                 return self._ptr_desc["memoryview"][offset : offset + size]
             else:
                 assert self._ptr_desc["type"] == "gpu"
                 ret = host_memory_allocation(size)
-                rmm._lib.device_buffer.copy_ptr_to_host(
+                self._manager.device_backend.copy_to_host(
                     self._ptr + offset, ret
                 )
                 return ret
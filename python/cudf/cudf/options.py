@@ -188,6 +188,18 @@ def _integer_and_none_validator(val):
         )
 
 
+def _string_validator(val):
+    if not isinstance(val, str):
+        raise ValueError(f"{val} is not a valid option. Must be a string.")
+
+
+def _string_and_none_validator(val):
+    if val is not None and not isinstance(val, str):
+        raise ValueError(
+            f"{val} is not a valid option. Must be a string or None."
+        )
+
+
 _register_option(
     "default_integer_bitwidth",
     None,
@@ -278,6 +290,100 @@ _register_option(
     _integer_and_none_validator,
 )
 
+_register_option(
+    "spill_watermark",
+    _env_get_int("CUDF_SPILL_WATERMARK", None),
+    textwrap.dedent(
+        """
+        Spill in a background thread whenever the device memory used by
+        spillable buffers exceeds this number of bytes.
+        This has no effect if spilling is disabled, see the "spill" option.
+        \tValid values are any positive integer or None (disabled).
+        \tDefault is None.
+        """
+    ),
+    _integer_and_none_validator,
+)
+
+_register_option(
+    "spill_host_limit",
+    _env_get_int("CUDF_SPILL_HOST_LIMIT", None),
+    textwrap.dedent(
+        """
+        Enforce a limit in bytes on the host memory used by spilled
+        buffers, spilling the least recently accessed of them to disk.
+        This has no effect if spilling is disabled, see the "spill" option.
+        \tValid values are any positive integer or None (disabled).
+        \tDefault is None.
+        """
+    ),
+    _integer_and_none_validator,
+)
+
+_register_option(
+    "spill_directory",
+    os.environ.get("CUDF_SPILL_DIRECTORY"),
+    textwrap.dedent(
+        """
+        The directory of the files buffers are spilled to, see the
+        "spill_host_limit" option.
+        \tValid values are a path or None (the default temporary directory).
+        \tDefault is None.
+        """
+    ),
+    _string_and_none_validator,
+)
+
+_register_option(
+    "spill_compression",
+    os.environ.get("CUDF_SPILL_COMPRESSION"),
+    textwrap.dedent(
+        """
+        Compress the data of spilled buffers in host memory and on disk
+        with the specified codec.
+        This has no effect if spilling is disabled, see the "spill" option.
+        \tValid values are None (disabled), "zlib", "lz4" (requires lz4)
+        \tor "zstd" (requires zstandard).
+        \tDefault is None.
+        """
+    ),
+    _make_contains_validator([None, "zlib", "lz4", "zstd"]),
+)
+
+_register_option(
+    "spill_compression_threshold",
+    _env_get_int("CUDF_SPILL_COMPRESSION_THRESHOLD", 2**16),
+    textwrap.dedent(
+        """
+        The minimum size in bytes of the spilled buffers compressed, see
+        the "spill_compression" option.
+        \tValid values are any positive integer.
+        \tDefault is 65536.
+        """
+    ),
+    _integer_validator,
+)
+
+_register_option(
+    "spill_policy",
+    os.environ.get("CUDF_SPILL_POLICY", "lru"),
+    textwrap.dedent(
+        """
+        The policy choosing the buffers to spill first:
+            "lru"               - least recently accessed first.
+            "size_weighted_lru" - largest size times idle time first.
+            "lfu"               - least frequently accessed first.
+            "cost_aware"        - lowest expected transfer time per byte
+                                  first.
+        Other policies can be registered with
+        `cudf.core.buffer.spill_policy.register_spill_policy`.
+        This has no effect if spilling is disabled, see the "spill" option.
+        \tDefault is "lru".
+        """
+    ),
+    _string_validator,
+)
+
 _register_option(
     "spill_stats",
     _env_get_int("CUDF_SPILL_STATS", 0),
@@ -296,6 +402,48 @@ _register_option(
     _integer_validator,
 )
 
+_register_option(
+    "io_cache_size",
+    _env_get_int("CUDF_IO_CACHE_SIZE", None),
+    textwrap.dedent(
+        """
+        Cache the byte ranges read from remote filesystems in host memory,
+        up to this number of bytes, see `cudf.utils.io_cache`.
+        \tValid values are any positive integer or None (disabled).
+        \tDefault is None.
+        """
+    ),
+    _integer_and_none_validator,
+)
+
+_register_option(
+    "io_cache_directory",
+    os.environ.get("CUDF_IO_CACHE_DIRECTORY"),
+    textwrap.dedent(
+        """
+        The directory the byte ranges evicted from the host memory of the
+        cache are written to, see the "io_cache_size" option.
+        \tValid values are a path or None (evicted ranges are discarded).
+        \tDefault is None.
+        """
+    ),
+    _string_and_none_validator,
+)
+
+_register_option(
+    "io_cache_disk_size",
+    _env_get_int("CUDF_IO_CACHE_DISK_SIZE", None),
+    textwrap.dedent(
+        """
+        The maximum number of bytes of the byte ranges in the directory of
+        the "io_cache_directory" option.
+        \tValid values are any positive integer or None (no limit).
+        \tDefault is None.
+        """
+    ),
+    _integer_and_none_validator,
+)
+
 _register_option(
     "mode.pandas_compatible",
     False,
@@ -1,14 +1,21 @@
 # SPDX-FileCopyrightText: Copyright (c) 2023-2024, NVIDIA CORPORATION & AFFILIATES.
 # All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
+from __future__ import annotations
+
 import abc
 import copyreg
+import functools
 import importlib
 import os
 import pickle
 import sys
+import threading
+import weakref
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 from pandas.tseries.holiday import (
     AbstractHolidayCalendar as pd_AbstractHolidayCalendar,
     EasterMonday as pd_EasterMonday,
@@ -27,6 +34,7 @@ from pandas.tseries.holiday import (
 
 import cudf
 
+from .. import fast_slow_proxy as _fast_slow_proxy
 from ..annotation import nvtx
 from ..fast_slow_proxy import (
     _CUDF_PANDAS_NVTX_COLORS,
@@ -195,6 +203,142 @@ _CategoricalAccessor = make_intermediate_proxy_type(
 )
 
 
+class _StringColumns:
+    """
+    Side table of the positions of the object columns of pandas
+    DataFrames (or Series) that are known to hold only `str` values.
+
+    Entries are added when inferring the column types while
+    converting to cuDF, and when converting cuDF string columns
+    without nulls to pandas. An entry is only valid while the mutation
+    epoch of cudf.pandas (bumped by every in-place modification made
+    through a proxy) is unchanged since it was added.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # pandas objects aren't hashable, so key them by id, mapping
+        # to (weakref to the object, mutation epoch, positions).
+        self._entries: dict[int, tuple[weakref.ref, int, frozenset]] = {}
+
+    def get(self, obj) -> frozenset | None:
+        entry = self._entries.get(id(obj))
+        if (
+            entry is not None
+            and entry[0]() is obj
+            and entry[1] == _fast_slow_proxy._mutation_epoch
+        ):
+            return entry[2]
+        return None
+
+    def set(self, obj, positions: frozenset) -> None:
+        key = id(obj)
+        try:
+            ref = weakref.ref(obj, functools.partial(self._forget, key))
+        except TypeError:
+            return
+        with self._lock:
+            self._entries[key] = (
+                ref,
+                _fast_slow_proxy._mutation_epoch,
+                positions,
+            )
+
+    def _forget(self, key: int, ref: weakref.ref) -> None:
+        with self._lock:
+            if (entry := self._entries.get(key)) is not None and (
+                entry[0] is ref
+            ):
+                del self._entries[key]
+
+
+_STRING_COLUMNS = _StringColumns()
+
+
+def _string_columns(slow) -> frozenset:
+    """
+    Return the positions of the object columns of the pandas
+    DataFrame or Series `slow` that hold only `str` values (no nulls).
+    """
+    positions = _STRING_COLUMNS.get(slow)
+    if positions is None:
+        if isinstance(slow, pd.DataFrame):
+            # Only build the object columns, selecting them by dtype
+            candidates = np.flatnonzero((slow.dtypes == object).to_numpy())
+            columns = ((i, slow.iloc[:, i]) for i in candidates)
+        else:
+            columns = ((0, slow),) if slow.dtype == object else ()
+        positions = frozenset(
+            int(i)
+            for i, column in columns
+            if pd.api.types.infer_dtype(column.to_numpy(), skipna=False)
+            == "string"
+        )
+        _STRING_COLUMNS.set(slow, positions)
+    return positions
+
+
+def _from_pandas(slow):
+    """
+    Convert the pandas DataFrame or Series `slow` to cuDF like
+    `cudf.from_pandas`, building the object columns that hold only
+    strings directly as Arrow string arrays (in a single pass and
+    without inferring their types again).
+    """
+    if type(slow) not in (pd.DataFrame, pd.Series):
+        return cudf.from_pandas(slow)
+    positions = _string_columns(slow)
+    if not positions:
+        return cudf.from_pandas(slow)
+    # Convert the remaining columns (and the index) as usual, with
+    # cheap placeholders for the string columns
+    placeholder = np.zeros(len(slow), dtype=np.int8)
+    if isinstance(slow, pd.DataFrame):
+        others = slow.copy(deep=False)
+        for i in positions:
+            others.isetitem(i, placeholder)
+    else:
+        others = pd.Series(
+            placeholder, index=slow.index, name=slow.name, copy=False
+        )
+    fast = cudf.from_pandas(others)
+    names = fast._data.names
+    for i in positions:
+        values = (
+            slow.iloc[:, i] if isinstance(slow, pd.DataFrame) else slow
+        ).to_numpy()
+        fast._data[names[i]] = cudf.core.column.as_column(
+            pa.array(values, type=pa.string())
+        )
+    return fast
+
+
+def _to_pandas(fast):
+    """
+    Convert the cuDF object `fast` to pandas, recording which columns
+    of the result are known to hold only strings.
+    """
+    slow = fast.to_pandas()
+    if type(slow) in (pd.DataFrame, pd.Series):
+        dtypes = (
+            slow.dtypes if isinstance(slow, pd.DataFrame) else [slow.dtype]
+        )
+        _STRING_COLUMNS.set(
+            slow,
+            frozenset(
+                i
+                for i, (column, dtype) in enumerate(
+                    zip(fast._data.columns, dtypes)
+                )
+                if column.dtype == np.dtype("object")
+                and dtype == np.dtype("object")
+                and column.null_count == 0
+                and len(column) > 0
+            ),
+        )
+    return slow
+
+
 def _DataFrame__dir__(self):
     # Column names that are string identifiers are added to the dir of the
     # DataFrame
@@ -211,8 +355,8 @@ DataFrame = make_final_proxy_type(
     "DataFrame",
     cudf.DataFrame,
     pd.DataFrame,
-    fast_to_slow=lambda fast: fast.to_pandas(),
-    slow_to_fast=cudf.from_pandas,
+    fast_to_slow=_to_pandas,
+    slow_to_fast=_from_pandas,
     additional_attributes={
         "__array__": array_method,
         "__dir__": _DataFrame__dir__,
@@ -227,8 +371,8 @@ Series = make_final_proxy_type(
     "Series",
     cudf.Series,
     pd.Series,
-    fast_to_slow=lambda fast: fast.to_pandas(),
-    slow_to_fast=cudf.from_pandas,
+    fast_to_slow=_to_pandas,
+    slow_to_fast=_from_pandas,
     additional_attributes={
         "__array__": array_method,
         "__array_function__": array_function_method,
@@ -0,0 +1,270 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Lightweight, always-on counters of the pandas functions called through
+cudf.pandas and of whether they ran on the GPU or fell back to the CPU.
+
+Unlike the `Profiler`, these counters don't require wrapping code in a
+context manager and are cheap enough to leave enabled in long-running
+processes. They are enabled by setting the environment variable
+``CUDF_PANDAS_CALL_STATS`` or by calling `enable`.
+
+Every call is counted, but only a fraction ``sample_rate`` of the calls
+is timed. The bytes moved by conversions between cuDF and pandas
+objects are attributed to the (possibly nested) calls during which
+they happened.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import random
+import threading
+import time
+from typing import IO, Any
+
+from ..options import _env_get_bool, _env_get_int
+
+__all__ = [
+    "disable",
+    "dump",
+    "enable",
+    "reset",
+    "snapshot",
+    "start_export",
+    "stop_export",
+]
+
+_FIELDS = (
+    "fast_calls",
+    "slow_calls",
+    "fast_time",
+    "slow_time",
+    "timed_fast_calls",
+    "timed_slow_calls",
+    "conversion_bytes",
+)
+
+
+class _ConversionTally(threading.local):
+    # Bytes converted between fast and slow objects by this thread
+    nbytes = 0
+
+
+class _CallStats:
+    """
+    Registry of per-function call counters.
+
+    Parameters
+    ----------
+    enabled : bool
+        Whether calls are recorded.
+    sample_rate : float
+        The fraction of calls that are timed.
+    """
+
+    def __init__(self, enabled: bool, sample_rate: float):
+        self.enabled = enabled
+        self.sample_rate = sample_rate
+        self._lock = threading.Lock()
+        # Map function name to a list of counters, ordered as _FIELDS
+        self._stats: dict[str, list] = {}
+        self._tally = _ConversionTally()
+
+    def record_conversion(
+        self, proxy_type: type, direction: str, nbytes: int, seconds: float
+    ) -> None:
+        self._tally.nbytes += nbytes
+
+    def start(self, name: str) -> tuple[str, float | None, int]:
+        """
+        Mark the start of a call to `name`, returning a token to pass
+        to `finish`.
+        """
+        start = None
+        if self.sample_rate >= 1 or random.random() < self.sample_rate:
+            start = time.perf_counter()
+        return name, start, self._tally.nbytes
+
+    def finish(self, token: tuple[str, float | None, int], fast: bool):
+        """Mark the end of the call started with `token`."""
+        name, start, nbytes = token
+        elapsed = None if start is None else time.perf_counter() - start
+        nbytes = self._tally.nbytes - nbytes
+        with self._lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = [0, 0, 0.0, 0.0, 0, 0, 0]
+            stats[0 if fast else 1] += 1
+            if elapsed is not None:
+                stats[2 if fast else 3] += elapsed
+                stats[4 if fast else 5] += 1
+            stats[6] += nbytes
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            return {
+                name: dict(zip(_FIELDS, stats))
+                for name, stats in self._stats.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+def _env_get_sample_rate() -> float:
+    try:
+        rate = float(os.getenv("CUDF_PANDAS_CALL_STATS_SAMPLE_RATE", 1.0))
+    except ValueError:
+        return 1.0
+    return min(max(rate, 0.0), 1.0)
+
+
+_CALL_STATS = _CallStats(
+    enabled=_env_get_bool("CUDF_PANDAS_CALL_STATS", False),
+    sample_rate=_env_get_sample_rate(),
+)
+
+
+def enable(sample_rate: float | None = None) -> None:
+    """
+    Start recording calls.
+
+    Parameters
+    ----------
+    sample_rate : float, optional
+        The fraction of calls (between 0 and 1) that are timed. All
+        calls are counted regardless. If not given, the current rate
+        is kept (1 by default, or the value of the environment
+        variable ``CUDF_PANDAS_CALL_STATS_SAMPLE_RATE``).
+    """
+    if sample_rate is not None:
+        if not 0 <= sample_rate <= 1:
+            raise ValueError("sample_rate must be between 0 and 1")
+        _CALL_STATS.sample_rate = sample_rate
+    _CALL_STATS.enabled = True
+
+
+def disable() -> None:
+    """Stop recording calls, keeping the counters recorded so far."""
+    _CALL_STATS.enabled = False
+
+
+def reset() -> None:
+    """Clear all recorded counters."""
+    _CALL_STATS.reset()
+
+
+def snapshot() -> dict[str, dict[str, Any]]:
+    """
+    Return a copy of the recorded counters.
+
+    Returns
+    -------
+    dict
+        Mapping of function name (as reported by the `Profiler`) to a
+        dict with the keys:
+
+        - ``fast_calls``/``slow_calls``: the number of calls that ran
+          on the GPU (cuDF)/on the CPU (pandas).
+        - ``fast_time``/``slow_time``: the total time in seconds of
+          the timed calls.
+        - ``timed_fast_calls``/``timed_slow_calls``: the number of
+          timed calls, equal to the number of calls if the sample rate
+          is 1.
+        - ``conversion_bytes``: the number of bytes converted between
+          cuDF and pandas objects during the calls.
+    """
+    return _CALL_STATS.snapshot()
+
+
+def dump(file: str | os.PathLike | IO[str]) -> None:
+    """
+    Append the recorded counters to `file` as JSON lines.
+
+    Each line is a JSON object with the keys ``timestamp`` (seconds
+    since the epoch), ``pid``, ``function`` and the counters described
+    in `snapshot`.
+
+    Parameters
+    ----------
+    file : str, PathLike or file-like
+        Path to a file to append to, or a file opened for writing text.
+    """
+    timestamp = time.time()
+    pid = os.getpid()
+    lines = "".join(
+        json.dumps(
+            {"timestamp": timestamp, "pid": pid, "function": name, **stats}
+        )
+        + "\n"
+        for name, stats in snapshot().items()
+    )
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, "a") as f:
+            f.write(lines)
+    else:
+        file.write(lines)
+        file.flush()
+
+
+class _Exporter(threading.Thread):
+    """Daemon thread dumping the counters to a file periodically."""
+
+    def __init__(self, path: str | os.PathLike, interval: float):
+        super().__init__(name="cudf.pandas-call-stats", daemon=True)
+        self.path = path
+        self.interval = interval
+        self._stopped = threading.Event()
+
+    def run(self):
+        while not self._stopped.wait(self.interval):
+            dump(self.path)
+
+    def stop(self):
+        self._stopped.set()
+        self.join()
+        # Always export the final state
+        dump(self.path)
+
+
+_exporter: _Exporter | None = None
+_exporter_lock = threading.Lock()
+
+
+def start_export(path: str | os.PathLike, interval: float = 60) -> None:
+    """
+    Append the recorded counters to the file `path` every `interval`
+    seconds, and once more at interpreter exit, see `dump`.
+
+    Replaces any export previously started. Also enables recording.
+    """
+    global _exporter
+    if interval <= 0:
+        raise ValueError("interval must be positive")
+    with _exporter_lock:
+        if _exporter is not None:
+            _exporter.stop()
+        _exporter = _Exporter(path, interval)
+        _exporter.start()
+    enable()
+
+
+def stop_export() -> None:
+    """Stop a periodic export started by `start_export`."""
+    global _exporter
+    with _exporter_lock:
+        if _exporter is not None:
+            _exporter.stop()
+            _exporter = None
+
+
+atexit.register(stop_export)
+
+if (_path := os.getenv("CUDF_PANDAS_CALL_STATS_FILE")) is not None:
+    _interval = _env_get_int("CUDF_PANDAS_CALL_STATS_INTERVAL", 60)
+    start_export(_path, _interval if _interval > 0 else 60)
@@ -0,0 +1,296 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Verification of cuDF results against pandas in debugging mode.
+
+With the environment variable ``CUDF_PANDAS_DEBUGGING`` set, every call
+that runs on the GPU is also run with pandas and the results compared.
+The following environment variables make that cheap enough to leave
+enabled under realistic load:
+
+- ``CUDF_PANDAS_DEBUGGING_SAMPLE_RATE``: the fraction of calls that
+  are verified (default 1).
+- ``CUDF_PANDAS_DEBUGGING_BUDGET``: the maximum number of calls
+  verified per function (default 0, meaning no limit).
+- ``CUDF_PANDAS_DEBUGGING_ASYNC``: convert the arguments to pandas, run
+  pandas and compare the results on a background thread rather than in
+  the calling thread. Verifications of objects modified in the meantime
+  are dropped. Calls modifying objects in place are still verified in
+  the calling thread.
+- ``CUDF_PANDAS_DEBUGGING_REPORT``: a file the report of mismatches is
+  written to, as JSON, at interpreter exit.
+
+Mismatches are aggregated per function into a report, see `snapshot`.
+In synchronous mode, they are also reported as warnings.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import queue
+import random
+import threading
+import warnings
+from typing import IO, Any, Callable
+
+from ..options import _env_get_bool, _env_get_int
+
+__all__ = ["dump", "flush", "reset", "snapshot"]
+
+# A verification: called with no arguments, it runs the call with
+# pandas and returns None if the results match, else the kind of
+# mismatch and a message describing it. It raises `_StaleVerification`
+# if the objects of the call were modified before it ran.
+_Check = Callable[[], "tuple[str, str] | None"]
+
+
+class _StaleVerification(Exception):
+    pass
+
+
+class _DebuggingReport:
+    """
+    Aggregate of the results of verifications.
+
+    Mismatches are grouped by function and kind (``"mismatch"``,
+    ``"pandas_error"`` or ``"failed"``), keeping the details of the
+    first one only.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._verified: dict[str, int] = {}
+        self._mismatches: dict[tuple[str, str], dict[str, Any]] = {}
+        self.dropped = 0
+
+    def reserve_verification(self, name: str, budget: int) -> bool:
+        """
+        Count a verification of `name`, unless `budget` (0 for no
+        limit) verifications of it were already counted.
+        """
+        with self._lock:
+            verified = self._verified.get(name, 0)
+            if 0 < budget <= verified:
+                return False
+            self._verified[name] = verified + 1
+            return True
+
+    def record_dropped(self) -> None:
+        with self._lock:
+            self.dropped += 1
+
+    def record_mismatch(
+        self, name: str, kind: str, arg_shapes: list, message: str
+    ) -> None:
+        with self._lock:
+            entry = self._mismatches.get((name, kind))
+            if entry is None:
+                self._mismatches[(name, kind)] = {
+                    "function": name,
+                    "kind": kind,
+                    "count": 1,
+                    "arg_shapes": arg_shapes,
+                    "first_diff": message,
+                }
+            else:
+                entry["count"] += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "verified": dict(self._verified),
+                "dropped": self.dropped,
+                "mismatches": [
+                    dict(entry) for entry in self._mismatches.values()
+                ],
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._verified.clear()
+            self._mismatches.clear()
+            self.dropped = 0
+
+
+class _Verifier:
+    """
+    Decide which calls are verified, and run the verifications.
+
+    Parameters
+    ----------
+    sample_rate : float
+        The fraction of calls that are verified.
+    budget : int
+        The maximum number of calls verified per function, 0 for no
+        limit.
+    asynchronous : bool
+        Whether to verify on a background thread.
+    max_pending : int
+        The maximum number of verifications waiting for the background
+        thread. Further verifications are dropped (and counted).
+    """
+
+    def __init__(
+        self,
+        sample_rate: float,
+        budget: int,
+        asynchronous: bool,
+        max_pending: int = 128,
+    ):
+        self.sample_rate = sample_rate
+        self.budget = budget
+        self.asynchronous = asynchronous
+        self.report = _DebuggingReport()
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._worker: threading.Thread | None = None
+        self._worker_lock = threading.Lock()
+
+    def should_verify(self, name: str) -> bool:
+        """
+        Whether a call to the function `name` should be verified. If so,
+        it's counted against the budget, so it must then be verified.
+        """
+        if self.sample_rate < 1 and random.random() >= self.sample_rate:
+            return False
+        return self.report.reserve_verification(name, self.budget)
+
+    def verify(
+        self,
+        name: str,
+        arg_shapes: list,
+        check: _Check,
+        synchronous: bool = False,
+    ) -> None:
+        """
+        Run (or, in asynchronous mode, schedule) the verification
+        `check` of a call to the function `name`. With `synchronous`,
+        it's run in the calling thread even in asynchronous mode.
+        """
+        if synchronous or not self.asynchronous:
+            self._run(name, arg_shapes, check, warn=True)
+            return
+        self._start_worker()
+        try:
+            self._queue.put_nowait((name, arg_shapes, check))
+        except queue.Full:
+            self.report.record_dropped()
+
+    def _run(
+        self, name: str, arg_shapes: list, check: _Check, warn: bool
+    ) -> None:
+        outcome = check()
+        if outcome is not None:
+            kind, message = outcome
+            self.report.record_mismatch(name, kind, arg_shapes, message)
+            if warn:
+                warnings.warn(message)
+
+    def _start_worker(self) -> None:
+        if self._worker is not None:
+            return
+        with self._worker_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._work,
+                    name="cudf.pandas-debugging",
+                    daemon=True,
+                )
+                self._worker.start()
+
+    def _work(self) -> None:
+        while True:
+            name, arg_shapes, check = self._queue.get()
+            try:
+                self._run(name, arg_shapes, check, warn=False)
+            except _StaleVerification:
+                self.report.record_dropped()
+            except Exception as e:
+                self.report.record_mismatch(
+                    name,
+                    "failed",
+                    arg_shapes,
+                    f"Pandas debugging mode failed. The exception was {e}.",
+                )
+            finally:
+                self._queue.task_done()
+
+    def flush(self) -> None:
+        """Wait for all pending verifications to finish."""
+        if self._worker is not None:
+            self._queue.join()
+
+
+def _env_get_sample_rate() -> float:
+    try:
+        rate = float(os.getenv("CUDF_PANDAS_DEBUGGING_SAMPLE_RATE", 1.0))
+    except ValueError:
+        return 1.0
+    return min(max(rate, 0.0), 1.0)
+
+
+_VERIFIER = _Verifier(
+    sample_rate=_env_get_sample_rate(),
+    budget=_env_get_int("CUDF_PANDAS_DEBUGGING_BUDGET", 0),
+    asynchronous=_env_get_bool("CUDF_PANDAS_DEBUGGING_ASYNC", False),
+)
+
+
+def flush() -> None:
+    """Wait for the verifications running in the background to finish."""
+    _VERIFIER.flush()
+
+
+def reset() -> None:
+    """Clear the report."""
+    _VERIFIER.report.reset()
+
+
+def snapshot() -> dict[str, Any]:
+    """
+    Return a copy of the report of the verifications so far.
+
+    Returns
+    -------
+    dict
+        A dict with the keys:
+
+        - ``verified``: mapping of function name (as reported by the
+          `Profiler`) to the number of calls verified.
+        - ``dropped``: the number of verifications dropped because too
+          many were waiting for the background thread, or because their
+          objects were modified before the background thread got to
+          them.
+        - ``mismatches``: a list of dicts, one per function and kind
+          of mismatch, with the keys ``function``, ``kind`` (one of
+          ``"mismatch"``, ``"pandas_error"`` or ``"failed"``),
+          ``count``, ``arg_shapes`` (the shapes, or type names, of the
+          arguments of the first mismatching call) and ``first_diff``
+          (the message describing the first mismatch).
+    """
+    return _VERIFIER.report.snapshot()
+
+
+def dump(file: str | os.PathLike | IO[str]) -> None:
+    """
+    Write the report, see `snapshot`, to `file` as JSON.
+
+    Parameters
+    ----------
+    file : str, PathLike or file-like
+        Path to a file to write to, or a file opened for writing text.
+    """
+    flush()
+    report = json.dumps(snapshot(), default=str)
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, "w") as f:
+            f.write(report)
+    else:
+        file.write(report)
+        file.flush()
+
+
+if (_path := os.getenv("CUDF_PANDAS_DEBUGGING_REPORT")) is not None:
+    atexit.register(dump, _path)
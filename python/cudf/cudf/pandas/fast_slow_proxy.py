@@ -4,21 +4,33 @@
 
 from __future__ import annotations
 
+import atexit
 import functools
 import inspect
+import itertools
+import json
 import operator
+import os
 import pickle
+import sys
+import tempfile
+import threading
+import time
 import types
-import warnings
+import weakref
+from collections import OrderedDict, namedtuple
 from collections.abc import Iterator
 from enum import IntEnum
 from typing import Any, Callable, Literal, Mapping
 
 import numpy as np
 
-from ..options import _env_get_bool
+from .._version import __git_commit__, __version__
+from ..options import _env_get_bool, _env_get_int
 from ..testing import assert_eq
 from .annotation import nvtx
+from .call_stats import _CALL_STATS
+from .debugging import _VERIFIER, _StaleVerification
 
 
 def call_operator(fn, args, kwargs):
@@ -98,6 +110,35 @@ class _PickleConstructor:
         return object.__new__(self._type)
 
 
+def _dumps_wrapped(obj: Any, protocol: int) -> dict[str, Any]:
+    """
+    Pickle `obj` with the module accelerator disabled, using pickle
+    protocol 5 out-of-band buffers for its data.
+
+    The buffers are returned alongside the pickle rather than copied
+    into it, so that the outer pickler can in turn pass them out of
+    band (or write them in band, exactly once).
+    """
+    # Need a local import to avoid circular import issues
+    from .module_accelerator import disable_module_accelerator
+
+    buffers: list[pickle.PickleBuffer] = []
+    with disable_module_accelerator():
+        data = pickle.dumps(
+            obj, protocol=protocol, buffer_callback=buffers.append
+        )
+    return {"data": data, "buffers": buffers}
+
+
+def _loads_wrapped(state: dict[str, Any]) -> Any:
+    """Unpickle an object pickled with `_dumps_wrapped`."""
+    # Need a local import to avoid circular import issues
+    from .module_accelerator import disable_module_accelerator
+
+    with disable_module_accelerator():
+        return pickle.loads(state["data"], buffers=state["buffers"])
+
+
 _DELETE = object()
 
 
@@ -172,7 +213,11 @@ def make_final_proxy_type(
         # if we are wrapping a slow object,
         # convert it to a fast one
         if self._fsproxy_state is _State.SLOW:
-            return slow_to_fast(self._fsproxy_wrapped)
+            return _convert(
+                self,
+                lambda: slow_to_fast(self._fsproxy_wrapped),
+                "slow_to_fast",
+            )
         return self._fsproxy_wrapped
 
     @nvtx.annotate(
@@ -184,7 +229,11 @@ def make_final_proxy_type(
         # if we are wrapping a fast object,
         # convert it to a slow one
         if self._fsproxy_state is _State.FAST:
-            return fast_to_slow(self._fsproxy_wrapped)
+            return _convert(
+                self,
+                lambda: fast_to_slow(self._fsproxy_wrapped),
+                "fast_to_slow",
+            )
         return self._fsproxy_wrapped
 
     @property  # type: ignore
@@ -195,10 +244,10 @@ def make_final_proxy_type(
             else _State.SLOW
         )
 
-    slow_dir = dir(slow_type)
+    slow_dir, slow_doc, special_methods = _PROXY_MANIFEST.describe(slow_type)
     cls_dict = {
         "__init__": __init__,
-        "__doc__": inspect.getdoc(slow_type),
+        "__doc__": slow_doc,
         "_fsproxy_slow_dir": slow_dir,
         "_fsproxy_fast_type": fast_type,
         "_fsproxy_slow_type": slow_type,
@@ -209,16 +258,15 @@ def make_final_proxy_type(
 
     if additional_attributes is None:
         additional_attributes = {}
-    for method in _SPECIAL_METHODS:
-        if getattr(slow_type, method, False):
-            cls_dict[method] = _FastSlowAttribute(method)
+    for method in special_methods:
+        cls_dict[method] = _FastSlowAttribute(method)
     for k, v in additional_attributes.items():
         if v is _DELETE and k in cls_dict:
             del cls_dict[k]
         elif v is not _DELETE:
             cls_dict[k] = v
 
-    for slow_name in dir(slow_type):
+    for slow_name in slow_dir:
         if slow_name in cls_dict or slow_name.startswith("__"):
             continue
         else:
@@ -302,7 +350,11 @@ def make_intermediate_proxy_type(
     )
     def _fsproxy_slow_to_fast(self):
         if self._fsproxy_state is _State.SLOW:
-            return super(type(self), self)._fsproxy_slow_to_fast()
+            return _convert(
+                self,
+                super(type(self), self)._fsproxy_slow_to_fast,
+                "slow_to_fast",
+            )
         return self._fsproxy_wrapped
 
     @nvtx.annotate(
@@ -312,13 +364,17 @@ def make_intermediate_proxy_type(
     )
     def _fsproxy_fast_to_slow(self):
         if self._fsproxy_state is _State.FAST:
-            return super(type(self), self)._fsproxy_fast_to_slow()
+            return _convert(
+                self,
+                super(type(self), self)._fsproxy_fast_to_slow,
+                "fast_to_slow",
+            )
         return self._fsproxy_wrapped
 
-    slow_dir = dir(slow_type)
+    slow_dir, slow_doc, special_methods = _PROXY_MANIFEST.describe(slow_type)
     cls_dict = {
         "__init__": __init__,
-        "__doc__": inspect.getdoc(slow_type),
+        "__doc__": slow_doc,
         "_fsproxy_slow_dir": slow_dir,
         "_fsproxy_fast_type": fast_type,
         "_fsproxy_slow_type": slow_type,
@@ -326,11 +382,10 @@ def make_intermediate_proxy_type(
         "_fsproxy_fast_to_slow": _fsproxy_fast_to_slow,
         "_fsproxy_state": _fsproxy_state,
     }
-    for method in _SPECIAL_METHODS:
-        if getattr(slow_type, method, False):
-            cls_dict[method] = _FastSlowAttribute(method)
+    for method in special_methods:
+        cls_dict[method] = _FastSlowAttribute(method)
 
-    for slow_name in dir(slow_type):
+    for slow_name in slow_dir:
         if slow_name in cls_dict or slow_name.startswith("__"):
             continue
         else:
@@ -391,6 +446,125 @@ def register_proxy_func(slow_func: Callable):
     return wrapper
 
 
+class _ProxyManifest:
+    """
+    Cache of the introspection `make_final_proxy_type` and
+    `make_intermediate_proxy_type` perform on slow types: their
+    `dir()`, docstring and which special methods they define.
+
+    If `directory` is set, the cache is loaded from (and, at exit, saved
+    to) a JSON file in that directory, named after the Python and cuDF
+    versions. Each entry is validated with a cheap fingerprint of the
+    slow type (the version of its package and the size of the
+    namespaces in its mro), so that upgrading the slow library
+    invalidates it.
+
+    Parameters
+    ----------
+    directory : str or None
+        The directory to store the manifest in, or None to disable
+        caching.
+    """
+
+    _FORMAT_VERSION = 1
+
+    def __init__(self, directory: str | None):
+        self.directory = directory
+        self._entries: dict[str, dict] | None = None
+        self._dirty = False
+
+    @property
+    def path(self) -> str:
+        py_version = "".join(map(str, sys.version_info[:2]))
+        commit = __git_commit__[:8] if __git_commit__ else "unknown"
+        return os.path.join(
+            self.directory,  # type: ignore[arg-type]
+            f"cudf-pandas-proxies-py{py_version}-"
+            f"cudf{__version__}-{commit}.json",
+        )
+
+    def _load(self) -> dict[str, dict]:
+        try:
+            with open(self.path) as f:
+                manifest = json.load(f)
+            if manifest["format_version"] == self._FORMAT_VERSION:
+                return manifest["entries"]
+        except Exception:
+            pass
+        return {}
+
+    def save(self) -> None:
+        """Write the manifest if new entries were added to it."""
+        if not self._dirty:
+            return
+        try:
+            os.makedirs(self.directory, exist_ok=True)  # type: ignore
+            # Write to a temporary file and move it in place, so that
+            # concurrent processes never see a partially written file.
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(
+                    {
+                        "format_version": self._FORMAT_VERSION,
+                        "entries": self._entries,
+                    },
+                    f,
+                )
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except OSError:
+            # The cache is best-effort only
+            pass
+
+    @staticmethod
+    def _fingerprint(slow_type: type) -> list:
+        package = sys.modules.get(slow_type.__module__.partition(".")[0])
+        return [
+            getattr(package, "__version__", None),
+            [len(vars(cls)) for cls in slow_type.__mro__],
+        ]
+
+    def describe(self, slow_type: type) -> tuple[list[str], str | None, list]:
+        """
+        Return the `dir()` of `slow_type`, its docstring (as returned
+        by `inspect.getdoc`) and the special methods it defines.
+        """
+        if self.directory is None:
+            return self._introspect(slow_type)
+        if self._entries is None:
+            self._entries = self._load()
+        key = f"{slow_type.__module__}.{slow_type.__qualname__}"
+        fingerprint = self._fingerprint(slow_type)
+        entry = self._entries.get(key)
+        if entry is not None and entry["fingerprint"] == fingerprint:
+            return entry["dir"], entry["doc"], entry["special_methods"]
+        slow_dir, doc, special_methods = self._introspect(slow_type)
+        self._entries[key] = {
+            "fingerprint": fingerprint,
+            "dir": slow_dir,
+            "doc": doc,
+            "special_methods": special_methods,
+        }
+        self._dirty = True
+        return slow_dir, doc, special_methods
+
+    @staticmethod
+    def _introspect(slow_type: type) -> tuple[list[str], str | None, list]:
+        return (
+            dir(slow_type),
+            inspect.getdoc(slow_type),
+            sorted(
+                method
+                for method in _SPECIAL_METHODS
+                if getattr(slow_type, method, False)
+            ),
+        )
+
+
+_PROXY_MANIFEST = _ProxyManifest(os.getenv("CUDF_PANDAS_PROXY_CACHE"))
+atexit.register(_PROXY_MANIFEST.save)
+
+
 @functools.lru_cache(maxsize=None)
 def get_final_type_map():
     """
@@ -414,6 +588,51 @@ def get_registered_functions():
     return dict()
 
 
+# Callables notified of every conversion between fast and slow objects
+# wrapped by proxies, with the proxy type, the direction of the
+# conversion ("slow_to_fast" or "fast_to_slow"), the size of the
+# converted object in bytes, and the time the conversion took.
+_CONVERSION_LISTENERS: list[Callable[[type, str, int, float], None]] = []
+
+
+def _convert(
+    proxy: _FastSlowProxy,
+    convert: Callable[[], Any],
+    direction: Literal["slow_to_fast", "fast_to_slow"],
+) -> Any:
+    """
+    Return the result of `convert()`, the conversion of the object
+    wrapped by `proxy`, notifying any conversion listeners.
+    """
+    if not (_CALL_STATS.enabled or _CONVERSION_LISTENERS):
+        return convert()
+    start = time.perf_counter()
+    result = convert()
+    seconds = time.perf_counter() - start
+    nbytes = _nbytes(result)
+    if _CALL_STATS.enabled:
+        _CALL_STATS.record_conversion(type(proxy), direction, nbytes, seconds)
+    for listener in tuple(_CONVERSION_LISTENERS):
+        listener(type(proxy), direction, nbytes, seconds)
+    return result
+
+
+def _get_namespaced_function_name(func_obj: Any) -> str | None:
+    """
+    Return the name under which calls to `func_obj` are reported,
+    e.g., "DataFrame.groupby", or None for objects that aren't
+    methods, functions or types of proxies.
+    """
+    if isinstance(func_obj, _MethodProxy):
+        return func_obj._fsproxy_slow.__qualname__
+    elif isinstance(func_obj, _FunctionProxy) or (
+        isinstance(func_obj, type)
+        and issubclass(func_obj, (_FinalProxy, _IntermediateProxy))
+    ):
+        return func_obj.__name__
+    return None
+
+
 def _raise_attribute_error(obj, name):
     """
     Raise an AttributeError with a message that is consistent with
@@ -441,6 +660,10 @@ class _FastSlowProxyMeta(type):
     def _fsproxy_fast(self) -> type:
         return self._fsproxy_fast_type
 
+    @property
+    def _fsproxy_detached(self) -> type:
+        return self
+
     def __dir__(self):
         # Try to return the cached dir of the slow object, but if it
         # doesn't exist, fall back to the default implementation.
@@ -514,6 +737,16 @@ class _FastSlowProxy:
         self._fsproxy_wrapped = self._fsproxy_fast_to_slow()
         return self._fsproxy_wrapped
 
+    @property
+    def _fsproxy_detached(self) -> Any:
+        """
+        Returns a new proxy of the same type wrapping the same object,
+        so converting it leaves this proxy as it is.
+        """
+        proxy = object.__new__(type(self))
+        proxy.__dict__.update(self.__dict__)
+        return proxy
+
     def __dir__(self):
         # Try to return the cached dir of the slow object, but if it
         # doesn't exist, fall back to the default implementation.
@@ -542,6 +775,47 @@ class _FinalProxy(_FastSlowProxy):
     `make_final_proxy_type` to create subtypes.
     """
 
+    # The converted counterpart of the wrapped object retained in dual
+    # residency mode, as a tuple (twin, mutation epoch), see `_TWINS`.
+    _fsproxy_twin: tuple[Any, int] | None = None
+
+    @property
+    def _fsproxy_fast(self) -> Any:
+        if _TWINS.enabled:
+            return self._fsproxy_convert(_State.FAST)
+        return super()._fsproxy_fast
+
+    @property
+    def _fsproxy_slow(self) -> Any:
+        if _TWINS.enabled:
+            return self._fsproxy_convert(_State.SLOW)
+        return super()._fsproxy_slow
+
+    def _fsproxy_convert(self, state: _State) -> Any:
+        """
+        Returns the wrapped object converted to `state`, reusing the
+        retained twin if it is still valid, and retaining the object
+        that was wrapped before the conversion as the new twin.
+        """
+        wrapped = self._fsproxy_wrapped
+        if self._fsproxy_state is state:
+            return wrapped
+        twin = self._fsproxy_twin
+        if (
+            twin is not None
+            and twin[1] == _mutation_epoch
+            and isinstance(twin[0], self._fsproxy_fast_type)
+            == (state is _State.FAST)
+        ):
+            converted = twin[0]
+        elif state is _State.FAST:
+            converted = self._fsproxy_slow_to_fast()
+        else:
+            converted = self._fsproxy_fast_to_slow()
+        self._fsproxy_wrapped = converted
+        _TWINS.retain(self, wrapped)
+        return converted
+
     @classmethod
     def _fsproxy_wrap(cls, value, func):
         """Default mechanism to wrap a value in a proxy type
@@ -581,10 +855,27 @@ class _FinalProxy(_FastSlowProxy):
             pickled_wrapped_obj = pickle.dumps(self._fsproxy_wrapped)
         return (_PickleConstructor(type(self)), (), pickled_wrapped_obj)
 
+    def __reduce_ex__(self, protocol):
+        """
+        With pickle protocol 5 and above, pass the data of the wrapped
+        object as out-of-band buffers instead of copying it into a
+        nested pickle.
+        """
+        if protocol < 5:
+            return self.__reduce__()
+        return (
+            _PickleConstructor(type(self)),
+            (),
+            _dumps_wrapped(self._fsproxy_wrapped, protocol),
+        )
+
     def __setstate__(self, state):
         # Need a local import to avoid circular import issues
         from .module_accelerator import disable_module_accelerator
 
+        if isinstance(state, dict):
+            self._fsproxy_wrapped = _loads_wrapped(state)
+            return
         with disable_module_accelerator():
             unpickled_wrapped_obj = pickle.loads(state)
         self._fsproxy_wrapped = unpickled_wrapped_obj
@@ -663,10 +954,26 @@ class _IntermediateProxy(_FastSlowProxy):
             (pickled_wrapped_obj, pickled_method_chain),
         )
 
+    def __reduce_ex__(self, protocol):
+        """
+        With pickle protocol 5 and above, pass the data of the wrapped
+        object as out-of-band buffers instead of copying it into a
+        nested pickle.
+        """
+        if protocol < 5:
+            return self.__reduce__()
+        state = _dumps_wrapped(self._fsproxy_wrapped, protocol)
+        state["method_chain"] = pickle.dumps(self._method_chain, protocol)
+        return (_PickleConstructor(type(self)), (), state)
+
     def __setstate__(self, state):
         # Need a local import to avoid circular import issues
         from .module_accelerator import disable_module_accelerator
 
+        if isinstance(state, dict):
+            self._fsproxy_wrapped = _loads_wrapped(state)
+            self._method_chain = pickle.loads(state["method_chain"])
+            return
         with disable_module_accelerator():
             unpickled_wrapped_obj = pickle.loads(state[0])
         unpickled_method_chain = pickle.loads(state[1])
@@ -683,17 +990,25 @@ class _CallableProxyMixin:
     __class__ = types.FunctionType  # type: ignore
 
     def __call__(self, *args, **kwargs) -> Any:
-        result, _ = _fast_slow_function_call(
-            # We cannot directly call self here because we need it to be
-            # converted into either the fast or slow object (by
-            # _fast_slow_function_call) to avoid infinite recursion.
-            # TODO: When Python 3.11 is the minimum supported Python version
-            # this can use operator.call
-            call_operator,
-            self,
-            args,
-            kwargs,
-        )
+        mutating = _is_mutating_call(self, args, kwargs)
+        if mutating:
+            _note_mutation()
+        try:
+            result, _ = _fast_slow_function_call(
+                # We cannot directly call self here because we need it to be
+                # converted into either the fast or slow object (by
+                # _fast_slow_function_call) to avoid infinite recursion.
+                # TODO: When Python 3.11 is the minimum supported Python
+                # version this can use operator.call
+                call_operator,
+                self,
+                args,
+                kwargs,
+            )
+        finally:
+            if mutating:
+                # Also invalidate anything recorded while the call ran
+                _note_mutation()
         return result
 
 
@@ -725,6 +1040,11 @@ class _FunctionProxy(_CallableProxyMixin):
             updated=updated,
         )
 
+    @property
+    def _fsproxy_detached(self) -> _FunctionProxy:
+        # Functions are never converted in place
+        return self
+
     def __reduce__(self):
         """
         In conjunction with `__proxy_setstate__`, this effectively enables
@@ -870,6 +1190,474 @@ def _assert_fast_slow_eq(left, right):
         assert_eq(left, right)
 
 
+def _arg_shapes(func: Callable, args: tuple, kwargs: dict) -> list:
+    """
+    Describe the arguments of a call by their shapes, or type names
+    for arguments without a shape, for reporting.
+    """
+    if func is call_operator:
+        fn, args, kwargs = args
+        if isinstance(fn, _MethodProxy):
+            # Include the object the method is called on
+            obj = getattr(fn._fsproxy_slow, "__self__", None)
+            if obj is not None:
+                args = (obj, *args)
+
+    def describe(arg):
+        if isinstance(arg, _FastSlowProxy):
+            # Avoid dispatching through the proxy
+            arg = arg._fsproxy_wrapped
+        shape = getattr(arg, "shape", None)
+        return list(shape) if isinstance(shape, tuple) else type(arg).__name__
+
+    return [describe(a) for a in args] + [
+        [k, describe(v)] for k, v in kwargs.items()
+    ]
+
+
+def _debugging_check(
+    func: Callable,
+    args: tuple,
+    kwargs: dict,
+    result: Any,
+    detach: bool = False,
+) -> Callable[[], tuple[str, str] | None]:
+    """
+    Return a function that runs `func` with pandas and compares the
+    result with the `result` computed by cuDF, returning None if they
+    match, else the kind of mismatch and a message describing it.
+
+    The arguments are converted to pandas objects when the returned
+    function runs. Proxies are converted in place, unless `detach` is
+    set: the function then only keeps references to the objects the
+    proxies wrap, see `_detach_arg`, so that it can be run later from
+    another thread. It raises `_StaleVerification` if a call that may
+    modify objects in place went through a proxy in the meantime, see
+    `_note_mutation`.
+    """
+    from .module_accelerator import disable_module_accelerator
+
+    if detach:
+        epoch = _mutation_epoch
+        args, kwargs = _detach_arg(args), _detach_arg(kwargs)
+
+    def compare():
+        try:
+            slow_args, slow_kwargs = _slow_arg(args), _slow_arg(kwargs)
+            with nvtx.annotate(
+                "EXECUTE_SLOW_DEBUG",
+                color=_CUDF_PANDAS_NVTX_COLORS["EXECUTE_SLOW"],
+                domain="cudf_pandas",
+            ):
+                with disable_module_accelerator():
+                    slow_result = func(*slow_args, **slow_kwargs)
+        except Exception as e:
+            return (
+                "pandas_error",
+                "The result from pandas could not be computed. "
+                f"The exception was {e}.",
+            )
+        try:
+            _assert_fast_slow_eq(result, slow_result)
+        except AssertionError as e:
+            return (
+                "mismatch",
+                "The results from cudf and pandas were different. "
+                f"The exception was {e}.",
+            )
+        except Exception as e:
+            return (
+                "failed",
+                f"Pandas debugging mode failed. The exception was {e}.",
+            )
+        return None
+
+    if not detach:
+        return compare
+
+    def check():
+        if _mutation_epoch != epoch:
+            raise _StaleVerification()
+        outcome = compare()
+        # The objects might have been modified while being compared
+        if _mutation_epoch != epoch:
+            raise _StaleVerification()
+        return outcome
+
+    return check
+
+
+_FallbackCacheInfo = namedtuple(
+    "_FallbackCacheInfo", ["hits", "misses", "maxsize", "currsize"]
+)
+
+
+class _FallbackCache:
+    """
+    A bounded, thread-safe set of call signatures that are known to
+    fail on the fast path.
+
+    A signature (see `_fallback_key`) is recorded when a call raised
+    on the fast path and then succeeded on the slow path. Subsequent
+    calls with the same signature skip the fast path entirely. Once
+    `maxsize` signatures are stored, the least recently used one is
+    evicted.
+
+    Parameters
+    ----------
+    maxsize : int
+        The maximum number of signatures to store.
+    enabled : bool
+        Whether the cache is consulted at all.
+    """
+
+    def __init__(self, maxsize: int, enabled: bool):
+        self.maxsize = maxsize
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._keys: OrderedDict = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def __contains__(self, key) -> bool:
+        with self._lock:
+            if key in self._keys:
+                self._keys.move_to_end(key)
+                self._hits += 1
+                return True
+            self._misses += 1
+            return False
+
+    def add(self, key) -> None:
+        with self._lock:
+            self._keys[key] = None
+            self._keys.move_to_end(key)
+            while len(self._keys) > self.maxsize:
+                self._keys.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all signatures and reset the hit/miss counters"""
+        with self._lock:
+            self._keys.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def info(self) -> _FallbackCacheInfo:
+        """Return the hit/miss statistics of the cache"""
+        with self._lock:
+            return _FallbackCacheInfo(
+                self._hits, self._misses, self.maxsize, len(self._keys)
+            )
+
+
+_FALLBACK_CACHE = _FallbackCache(
+    maxsize=_env_get_int("CUDF_PANDAS_FALLBACK_CACHE_SIZE", 1024),
+    enabled=_env_get_bool("CUDF_PANDAS_FALLBACK_CACHE", False),
+)
+
+# Containers longer than this are not keyed element-wise, which keeps
+# both the cost of computing a key and the size of the cache bounded.
+_FALLBACK_KEY_MAX_ITEMS = 64
+
+_FALLBACK_SCALAR_TYPES = (str, bytes, int, float, bool, type(None))
+
+
+class _Uncacheable(Exception):
+    pass
+
+
+def _fallback_arg_key(arg: Any) -> Any:
+    """
+    Return a hashable key describing the parts of `arg` that decide
+    whether the fast path supports it: the proxy type and dtype(s) of
+    proxies, and the value of simple scalars.
+
+    Raises `_Uncacheable` for arguments we can't describe.
+    """
+    typ = type(arg)
+    if isinstance(arg, _IntermediateProxy):
+        return typ
+    elif isinstance(arg, _FastSlowProxy):
+        wrapped = arg._fsproxy_wrapped
+        try:
+            dtype = getattr(wrapped, "dtype", None)
+            if (
+                dtype is None
+                and (dtypes := getattr(wrapped, "dtypes", None)) is not None
+            ):
+                dtype = frozenset(dtypes)
+        except Exception:
+            raise _Uncacheable()
+        return (typ, dtype)
+    elif typ in _FALLBACK_SCALAR_TYPES:
+        return (typ, arg)
+    elif isinstance(arg, (type, _FunctionProxy)):
+        return arg
+    elif typ in (list, tuple):
+        if len(arg) > _FALLBACK_KEY_MAX_ITEMS:
+            raise _Uncacheable()
+        return (typ, tuple(_fallback_arg_key(a) for a in arg))
+    elif typ is dict:
+        if len(arg) > _FALLBACK_KEY_MAX_ITEMS:
+            raise _Uncacheable()
+        return (
+            typ,
+            tuple(
+                (_fallback_arg_key(k), _fallback_arg_key(v))
+                for k, v in arg.items()
+            ),
+        )
+    elif typ is np.ndarray:
+        return (typ, arg.dtype, arg.ndim)
+    raise _Uncacheable()
+
+
+def _fallback_key(func: Callable, args: tuple, kwargs: dict) -> Any:
+    """
+    Return the key used to look up a call in the fallback cache, or
+    None if the call can't be cached.
+    """
+    if func is call_operator:
+        # The callable being invoked (usually a _MethodProxy that is
+        # stored on the proxy type) is the first argument.
+        func, args = args[0], args[1:]
+    # Not isinstance: callable proxies fake their `__class__` as
+    # FunctionType but have no `__code__`
+    if type(func) is types.FunctionType:  # noqa: E721
+        # Closures are often created afresh for every call, key on
+        # the code object instead so the cache doesn't keep them (and
+        # whatever they close over) alive.
+        func = func.__code__
+    try:
+        key = (func, _fallback_arg_key(args), _fallback_arg_key(kwargs))
+        hash(key)
+    except (_Uncacheable, TypeError):
+        return None
+    return key
+
+
+# Call sites (see `_call_site`) at which a call fell back to the slow
+# path. In plan mode, every call made from one of these sites skips
+# the fast path, so that all the steps of a chain of calls written on
+# one line, e.g., `df.groupby("a").agg(f).reset_index()`, run with the
+# same library instead of converting back and forth between steps.
+_PLANS = _FallbackCache(
+    maxsize=_env_get_int("CUDF_PANDAS_PLAN_CACHE_SIZE", 1024),
+    enabled=_env_get_bool("CUDF_PANDAS_PLAN_MODE", False),
+)
+
+_CUDF_PANDAS_DIR = os.path.dirname(__file__) + os.sep
+
+
+def _call_site() -> tuple[str, int] | None:
+    """
+    Return the filename and line number of the code outside of
+    cudf.pandas that (indirectly) made the current call.
+    """
+    frame = sys._getframe(1)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if not filename.startswith(_CUDF_PANDAS_DIR):
+            return filename, frame.f_lineno
+        frame = frame.f_back
+    return None
+
+
+def _nbytes(obj: Any) -> int:
+    """
+    Best-effort estimate of the memory footprint of `obj` in bytes.
+    """
+    try:
+        usage = obj.memory_usage(deep=False)
+        return int(usage.sum() if hasattr(usage, "sum") else usage)
+    except Exception:
+        pass
+    try:
+        return int(obj.nbytes)
+    except Exception:
+        return 0
+
+
+# Methods that (may) modify the object they are called on in place.
+# Calling any of these, or any function with inplace=True (passed by
+# keyword or position), through a proxy bumps the mutation epoch.
+_MUTATING_METHODS: frozenset[str] = frozenset(
+    {
+        "__delattr__",
+        "__delitem__",
+        "__iadd__",
+        "__iand__",
+        "__iconcat__",
+        "__ifloordiv__",
+        "__ilshift__",
+        "__imatmul__",
+        "__imod__",
+        "__imul__",
+        "__ior__",
+        "__ipow__",
+        "__irshift__",
+        "__isub__",
+        "__itruediv__",
+        "__ixor__",
+        "__setattr__",
+        "__setitem__",
+        "__setstate__",
+        "_set_value",
+        "insert",
+        "isetitem",
+        "pop",
+        "popitem",
+        "update",
+    }
+)
+
+_mutation_counter = itertools.count(1)
+# Incremented whenever a possibly mutating call goes through a proxy.
+# Cached facts about wrapped objects (such as retained twins) are only
+# valid for the epoch they were recorded at.
+_mutation_epoch = 0
+
+
+def _note_mutation() -> None:
+    global _mutation_epoch
+    _mutation_epoch = next(_mutation_counter)
+
+
+@functools.lru_cache(maxsize=1024)
+def _inplace_position(func: Callable) -> int | None:
+    """
+    The position of the `inplace` parameter of `func`, or None if it
+    can't be passed positionally.
+    """
+    try:
+        parameters = inspect.signature(func).parameters.values()
+    except (TypeError, ValueError):
+        return None
+    for i, param in enumerate(parameters):
+        if param.kind not in (
+            inspect.Parameter.POSITIONAL_ONLY,
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+        ):
+            return None
+        if param.name == "inplace":
+            return i
+    return None
+
+
+def _is_mutating_call(func: Callable, args: tuple, kwargs: dict) -> bool:
+    """
+    Whether calling `func` with `args` and `kwargs` may modify an object
+    in place.
+    """
+    if (
+        getattr(func, "__name__", None) in _MUTATING_METHODS
+        or kwargs.get("inplace", False) is True
+    ):
+        return True
+    if args and isinstance(func, _FunctionProxy):
+        # Bind the arguments to the signature of the slow function
+        try:
+            position = _inplace_position(func._fsproxy_slow)
+        except TypeError:
+            # Not hashable
+            return False
+        return (
+            position is not None
+            and position < len(args)
+            and args[position] is True
+        )
+    return False
+
+
+class _TwinRegistry:
+    """
+    Bookkeeping for the converted "twins" retained by final proxies
+    in dual residency mode.
+
+    When a final proxy converts its wrapped object (from fast to slow
+    or vice-versa), it keeps the object it was wrapping as its twin,
+    tagged with the current mutation epoch. Converting back while the
+    epoch is unchanged swaps the twin in instead of converting again.
+    The total size of all retained twins is capped at `limit` bytes
+    (0 means no limit), dropping the least recently retained twins
+    first.
+
+    Parameters
+    ----------
+    enabled : bool
+        Whether proxies retain twins at all.
+    limit : int
+        The maximum number of bytes held by retained twins.
+    """
+
+    def __init__(self, enabled: bool, limit: int):
+        self.enabled = enabled
+        self.limit = limit
+        self._lock = threading.Lock()
+        # Proxies aren't (necessarily) hashable so key them by id,
+        # mapping to (weakref to proxy, nbytes of its twin).
+        self._twins: OrderedDict[int, tuple[weakref.ref, int]] = OrderedDict()
+        self._nbytes = 0
+
+    @property
+    def nbytes(self) -> int:
+        """The number of bytes held by retained twins"""
+        return self._nbytes
+
+    def retain(self, proxy: _FinalProxy, twin: Any) -> None:
+        nbytes = _nbytes(twin)
+        if self.limit and nbytes > self.limit:
+            self.release(proxy)
+            return
+        proxy._fsproxy_twin = (twin, _mutation_epoch)
+        key = id(proxy)
+        evicted = []
+        with self._lock:
+            if (entry := self._twins.pop(key, None)) is not None:
+                self._nbytes -= entry[1]
+            self._twins[key] = (
+                weakref.ref(proxy, functools.partial(self._forget, key)),
+                nbytes,
+            )
+            self._nbytes += nbytes
+            while self.limit and self._nbytes > self.limit:
+                _, (ref, n) = self._twins.popitem(last=False)
+                self._nbytes -= n
+                evicted.append(ref)
+        for ref in evicted:
+            if (p := ref()) is not None:
+                p._fsproxy_twin = None
+
+    def release(self, proxy: _FinalProxy) -> None:
+        proxy._fsproxy_twin = None
+        with self._lock:
+            if (entry := self._twins.pop(id(proxy), None)) is not None:
+                self._nbytes -= entry[1]
+
+    def clear(self) -> None:
+        """Drop all retained twins"""
+        with self._lock:
+            refs = [ref for ref, _ in self._twins.values()]
+            self._twins.clear()
+            self._nbytes = 0
+        for ref in refs:
+            if (p := ref()) is not None:
+                p._fsproxy_twin = None
+
+    def _forget(self, key: int, ref: weakref.ref) -> None:
+        with self._lock:
+            entry = self._twins.get(key)
+            if entry is not None and entry[0] is ref:
+                del self._twins[key]
+                self._nbytes -= entry[1]
+
+
+_TWINS = _TwinRegistry(
+    enabled=_env_get_bool("CUDF_PANDAS_DUAL_RESIDENCY", False),
+    limit=_env_get_int("CUDF_PANDAS_DUAL_RESIDENCY_LIMIT", 0),
+)
+
+
 def _fast_slow_function_call(
     func: Callable,
     /,
@@ -887,6 +1675,28 @@ def _fast_slow_function_call(
     from .module_accelerator import disable_module_accelerator
 
     fast = False
+    call_stats_token = None
+    if _CALL_STATS.enabled and args:
+        if (name := _get_namespaced_function_name(args[0])) is not None:
+            call_stats_token = _CALL_STATS.start(name)
+    fallback_key = None
+    if _FALLBACK_CACHE.enabled:
+        fallback_key = _fallback_key(func, args, kwargs)
+    call_site = _call_site() if _PLANS.enabled else None
+    if (fallback_key is not None and fallback_key in _FALLBACK_CACHE) or (
+        call_site is not None and call_site in _PLANS
+    ):
+        with nvtx.annotate(
+            "EXECUTE_SLOW",
+            color=_CUDF_PANDAS_NVTX_COLORS["EXECUTE_SLOW"],
+            domain="cudf_pandas",
+        ):
+            slow_args, slow_kwargs = _slow_arg(args), _slow_arg(kwargs)
+            with disable_module_accelerator():
+                result = func(*slow_args, **slow_kwargs)
+        if call_stats_token is not None:
+            _CALL_STATS.finish(call_stats_token, fast)
+        return _maybe_wrap_result(result, func, *args, **kwargs), fast
     try:
         with nvtx.annotate(
             "EXECUTE_FAST",
@@ -900,37 +1710,30 @@ def _fast_slow_function_call(
                 raise Exception()
             fast = True
             if _env_get_bool("CUDF_PANDAS_DEBUGGING", False):
-                try:
-                    with nvtx.annotate(
-                        "EXECUTE_SLOW_DEBUG",
-                        color=_CUDF_PANDAS_NVTX_COLORS["EXECUTE_SLOW"],
-                        domain="cudf_pandas",
-                    ):
-                        slow_args, slow_kwargs = (
-                            _slow_arg(args),
-                            _slow_arg(kwargs),
-                        )
-                        with disable_module_accelerator():
-                            slow_result = func(*slow_args, **slow_kwargs)
-                except Exception as e:
-                    warnings.warn(
-                        "The result from pandas could not be computed. "
-                        f"The exception was {e}."
+                name = (
+                    _get_namespaced_function_name(args[0]) if args else None
+                ) or getattr(func, "__name__", repr(func))
+                if _VERIFIER.should_verify(name):
+                    # Mutating calls would mutate the caller's objects
+                    # again, so never verify them in the background
+                    synchronous = (
+                        _is_mutating_call(*args)
+                        if func is call_operator
+                        else _is_mutating_call(func, args, kwargs)
                     )
-                else:
-                    try:
-                        _assert_fast_slow_eq(result, slow_result)
-                    except AssertionError as e:
-                        warnings.warn(
-                            "The results from cudf and pandas were different. "
-                            f"The exception was {e}."
-                        )
-                    except Exception as e:
-                        warnings.warn(
-                            "Pandas debugging mode failed. "
-                            f"The exception was {e}."
-                        )
-    except Exception:
+                    _VERIFIER.verify(
+                        name,
+                        _arg_shapes(func, args, kwargs),
+                        _debugging_check(
+                            func,
+                            args,
+                            kwargs,
+                            result,
+                            detach=_VERIFIER.asynchronous and not synchronous,
+                        ),
+                        synchronous=synchronous,
+                    )
+    except Exception as e:
         with nvtx.annotate(
             "EXECUTE_SLOW",
             color=_CUDF_PANDAS_NVTX_COLORS["EXECUTE_SLOW"],
@@ -939,20 +1742,34 @@ def _fast_slow_function_call(
             slow_args, slow_kwargs = _slow_arg(args), _slow_arg(kwargs)
             with disable_module_accelerator():
                 result = func(*slow_args, **slow_kwargs)
+        # Running out of device memory says nothing about whether the
+        # fast path supports the call, so don't remember it.
+        if not isinstance(e, MemoryError):
+            if fallback_key is not None:
+                _FALLBACK_CACHE.add(fallback_key)
+            if call_site is not None:
+                _PLANS.add(call_site)
+    if call_stats_token is not None:
+        _CALL_STATS.finish(call_stats_token, fast)
     return _maybe_wrap_result(result, func, *args, **kwargs), fast
 
 
 def _transform_arg(
     arg: Any,
-    attribute_name: Literal["_fsproxy_slow", "_fsproxy_fast"],
+    attribute_name: Literal[
+        "_fsproxy_slow", "_fsproxy_fast", "_fsproxy_detached"
+    ],
     seen: set[int],
 ) -> Any:
     """
-    Transform "arg" into its corresponding slow (or fast) type.
+    Transform "arg" into its corresponding slow (or fast) type, or
+    detach it, see `_detach_arg`.
     """
     import numpy as np
 
-    if isinstance(arg, (_FastSlowProxy, _FastSlowProxyMeta, _FunctionProxy)):
+    if type(arg) in _LEAF_TYPES:
+        return arg
+    elif isinstance(arg, (_FastSlowProxy, _FastSlowProxyMeta, _FunctionProxy)):
         typ = getattr(arg, attribute_name)
         if typ is _Unusable:
             raise Exception("Cannot transform _Unusable")
@@ -960,6 +1777,20 @@ def _transform_arg(
     elif isinstance(arg, types.ModuleType) and attribute_name in arg.__dict__:
         return arg.__dict__[attribute_name]
     elif isinstance(arg, list):
+        # Exactly a list, subclasses are rebuilt from their type below
+        if arg.__class__ is list:
+            arg_types = set(map(type, arg))
+            if _LEAF_TYPES.issuperset(arg_types):
+                # Nothing to transform, e.g., a list of labels
+                return arg.copy()
+            elif len(arg_types) == 1 and issubclass(
+                arg_types.pop(), _FinalProxy
+            ):
+                # e.g., a list of DataFrames passed to concat
+                transformed = [getattr(a, attribute_name) for a in arg]
+                if any(t is _Unusable for t in transformed):
+                    raise Exception("Cannot transform _Unusable")
+                return transformed
         return type(arg)(_transform_arg(a, attribute_name, seen) for a in arg)
     elif isinstance(arg, tuple):
         # This attempts to handle arbitrary subclasses of tuple by
@@ -970,6 +1801,9 @@ def _transform_arg(
         # use __reduce_ex__ instead...
         if type(arg) is tuple:
             # Must come first to avoid infinite recursion
+            if _LEAF_TYPES.issuperset(map(type, arg)):
+                # Immutable, nothing to transform or copy
+                return arg
             return tuple(_transform_arg(a, attribute_name, seen) for a in arg)
         elif hasattr(arg, "__getnewargs_ex__"):
             # Partial implementation of to reconstruct with
@@ -1003,6 +1837,10 @@ def _transform_arg(
                 _transform_arg(a, attribute_name, seen) for a in args
             )
     elif isinstance(arg, dict):
+        if _LEAF_TYPES.issuperset(map(type, arg)) and _LEAF_TYPES.issuperset(
+            map(type, arg.values())
+        ):
+            return dict(arg)
         return {
             _transform_arg(k, attribute_name, seen): _transform_arg(
                 a, attribute_name, seen
@@ -1010,6 +1848,9 @@ def _transform_arg(
             for k, a in arg.items()
         }
     elif isinstance(arg, np.ndarray) and arg.dtype == "O":
+        if _LEAF_TYPES.issuperset(map(type, arg.flat)):
+            # Keep the same memory layout as arg
+            return arg.copy(order="A")
         transformed = [
             _transform_arg(a, attribute_name, seen) for a in arg.flat
         ]
@@ -1028,6 +1869,8 @@ def _transform_arg(
         # slow path is taken:
         raise Exception()
     elif isinstance(arg, types.FunctionType):
+        if attribute_name == "_fsproxy_detached":
+            return arg
         if id(arg) in seen:
             # `arg` is mutually recursive with another function.  We
             # can't handle these cases yet:
@@ -1054,19 +1897,48 @@ def _slow_arg(arg: Any) -> Any:
     return _transform_arg(arg, "_fsproxy_slow", seen)
 
 
+def _detach_arg(arg: Any) -> Any:
+    """
+    Replace the proxies in "arg" with new ones wrapping the same
+    objects, which can be converted to their fast or slow type (e.g.,
+    from another thread) without affecting the original proxies.
+    Functions are left as they are.
+    """
+    seen: set[int] = set()
+    return _transform_arg(arg, "_fsproxy_detached", seen)
+
+
+def _identity(x):
+    return x
+
+
 def _maybe_wrap_result(result: Any, func: Callable, /, *args, **kwargs) -> Any:
     """
     Wraps "result" in a fast-slow proxy if is a "proxiable" object.
     """
-    if _is_final_type(result):
-        typ = get_final_type_map()[type(result)]
-        return typ._fsproxy_wrap(result, func)
-    elif _is_intermediate_type(result):
-        typ = get_intermediate_type_map()[type(result)]
-        return typ._fsproxy_wrap(result, method_chain=(func, args, kwargs))
-    elif _is_final_class(result):
-        return get_final_type_map()[result]
+    typ = type(result)
+    if typ in _LEAF_TYPES:
+        return result
+    final_type_map = get_final_type_map()
+    if typ in final_type_map:
+        return final_type_map[typ]._fsproxy_wrap(result, func)
+    intermediate_type_map = get_intermediate_type_map()
+    if typ in intermediate_type_map:
+        return intermediate_type_map[typ]._fsproxy_wrap(
+            result, method_chain=(func, args, kwargs)
+        )
+    elif isinstance(result, type) and result in final_type_map:
+        return final_type_map[result]
     elif isinstance(result, list):
+        result_types = set(map(type, result))
+        if _LEAF_TYPES.issuperset(result_types):
+            return result
+        elif len(result_types) == 1 and (
+            proxy_type := final_type_map.get(result_types.pop())
+        ):
+            # e.g., a list of DataFrames or Series: wrap all at once
+            wrap = proxy_type._fsproxy_wrap
+            return type(result)([wrap(r, operator.getitem) for r in result])
         return type(result)(
             [
                 _maybe_wrap_result(r, operator.getitem, result, i)
@@ -1074,6 +1946,8 @@ def _maybe_wrap_result(result: Any, func: Callable, /, *args, **kwargs) -> Any:
             ]
         )
     elif isinstance(result, tuple):
+        if typ is tuple and _LEAF_TYPES.issuperset(map(type, result)):
+            return result
         wrapped = (
             _maybe_wrap_result(r, operator.getitem, result, i)
             for i, r in enumerate(result)
@@ -1084,7 +1958,7 @@ def _maybe_wrap_result(result: Any, func: Callable, /, *args, **kwargs) -> Any:
         else:
             return type(result)(wrapped)
     elif isinstance(result, Iterator):
-        return (_maybe_wrap_result(r, lambda x: x, r) for r in result)
+        return (_maybe_wrap_result(r, _identity, r) for r in result)
     else:
         return result
 
@@ -1124,6 +1998,129 @@ def _is_function_or_method(obj: Any) -> bool:
     return res
 
 
+def _closurevars(f: types.FunctionType) -> tuple[dict, dict]:
+    """
+    Return the nonlocal and global variables referenced by `f`, like
+    `inspect.getclosurevars` but without the builtins and unbound names.
+    """
+    code = f.__code__
+    if f.__closure__ is None:
+        nonlocal_vars = {}
+    else:
+        nonlocal_vars = {
+            var: cell.cell_contents
+            for var, cell in zip(code.co_freevars, f.__closure__)
+        }
+    global_ns = f.__globals__
+    global_vars = {
+        name: global_ns[name]
+        for name in _global_names(code)
+        if name in global_ns
+    }
+    return nonlocal_vars, global_vars
+
+
+@functools.lru_cache(maxsize=1024)
+def _global_names(code: types.CodeType) -> tuple[str, ...]:
+    """
+    The names `code` may look up in its globals. Like
+    `inspect.getclosurevars` this includes names of attributes.
+    """
+    return tuple(
+        name for name in code.co_names if name not in ("None", "True", "False")
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _nested_global_names(code: types.CodeType) -> frozenset[str]:
+    """
+    The names `code`, or the code of any function (or comprehension)
+    defined inside it, may look up in its globals.
+    """
+    names = set(_global_names(code))
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= _nested_global_names(const)
+    return frozenset(names)
+
+
+class _ClosureCache:
+    """
+    A bounded cache of the functions built by `_replace_closurevars`.
+
+    Entries are keyed by the identity of the original function and the
+    attribute used to transform its variables. An entry is only reused
+    if the cached function sees exactly the variables that a freshly
+    built one would, see `lookup`.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries: OrderedDict = OrderedDict()
+
+    def lookup(
+        self,
+        f: types.FunctionType,
+        attribute_name: str,
+        g_nonlocals: dict,
+        g_globals: dict,
+    ) -> types.FunctionType | None:
+        key = (id(f), attribute_name)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+        ref, g = entry
+        if (
+            ref() is not f
+            or g.__code__ is not f.__code__
+            or g.__defaults__ is not f.__defaults__
+            or g.__kwdefaults__ is not f.__kwdefaults__
+        ):
+            return None
+        if any(
+            cell.cell_contents is not val
+            for cell, val in zip(g.__closure__ or (), g_nonlocals.values())
+        ):
+            return None
+        # Check every global name that g (or functions it defines) may
+        # look up, its globals are a snapshot from when it was built.
+        f_ns, g_ns = f.__globals__, g.__globals__
+        for name in _nested_global_names(f.__code__):
+            expected = (
+                g_globals[name]
+                if name in g_globals
+                else f_ns.get(name, _MISSING)
+            )
+            if g_ns.get(name, _MISSING) is not expected:
+                return None
+        return g
+
+    def add(
+        self, f: types.FunctionType, attribute_name: str, g: types.FunctionType
+    ) -> None:
+        key = (id(f), attribute_name)
+        ref = weakref.ref(f, functools.partial(self._forget, key))
+        with self._lock:
+            self._entries[key] = (ref, g)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def _forget(self, key, ref) -> None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is ref:
+                del self._entries[key]
+
+
+_CLOSURE_CACHE = _ClosureCache(maxsize=128)
+
+_MISSING = object()
+
+
 def _replace_closurevars(
     f: types.FunctionType,
     attribute_name: Literal["_fsproxy_slow", "_fsproxy_fast"],
@@ -1136,14 +2133,14 @@ def _replace_closurevars(
     if f.__closure__:
         # GH #254: If empty cells are present - which can happen in
         # situations like when `f` is a method that invokes the
-        # "empty" `super()` - the call to `getclosurevars` below will
+        # "empty" `super()` - reading the cell contents below will
         # fail.  For now, we just return `f` in this case.  If needed,
         # we can consider populating empty cells with a placeholder
-        # value to allow the call to `getclosurevars` to succeed.
+        # value to allow reading the cell contents to succeed.
         if any(c == types.CellType() for c in f.__closure__):
             return f
 
-    f_nonlocals, f_globals, _, _ = inspect.getclosurevars(f)
+    f_nonlocals, f_globals = _closurevars(f)
 
     g_globals = _transform_arg(f_globals, attribute_name, seen)
     g_nonlocals = _transform_arg(f_nonlocals, attribute_name, seen)
@@ -1155,6 +2152,11 @@ def _replace_closurevars(
     ):
         return f
 
+    if (
+        g := _CLOSURE_CACHE.lookup(f, attribute_name, g_nonlocals, g_globals)
+    ) is not None:
+        return g
+
     g_closure = tuple(types.CellType(val) for val in g_nonlocals.values())
 
     # https://github.com/rapidsai/cudf/issues/15548
@@ -1168,11 +2170,13 @@ def _replace_closurevars(
         argdefs=f.__defaults__,
         closure=g_closure,
     )
-    return functools.update_wrapper(
+    g = functools.update_wrapper(
         g,
         f,
         assigned=functools.WRAPPER_ASSIGNMENTS + ("__kwdefaults__",),
     )
+    _CLOSURE_CACHE.add(f, attribute_name, g)
+    return g
 
 
 def is_proxy_object(obj: Any) -> bool:
@@ -1191,6 +2195,11 @@ def is_proxy_object(obj: Any) -> bool:
 
 NUMPY_TYPES: set[str] = set(np.sctypeDict.values())
 
+# Types of objects that never need to be transformed by _transform_arg
+_LEAF_TYPES: frozenset[type] = frozenset(
+    {bool, bytes, complex, float, int, str, type(None), *NUMPY_TYPES}
+)
+
 
 _SPECIAL_METHODS: set[str] = {
     "__abs__",
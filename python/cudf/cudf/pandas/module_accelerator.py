@@ -5,6 +5,7 @@
 from __future__ import annotations
 
 import contextlib
+import contextvars
 import functools
 import importlib
 import importlib.abc
@@ -12,7 +13,6 @@ import importlib.machinery
 import os
 import pathlib
 import sys
-import threading
 import warnings
 from abc import abstractmethod
 from importlib._bootstrap import _ImportLockContext as ImportLock
@@ -378,8 +378,8 @@ class ModuleAccelerator(ModuleAcceleratorBase):
     """
 
     _denylist: tuple[str]
-    _use_fast_lib: bool
-    _use_fast_lib_lock: threading.RLock
+    _denylist_cache: dict[str, bool]
+    _use_fast_lib: contextvars.ContextVar[bool]
     _module_cache_prefix: str = "_slow_lib_"
 
     # TODO: Add possibility for either an explicit allow-list of
@@ -408,10 +408,16 @@ class ModuleAccelerator(ModuleAcceleratorBase):
                 sys.modules[self._module_cache_prefix + mod] = sys.modules[mod]
                 del sys.modules[mod]
         self._denylist = (*slow_module.__path__, *fast_module.__path__)
-
-        # Lock to manage temporarily disabling delivering wrapped attributes
-        self._use_fast_lib_lock = threading.RLock()
-        self._use_fast_lib = True
+        # Map the filename of calling code to whether it is in the
+        # denylist
+        self._denylist_cache = {}
+
+        # Temporarily disabling delivering wrapped attributes only
+        # applies to the current thread (or asyncio task), so that
+        # other threads neither see it nor have to wait for it
+        self._use_fast_lib = contextvars.ContextVar(
+            f"{slow_lib}_use_fast_lib", default=True
+        )
         return self
 
     def _populate_module(self, mod: ModuleType):
@@ -497,23 +503,20 @@ class ModuleAccelerator(ModuleAcceleratorBase):
 
         Within the block, any wrapped objects will instead deliver
         attributes from their real counterparts (as if the current
-        nested block were in the denylist).
+        nested block were in the denylist). This only applies to the
+        current thread, or asyncio task.
 
         Returns
         -------
         Context manager for disabling things
         """
+        # The same thread might enter this context manager multiple
+        # times, resetting the token restores the previous value
+        token = self._use_fast_lib.set(False)
         try:
-            self._use_fast_lib_lock.acquire()
-            # The same thread might enter this context manager
-            # multiple times, so we need to remember the previous
-            # value
-            saved = self._use_fast_lib
-            self._use_fast_lib = False
             yield
         finally:
-            self._use_fast_lib = saved
-            self._use_fast_lib_lock.release()
+            self._use_fast_lib.reset(token)
 
     @staticmethod
     def getattr_real_or_wrapped(
@@ -542,23 +545,19 @@ class ModuleAccelerator(ModuleAcceleratorBase):
         -------
         The requested attribute (either real or wrapped)
         """
-        with loader._use_fast_lib_lock:
-            # Have to hold the lock to read this variable since
-            # another thread might modify it.
-            # Modification has to happen with the lock held for the
-            # duration, so if someone else has modified things, then
-            # we block trying to acquire the lock (hence it is safe to
-            # release the lock after reading this value)
-            use_real = not loader._use_fast_lib
+        use_real = not loader._use_fast_lib.get()
         if not use_real:
             # Only need to check the denylist if we're not turned off.
-            frame = sys._getframe()
             # We cannot possibly be at the top level.
-            assert frame.f_back
-            calling_module = pathlib.PurePath(frame.f_back.f_code.co_filename)
-            use_real = _caller_in_denylist(
-                calling_module, tuple(loader._denylist)
-            )
+            filename = sys._getframe(1).f_code.co_filename
+            try:
+                use_real = loader._denylist_cache[filename]
+            except KeyError:
+                use_real = loader._denylist_cache[filename] = (
+                    _caller_in_denylist(
+                        pathlib.PurePath(filename), tuple(loader._denylist)
+                    )
+                )
         try:
             if use_real:
                 return real[name]
@@ -4,9 +4,11 @@
 from __future__ import annotations
 
 import inspect
+import linecache
 import operator
 import pickle
 import sys
+import threading
 import time
 from collections import defaultdict
 
@@ -15,12 +17,20 @@ from rich.syntax import Syntax
 from rich.table import Table
 
 from .fast_slow_proxy import (
+    _CONVERSION_LISTENERS,
+    _fast_slow_function_call,
     _FinalProxy,
     _FunctionProxy,
+    _get_namespaced_function_name,
     _IntermediateProxy,
     _MethodProxy,
 )
 
+# PEP 669 low-impact monitoring is available from Python 3.12
+_HAS_SYS_MONITORING = hasattr(sys, "monitoring")
+
+_FAST_SLOW_FUNCTION_CALL_CODE = _fast_slow_function_call.__code__
+
 # This text is used in contexts where the profiler is injected into the
 # original code. The profiler is injected at the top of the cell, so the line
 # numbers in the profiler results are offset by 2.
@@ -37,7 +47,21 @@ for (lineno, currfile, line), v in profiler._results.items():
     new_results[(lineno - 2, currfile, line)] = v
 
 profiler._results = new_results
+
+new_conversion_results = {{}}
+
+for (currkey, proxy_type, direction), v in (
+    profiler._conversion_results.items()
+):
+    if currkey is not None:
+        lineno, currfile, line = currkey
+        currkey = (lineno - 2, currfile, line)
+    new_conversion_results[(currkey, proxy_type, direction)] = v
+
+profiler._conversion_results = new_conversion_results
 profiler.print_per_line_stats()
+if profiler.conversion_stats:
+    profiler.print_conversion_stats()
 {function_profile_printer}
 """
 
@@ -49,6 +73,16 @@ The following functions required CPU fallback:
 """
 
 
+def format_bytes(nbytes):
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if nbytes < 1024:
+            break
+        nbytes /= 1024
+    else:
+        unit = "TiB"
+    return f"{nbytes:.1f} {unit}" if unit != "B" else f"{nbytes} B"
+
+
 def format_cpu_functions_used(cpu_funcs):
     output_str = ""
     for each in cpu_funcs:
@@ -73,9 +107,30 @@ def lines_with_profiling(lines, print_function_profile=False):
 
 
 class Profiler:
+    """
+    Context manager that records how much time each line of code (and
+    each pandas function) spent executing on the GPU and on the CPU.
+
+    Parameters
+    ----------
+    backend : {"auto", "monitoring", "settrace"}, default "auto"
+        How to observe the profiled code. "monitoring" uses
+        ``sys.monitoring`` (Python 3.12+), which has a much lower
+        overhead than "settrace", which uses ``sys.settrace``. "auto"
+        uses "monitoring" when it is available and the profiler tool
+        id isn't in use by another tool, and "settrace" otherwise.
+    """
+
     _IGNORE_LIST = ["Profiler()", "settrace(None)"]
 
-    def __init__(self):
+    def __init__(self, backend="auto"):
+        if backend not in {"auto", "monitoring", "settrace"}:
+            raise ValueError(f"Unknown profiler backend: {backend}")
+        if backend == "monitoring" and not _HAS_SYS_MONITORING:
+            raise ValueError(
+                "The monitoring backend requires Python 3.12 or later"
+            )
+        self.backend = backend
         self._results = {}
         # Map func-name to list of calls (was_fast, time)
         self._per_func_results = defaultdict(lambda: defaultdict(list))
@@ -85,37 +140,110 @@ class Profiler:
         self._currkey = None
         self._timer = {}
         self._currfile = None
+        self._thread_id = None
+        # Map (line key, proxy type name, direction) to the number,
+        # total size in bytes, and total time of the conversions
+        # between fast and slow objects
+        self._conversion_results = {}
         self.start_time = None
         self.end_time = None
 
     def __enter__(self, *args, **kwargs):
         self.start_time = time.perf_counter()
-        self._oldtrace = sys.gettrace()
-        # Setting the global trace function with sys.settrace does not affect
-        # the current call stack, so in addition to this we must also set the
-        # current frame's f_trace attribute as done below.
-        sys.settrace(self._tracefunc)
-
-        # Following excerpt from:
-        # https://docs.python.org/3/library/sys.html#sys.settrace
-        # For more fine-grained usage, it is possible
-        # to set a trace function by assigning
-        # frame.f_trace = tracefunc explicitly, rather than
-        # relying on it being set indirectly via the return
-        # value from an already installed trace function
-        # Hence we need to perform `f_trace = self._tracefunc`
-        # we need to `f_back` because current frame will be
-        # of this file.
         frame = inspect.currentframe().f_back
         self._currfile = frame.f_code.co_filename
-        self._f_back_oldtrace = frame.f_trace
-        frame.f_trace = self._tracefunc
+        self._thread_id = threading.get_ident()
+        if self.backend != "settrace" and self._start_monitoring():
+            self._active_backend = "monitoring"
+        else:
+            self._active_backend = "settrace"
+            self._oldtrace = sys.gettrace()
+            # Setting the global trace function with sys.settrace does not
+            # affect the current call stack, so in addition to this we must
+            # also set the current frame's f_trace attribute as done below.
+            sys.settrace(self._tracefunc)
+
+            # Following excerpt from:
+            # https://docs.python.org/3/library/sys.html#sys.settrace
+            # For more fine-grained usage, it is possible
+            # to set a trace function by assigning
+            # frame.f_trace = tracefunc explicitly, rather than
+            # relying on it being set indirectly via the return
+            # value from an already installed trace function
+            # Hence we need to perform `f_trace = self._tracefunc`
+            # we need to `f_back` because current frame will be
+            # of this file.
+            self._f_back_oldtrace = frame.f_trace
+            frame.f_trace = self._tracefunc
+        _CONVERSION_LISTENERS.append(self._record_conversion)
         return self
 
     def __exit__(self, *args, **kwargs):
-        sys.settrace(self._oldtrace)
-        inspect.currentframe().f_back.f_trace = self._f_back_oldtrace
+        if self._active_backend == "monitoring":
+            self._stop_monitoring()
+        else:
+            sys.settrace(self._oldtrace)
+            inspect.currentframe().f_back.f_trace = self._f_back_oldtrace
+        _CONVERSION_LISTENERS.remove(self._record_conversion)
         self.end_time = time.perf_counter()
+        # Calls that raised are never popped by the monitoring backend
+        self._call_stack.clear()
+
+    def _start_monitoring(self):
+        """
+        Register the sys.monitoring callbacks, returning False if the
+        profiler tool id is already in use.
+        """
+        monitoring = sys.monitoring
+        tool_id = monitoring.PROFILER_ID
+        try:
+            monitoring.use_tool_id(tool_id, "cudf.pandas profiler")
+        except ValueError:
+            if self.backend == "monitoring":
+                raise
+            return False
+        events = monitoring.events
+        monitoring.register_callback(
+            tool_id, events.LINE, self._monitoring_line
+        )
+        monitoring.register_callback(
+            tool_id, events.PY_START, self._monitoring_start
+        )
+        monitoring.register_callback(
+            tool_id, events.PY_RETURN, self._monitoring_return
+        )
+        # Line events are needed everywhere (and disabled again on
+        # the first event outside of the profiled file), but call
+        # events only for _fast_slow_function_call.
+        monitoring.set_events(tool_id, events.LINE)
+        monitoring.set_local_events(
+            tool_id,
+            _FAST_SLOW_FUNCTION_CALL_CODE,
+            events.PY_START | events.PY_RETURN,
+        )
+        return True
+
+    def _stop_monitoring(self):
+        monitoring = sys.monitoring
+        tool_id = monitoring.PROFILER_ID
+        monitoring.set_events(tool_id, monitoring.events.NO_EVENTS)
+        monitoring.set_local_events(
+            tool_id,
+            _FAST_SLOW_FUNCTION_CALL_CODE,
+            monitoring.events.NO_EVENTS,
+        )
+        for event in (
+            monitoring.events.LINE,
+            monitoring.events.PY_START,
+            monitoring.events.PY_RETURN,
+        ):
+            monitoring.register_callback(tool_id, event, None)
+        monitoring.free_tool_id(tool_id)
+        # Re-enable the line events disabled for other files, which a
+        # later profile may need. This also re-enables the events other
+        # tools disabled, so only do it when no other tool is in use.
+        if not any(monitoring.get_tool(i) is not None for i in range(6)):
+            monitoring.restart_events()
 
     @staticmethod
     def get_namespaced_function_name(
@@ -124,81 +252,100 @@ class Profiler:
         | type[_FinalProxy]
         | type[_IntermediateProxy],
     ):
-        if isinstance(func_obj, _MethodProxy):
-            return func_obj._fsproxy_slow.__qualname__
-        elif isinstance(func_obj, _FunctionProxy) or issubclass(
-            func_obj, (_FinalProxy, _IntermediateProxy)
-        ):
-            return func_obj.__name__
-        else:
+        if (name := _get_namespaced_function_name(func_obj)) is None:
             raise NotImplementedError(
                 f"Don't know how to get namespaced name for {func_obj}"
             )
+        return name
+
+    def _record_line(self, lineno, line):
+        if not any(
+            ignore_word in line for ignore_word in Profiler._IGNORE_LIST
+        ):
+            self._currkey = (lineno, self._currfile, line)
+            self._results.setdefault(self._currkey, {})
+            self._timer[self._currkey] = time.perf_counter()
+
+    def _enter_call(self, frame):
+        """Record the start of the _fast_slow_function_call in `frame`"""
+        if self._currkey is not None:
+            self._timer[self._currkey] = time.perf_counter()
+
+        # Store per-function information for free functions and methods
+        func_name = _get_namespaced_function_name(frame.f_locals["args"][0])
+        self._call_stack.append((frame, func_name, time.perf_counter()))
+
+    def _exit_call(self, frame, result):
+        """
+        Record the end of the _fast_slow_function_call in `frame`,
+        `result` is its return value or None if it raised.
+        """
+        while self._call_stack:
+            call_frame, func_name, start = self._call_stack.pop()
+            if call_frame is frame:
+                break
+        else:
+            return
+        if result is None:
+            return
+
+        if self._currkey is not None:
+            run_time = time.perf_counter() - self._timer[self._currkey]
+            key = "gpu_time" if result[1] else "cpu_time"
+            results = self._results[self._currkey]
+            results[key] = run_time + results.get(key, 0)
+
+        if func_name is not None:
+            key = "gpu" if result[1] else "cpu"
+            self._per_func_results[func_name][key].append(
+                time.perf_counter() - start
+            )
+
+    def _record_conversion(self, proxy_type, direction, nbytes, seconds):
+        if threading.get_ident() != self._thread_id:
+            return
+        key = (self._currkey, proxy_type.__name__, direction)
+        count, total_nbytes, total_seconds = self._conversion_results.get(
+            key, (0, 0, 0.0)
+        )
+        self._conversion_results[key] = (
+            count + 1,
+            total_nbytes + nbytes,
+            total_seconds + seconds,
+        )
 
     def _tracefunc(self, frame, event, arg):
         if event == "line" and frame.f_code.co_filename == self._currfile:
-            key = "".join(inspect.stack()[1].code_context)
-            if not any(
-                ignore_word in key for ignore_word in Profiler._IGNORE_LIST
-            ):
-                self._currkey = (frame.f_lineno, self._currfile, key)
-                self._results.setdefault(self._currkey, {})
-                self._timer[self._currkey] = time.perf_counter()
-        elif (
-            event == "call"
-            and frame.f_code.co_name == "_fast_slow_function_call"
-        ):
-            if self._currkey is not None:
-                self._timer[self._currkey] = time.perf_counter()
-
-            # Store per-function information for free functions and methods
-            frame_locals = inspect.getargvalues(frame).locals
-            if (
-                isinstance(
-                    func_obj := frame_locals["args"][0],
-                    (_MethodProxy, _FunctionProxy),
-                )
-                or isinstance(func_obj, type)
-                and issubclass(func_obj, (_FinalProxy, _IntermediateProxy))
-            ):
-                func_name = self.get_namespaced_function_name(func_obj)
-                self._call_stack.append((func_name, time.perf_counter()))
+            self._record_line(
+                frame.f_lineno,
+                linecache.getline(self._currfile, frame.f_lineno),
+            )
+        elif event == "call" and frame.f_code is _FAST_SLOW_FUNCTION_CALL_CODE:
+            self._enter_call(frame)
         elif (
-            event == "return"
-            and frame.f_code.co_name == "_fast_slow_function_call"
+            event == "return" and frame.f_code is _FAST_SLOW_FUNCTION_CALL_CODE
         ):
-            if self._currkey is not None and arg is not None:
-                if arg[1]:  # fast
-                    run_time = time.perf_counter() - self._timer[self._currkey]
-                    self._results[self._currkey]["gpu_time"] = (
-                        run_time
-                        + self._results[self._currkey].get("gpu_time", 0)
-                    )
-                else:
-                    run_time = time.perf_counter() - self._timer[self._currkey]
-                    self._results[self._currkey]["cpu_time"] = (
-                        run_time
-                        + self._results[self._currkey].get("cpu_time", 0)
-                    )
-
-            frame_locals = inspect.getargvalues(frame).locals
-            if (
-                isinstance(
-                    func_obj := frame_locals["args"][0],
-                    (_MethodProxy, _FunctionProxy),
-                )
-                or isinstance(func_obj, type)
-                and issubclass(func_obj, (_FinalProxy, _IntermediateProxy))
-            ):
-                func_name, start = self._call_stack.pop()
-                if arg is not None:
-                    key = "gpu" if arg[1] else "cpu"
-                    self._per_func_results[func_name][key].append(
-                        time.perf_counter() - start
-                    )
+            self._exit_call(frame, arg)
 
         return self._tracefunc
 
+    def _monitoring_line(self, code, lineno):
+        if code.co_filename != self._currfile:
+            return sys.monitoring.DISABLE
+        if threading.get_ident() == self._thread_id:
+            self._record_line(
+                lineno, linecache.getline(self._currfile, lineno)
+            )
+
+    def _monitoring_start(self, code, instruction_offset):
+        if threading.get_ident() == self._thread_id:
+            # The frame that is starting is the one calling us
+            self._enter_call(sys._getframe(1))
+
+    def _monitoring_return(self, code, instruction_offset, retval):
+        if threading.get_ident() == self._thread_id:
+            self._exit_call(sys._getframe(1), retval)
+
     @property
     def per_line_stats(self):
         list_data = []
@@ -214,6 +361,72 @@ class Profiler:
     def per_function_stats(self):
         return self._per_func_results
 
+    @property
+    def conversion_stats(self):
+        """
+        Conversions between fast and slow objects, as a list of
+        [line_no, line, proxy type, direction, count, bytes, time],
+        sorted by decreasing time.
+
+        `line_no` and `line` are None for conversions that didn't
+        happen on a profiled line.
+        """
+        list_data = []
+        for key, val in self._conversion_results.items():
+            currkey, proxy_type, direction = key
+            line_no, _, line = currkey if currkey is not None else (None,) * 3
+            list_data.append([line_no, line, proxy_type, direction, *val])
+        return sorted(list_data, key=operator.itemgetter(6), reverse=True)
+
+    def _conversion_totals_text(self):
+        count = nbytes = seconds = 0
+        for val in self._conversion_results.values():
+            count += val[0]
+            nbytes += val[1]
+            seconds += val[2]
+        return (
+            f"{count} GPU/CPU conversions moving {format_bytes(nbytes)} "
+            f"in {seconds:.3f} seconds"
+        )
+
+    def print_conversion_stats(self):
+        table = Table()
+        for col in (
+            "Line no.",
+            "Line",
+            "Type",
+            "Direction",
+            "Count",
+            "Bytes",
+            "Time(s)",
+        ):
+            table.add_column(col)
+        for (
+            line_no,
+            line,
+            proxy_type,
+            direction,
+            count,
+            nbytes,
+            seconds,
+        ) in self.conversion_stats:
+            table.add_row(
+                "" if line_no is None else str(line_no),
+                "" if line is None else Syntax(str(line), "python"),
+                proxy_type,
+                "GPU -> CPU" if direction == "fast_to_slow" else "CPU -> GPU",
+                str(count),
+                format_bytes(nbytes),
+                "{:.9f}".format(seconds),
+            )
+        table.title = f"""\n\
+        {self._conversion_totals_text()}
+
+        Conversion hotspots
+        """
+        console = Console()
+        console.print(table)
+
     def print_per_line_stats(self):
         table = Table()
         table.add_column("Line no.")
@@ -230,6 +443,7 @@ class Profiler:
         time_elapsed = self.end_time - self.start_time
         table.title = f"""\n\
         Total time elapsed: {time_elapsed:.3f} seconds
+        {self._conversion_totals_text()}
 
         Stats
         """
@@ -280,6 +494,7 @@ class Profiler:
         Total time elapsed: {time_elapsed:.3f} seconds
         {n_gpu_func_calls} GPU function calls in {total_gpu_time:.3f} seconds
         {n_cpu_func_calls} CPU function calls in {total_cpu_time:.3f} seconds
+        {self._conversion_totals_text()}
 
         Stats
         """
@@ -13,6 +13,8 @@ from fsspec.core import get_fs_token_paths
 
 import cudf
 from cudf.testing import assert_eq
+from cudf.utils import ioutils
+from cudf.utils.io_cache import get_io_cache
 
 moto = pytest.importorskip("moto", minversion="3.1.6")
 boto3 = pytest.importorskip("boto3")
@@ -548,3 +550,163 @@ def test_no_s3fs_on_cudf_import():
         cwd="/",
     )
     assert output.strip() == b"False"
+
+
+@pytest.mark.parametrize("bytes_per_thread", [32, 1024, 100_000])
+def test_fsspec_data_transfer(s3_base, bytes_per_thread):
+    fname = "test_fsspec_data_transfer.bin"
+    bucket = "transfer"
+    data = bytes(range(256)) * 40
+    with s3_context(
+        s3_base=s3_base, bucket=bucket, files={fname: data}
+    ) as s3fs:
+        got = ioutils._fsspec_data_transfer(
+            f"{bucket}/{fname}", fs=s3fs, bytes_per_thread=bytes_per_thread
+        )
+        assert isinstance(got, BytesIO)
+        assert got.getvalue() == data
+
+        with s3fs.open(f"{bucket}/{fname}", mode="rb") as f:
+            got = ioutils._fsspec_data_transfer(
+                f, bytes_per_thread=bytes_per_thread
+            )
+        assert isinstance(got, BytesIO)
+        assert got.getvalue() == data
+
+
+def test_fsspec_data_transfer_many(s3_base, s3so, monkeypatch):
+    bucket = "transfer-many"
+    files = {f"part.{i}.bin": bytes(range(i, 256)) * (i + 1) for i in range(8)}
+    # Less than a single range, which is then fetched alone
+    monkeypatch.setattr(ioutils, "_io_budget", ioutils._ByteBudget(500))
+    with s3_context(s3_base=s3_base, bucket=bucket, files=files) as s3fs:
+        got = ioutils._fsspec_data_transfer_many(
+            [f"{bucket}/{fname}" for fname in files],
+            s3fs,
+            bytes_per_thread=1000,
+        )
+        assert [buf.getvalue() for buf in got] == list(files.values())
+        assert ioutils._io_budget.inflight == 0
+
+        got, _ = ioutils.get_reader_filepath_or_buffer(
+            f"s3://{bucket}/part.*.bin",
+            compression=None,
+            storage_options=s3so,
+            bytes_per_thread=100,
+        )
+        assert [buf.getvalue() for buf in got] == list(files.values())
+
+
+@pytest.mark.parametrize("use_python_file_object", [False, True])
+def test_read_parquet_io_cache(
+    s3_base, s3so, pdf, tmp_path, use_python_file_object, monkeypatch
+):
+    monkeypatch.setattr(ioutils, "_transfer_models", {})
+    fname = "test_parquet_io_cache.parquet"
+    bucket = "parquet-io-cache"
+    url = f"s3://{bucket}/{fname}"
+    buffer = BytesIO()
+    pdf.to_parquet(path=buffer)
+    kwargs = {
+        "storage_options": s3so,
+        "bytes_per_thread": 128,
+        "use_python_file_object": use_python_file_object,
+        "open_file_options": {"precache_options": {"method": "parquet"}},
+    }
+
+    with cudf.option_context(
+        "io_cache_size", 256, "io_cache_directory", str(tmp_path)
+    ):
+        cache = get_io_cache()
+        with s3_context(
+            s3_base=s3_base, bucket=bucket, files={fname: buffer.getvalue()}
+        ):
+            assert_eq(pdf, cudf.read_parquet(url, **kwargs))
+            stats = cache.statistics()
+            assert stats["hits"] == 0
+            assert stats["misses"] > 0
+            # Ranges exceeding the memory limit are evicted to disk
+            assert stats["evictions"] > 0
+            assert stats["disk_nbytes"] > 0
+            samples = ioutils.coalescing_plans()["s3"]["samples"]
+            assert samples > 0
+
+            assert_eq(pdf, cudf.read_parquet(url, **kwargs))
+            stats = cache.statistics()
+            assert stats["hits"] == stats["misses"]
+            # Only the transfers missing the cache are measured
+            assert ioutils.coalescing_plans()["s3"]["samples"] == samples
+            assert stats["hit_rate"] == 0.5
+            # Cache a listing of the bucket in the filesystem, which is
+            # stale once the file is modified
+            fs = get_fs_token_paths(url, storage_options=s3so)[0]
+            assert fs.ls(bucket, detail=True)
+
+        # A modified file isn't served from the cache
+        expect = pdf.iloc[::-1]
+        buffer = BytesIO()
+        expect.to_parquet(path=buffer)
+        with s3_context(
+            s3_base=s3_base, bucket=bucket, files={fname: buffer.getvalue()}
+        ):
+            assert_eq(expect, cudf.read_parquet(url, **kwargs))
+            assert cache.statistics()["hits"] == stats["hits"]
+
+
+def test_open_remote_files_batched_precache(s3_base, s3so, pdf, monkeypatch):
+    monkeypatch.setattr(ioutils, "_transfer_models", {})
+    bucket = "parquet-batched"
+    buffer = BytesIO()
+    pdf.to_parquet(path=buffer)
+    files = {f"part.{i}.parquet": buffer.getvalue() for i in range(4)}
+    with s3_context(s3_base=s3_base, bucket=bucket, files=files):
+        fs = get_fs_token_paths(f"s3://{bucket}", storage_options=s3so)[0]
+        cat_ranges = fs.cat_ranges
+        calls = []
+
+        def counting_cat_ranges(paths, *args, **kwargs):
+            calls.append(paths)
+            return cat_ranges(paths, *args, **kwargs)
+
+        monkeypatch.setattr(fs, "cat_ranges", counting_cat_ranges)
+        got = ioutils._open_remote_files(
+            [f"{bucket}/{fname}" for fname in files],
+            fs,
+            precache_options={
+                "method": "parquet",
+                "row_groups": [[0], [0], [0], None],
+            },
+        )
+        for f in got:
+            assert_eq(pdf, pd.read_parquet(f))
+    # The footers, then the column chunks, of all files with the same
+    # row groups are collected at once
+    assert len(calls) == 4
+    assert sorted(len(paths) for paths in calls) == [1, 1, 3, 3]
+    # Each batch of concurrent requests is measured as one transfer
+    assert ioutils.coalescing_plans()["s3"]["samples"] == 4
+
+
+def test_coalescing_plan(monkeypatch):
+    monkeypatch.setattr(ioutils, "_transfer_models", {})
+    fs = s3fs.S3FileSystem()
+    assert ioutils._coalescing_plan("s3")["source"] == "default"
+    assert ioutils._merge_ranges([(0, 10), (70_000, 10)], fs=fs) == [
+        (0, 10),
+        (70_000, 10),
+    ]
+
+    # 10ms latency and 100MB/s
+    for nbytes in [1_000_000, 10_000_000, 1_000_000]:
+        ioutils._record_transfer(fs, nbytes, 0.01 + nbytes / 1e8)
+    plan = ioutils.coalescing_plans()["s3"]
+    assert plan["source"] == "measured"
+    assert plan["samples"] == 3
+    assert plan["latency"] == pytest.approx(0.01)
+    assert plan["bandwidth"] == pytest.approx(1e8)
+    assert plan["max_gap"] == pytest.approx(1_000_000, abs=1)
+    assert plan["max_block"] == pytest.approx(64_000_000, abs=64)
+    # A larger gap tolerance than the default merges the ranges
+    assert ioutils._merge_ranges([(0, 10), (70_000, 10)], fs=fs) == [
+        (0, 70_010)
+    ]
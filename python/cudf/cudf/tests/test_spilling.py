@@ -2,8 +2,10 @@
 from __future__ import annotations
 
 import contextlib
+import gc
 import importlib
 import random
+import threading
 import time
 import warnings
 import weakref
@@ -19,6 +21,7 @@ import rmm
 
 import cudf
 import cudf.core.buffer.spill_manager
+import cudf.core.buffer.spill_policy
 import cudf.options
 from cudf.core.abc import Serializable
 from cudf.core.buffer import (
@@ -27,6 +30,7 @@ from cudf.core.buffer import (
     as_buffer,
     get_spill_lock,
 )
+from cudf.core.buffer.spill_compression import get_codec
 from cudf.core.buffer.spill_manager import (
     SpillManager,
     get_global_manager,
@@ -34,6 +38,12 @@ from cudf.core.buffer.spill_manager import (
     set_global_manager,
     spill_on_demand_globally,
 )
+from cudf.core.buffer.spill_policy import (
+    SpillPolicy,
+    get_spill_policy,
+    register_spill_policy,
+)
+from cudf.core.buffer.spill_simulation import SimulatedDevice, replay
 from cudf.core.buffer.spillable_buffer import (
     SpillableBuffer,
     SpillableBufferOwner,
@@ -282,6 +292,21 @@ def test_environment_variables_device_limit(monkeypatch):
         assert manager.statistics.level == 0
 
 
+def test_environment_variables_host_limit(monkeypatch, tmp_path):
+    with _get_manager_in_env(
+        monkeypatch,
+        [
+            ("CUDF_SPILL", "on"),
+            ("CUDF_SPILL_ON_DEMAND", "off"),
+            ("CUDF_SPILL_HOST_LIMIT", "1000"),
+            ("CUDF_SPILL_DIRECTORY", str(tmp_path)),
+        ],
+    ) as manager:
+        assert isinstance(manager, SpillManager)
+        assert manager._host_memory_limit == 1000
+        assert manager.spill_directory == str(tmp_path)
+
+
 @pytest.mark.parametrize("level", (1, 2))
 def test_environment_variables_spill_stats(monkeypatch, level):
     with _get_manager_in_env(
@@ -328,6 +353,35 @@ def test_spill_device_memory(manager: SpillManager):
     assert single_column_df_data(df3).is_spilled
 
 
+def test_spill_device_memory_skips_locked(manager: SpillManager):
+    df1 = single_column_df()
+    df2 = single_column_df()
+    df3 = single_column_df()
+    buf1 = single_column_df_data(df1)
+    acquired = threading.Event()
+    release = threading.Event()
+
+    def hold_lock():
+        with buf1.lock:
+            acquired.set()
+            release.wait()
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(hold_lock)
+        acquired.wait()
+        try:
+            # The least recently accessed buffer is locked, the next
+            # candidates are spilled instead until the target is met
+            nbytes = gen_df_data_nbytes * 2
+            assert manager.spill_device_memory(nbytes=nbytes) == nbytes
+        finally:
+            release.set()
+        future.result()
+    assert not buf1.is_spilled
+    assert single_column_df_data(df2).is_spilled
+    assert single_column_df_data(df3).is_spilled
+
+
 def test_spill_to_device_limit(manager: SpillManager):
     df1 = single_column_df()
     df2 = single_column_df()
@@ -357,6 +411,227 @@ def test_zero_device_limit(manager: SpillManager):
     assert spilled_and_unspilled(manager) == (gen_df_data_nbytes * 2, 0)
 
 
+def test_incremental_accounting(manager: SpillManager):
+    def scan():
+        ret = {"gpu": 0, "cpu": 0, "disk": 0}
+        for buf in manager.buffers():
+            ret[buf.location] += buf.size
+        return ret
+
+    df1 = single_column_df()
+    df2 = single_column_df(target="cpu")
+    df3 = single_column_df()
+    assert scan() == manager._nbytes
+    single_column_df_data(df3).spill(target="disk")
+    assert scan() == manager._nbytes
+    df4 = df1 + df3
+    assert scan() == manager._nbytes
+    del df2
+    assert scan() == manager._nbytes
+    # Spilling visits the buffers in access order
+    df4.abs()
+    manager.spill_device_memory(nbytes=1)
+    assert single_column_df_data(df1).is_spilled
+    assert not single_column_df_data(df4).is_spilled
+    assert scan() == manager._nbytes
+    del df1, df3, df4
+    assert scan() == manager._nbytes == {"gpu": 0, "cpu": 0, "disk": 0}
+
+
+@pytest.mark.parametrize(
+    "manager", [{"spill_policy": "size_weighted_lru"}], indirect=True
+)
+def test_size_weighted_lru_policy(manager: SpillManager):
+    small = single_column_df()
+    large = cudf.DataFrame({"a": range(1000)})
+    manager.spill_device_memory(nbytes=1)
+    assert single_column_df_data(large).is_spilled
+    assert not single_column_df_data(small).is_spilled
+
+
+@pytest.mark.parametrize("manager", [{"spill_policy": "lfu"}], indirect=True)
+def test_lfu_policy(manager: SpillManager):
+    df1 = single_column_df()
+    df2 = single_column_df()
+    for _ in range(3):
+        df1.abs()
+    df2.abs()
+    manager.spill_device_memory(nbytes=1)
+    assert not single_column_df_data(df1).is_spilled
+    assert single_column_df_data(df2).is_spilled
+
+
+def test_register_spill_policy(monkeypatch):
+    class MostRecentlyUsed(SpillPolicy):
+        def order(self, buffers, *, location, statistics):
+            return reversed(list(buffers))
+
+    monkeypatch.setattr(
+        cudf.core.buffer.spill_policy,
+        "_SPILL_POLICIES",
+        dict(cudf.core.buffer.spill_policy._SPILL_POLICIES),
+    )
+    register_spill_policy("mru", MostRecentlyUsed)
+    assert isinstance(get_spill_policy("mru"), MostRecentlyUsed)
+    with pytest.raises(ValueError, match="Unknown spill policy"):
+        SpillManager(spill_policy="unknown")
+
+
+@pytest.mark.parametrize(
+    "manager",
+    [
+        {
+            "compression": "zlib",
+            "compression_threshold": 0,
+            "host_memory_limit": 0,
+            "statistic_level": 1,
+        }
+    ],
+    indirect=True,
+)
+def test_spill_compression(manager: SpillManager):
+    df = cudf.DataFrame({"a": [1] * 1000})
+    expect = df.to_pandas()
+    buf = df._data._data["a"].data.owner
+    manager.spill_device_memory(nbytes=1)
+    # Spilled compressed to host memory and then, because of the host
+    # limit, to disk
+    assert buf.location == "disk"
+    buf.spill(target="cpu")
+    assert buf.location_nbytes < buf.size
+    assert manager._nbytes["cpu"] == buf.location_nbytes
+    host_mem = buf.memoryview()
+    assert not host_mem.readonly
+    np.testing.assert_array_equal(
+        np.frombuffer(host_mem, dtype="int64"), expect["a"]
+    )
+    assert manager._nbytes["cpu"] == buf.size
+    assert_eq(df, expect)
+    nbytes, compressed, _, _ = manager.statistics.compression_totals["zlib"]
+    assert nbytes == buf.size
+    assert compressed < nbytes
+
+
+@pytest.mark.parametrize("name", ["zlib", "lz4", "zstd"])
+def test_spill_codec(name):
+    try:
+        codec = get_codec(name)
+    except ValueError as e:
+        pytest.skip(str(e))
+    data = memoryview(np.arange(10_000, dtype="int64")).cast("B")
+    ret = codec.decompress(codec.compress(data), data.nbytes)
+    assert not ret.readonly
+    assert ret == data
+
+
+@pytest.mark.parametrize(
+    "manager", [{"spill_watermark": 0, "statistic_level": 1}], indirect=True
+)
+def test_spill_watermark(manager: SpillManager):
+    df = single_column_df()
+    for _ in range(100):
+        if single_column_df_data(df).is_spilled:
+            break
+        time.sleep(0.1)
+    assert single_column_df_data(df).is_spilled
+    count, nbytes, _ = manager.statistics.background_totals["spill"]
+    assert count >= 1
+    assert nbytes >= gen_df_data_nbytes
+
+
+def test_spill_worker_stops_with_manager():
+    manager = SpillManager(spill_watermark=0)
+    worker = manager._worker
+    assert worker.is_alive()
+    del manager
+    gc.collect()
+    worker.join(timeout=10)
+    assert not worker.is_alive()
+
+
+@pytest.mark.parametrize("manager", [{"statistic_level": 1}], indirect=True)
+def test_prefetch(manager: SpillManager):
+    df1 = single_column_df(target="cpu")
+    df2 = single_column_df(target="cpu")
+    assert manager.prefetch(df1).result() == gen_df_data_nbytes
+    assert not single_column_df_data(df1).is_spilled
+    assert single_column_df_data(df2).is_spilled
+    assert manager.statistics.background_totals["prefetch"] == (
+        1,
+        gen_df_data_nbytes,
+        pytest.approx(0, abs=10),
+    )
+
+
+@pytest.mark.parametrize("spill_policy", ["lru", "lfu"])
+def test_simulated_replay(spill_policy):
+    # Buffer 0 is accessed more often, buffers 1 and 2 more recently
+    trace = [{"op": "alloc", "id": i, "nbytes": 100} for i in range(3)]
+    trace += [{"op": "access", "id": i} for i in (0, 0, 0, 1, 2)]
+    trace += [
+        {"op": "alloc", "id": 3, "nbytes": 100},
+        {"op": "access", "id": 0},
+        {"op": "free", "id": 2},
+    ]
+    device = SimulatedDevice(capacity=300)
+    report = replay(
+        trace, device, spill_policy=spill_policy, statistic_level=1
+    )
+    assert report["events"] == len(trace)
+    assert report["failed_allocations"] == 0
+    assert report["failed_accesses"] == 0
+    assert report["peak_device_nbytes"] <= 300
+    manager = report["manager"]
+    assert manager.buffers() == ()
+    assert manager._nbytes == {"gpu": 0, "cpu": 0, "disk": 0}
+    # Allocating buffer 3 spills buffer 0 with LRU, which is unspilled
+    # again (spilling buffer 1) on access. LFU spills buffer 1 instead.
+    spilled = report["spill_totals"]["gpu => cpu"]
+    unspilled = report["spill_totals"].get("cpu => gpu", 0)
+    if spill_policy == "lru":
+        assert (spilled, unspilled) == (200, 100)
+    else:
+        assert (spilled, unspilled) == (100, 0)
+    assert device.used == 0
+
+
+def test_spill_to_disk(manager: SpillManager):
+    df = single_column_df()
+    expect = df.to_pandas()
+    buf = single_column_df_data(df).owner
+    buf.spill(target="disk")
+    assert buf.location == "disk"
+    assert spilled_and_unspilled(manager) == (gen_df_data_nbytes, 0)
+    # Accessing the host memory maps the data back from disk
+    np.testing.assert_array_equal(
+        np.frombuffer(buf.memoryview(), dtype="int64"), [1, 2, 3]
+    )
+    assert buf.location == "cpu"
+    buf.spill(target="disk")
+    assert_eq(df, expect)
+    assert buf.location == "gpu"
+
+
+@pytest.mark.parametrize(
+    "manager",
+    [{"host_memory_limit": 0, "statistic_level": 1}],
+    indirect=True,
+)
+def test_spill_to_host_limit(manager: SpillManager, tmp_path):
+    manager.spill_directory = str(tmp_path)
+    df1 = single_column_df()
+    df2 = single_column_df()
+    manager.spill_device_memory(nbytes=1)
+    # Spilled to host memory and then, because of the host limit, to disk
+    assert single_column_df_data(df1).owner.location == "disk"
+    assert single_column_df_data(df2).owner.location == "gpu"
+    stats = manager.statistics
+    assert stats.spill_totals[("gpu", "cpu")][0] == gen_df_data_nbytes
+    assert stats.spill_totals[("cpu", "disk")][0] == gen_df_data_nbytes
+    assert_eq(df1, df2)
+    assert stats.spill_totals[("disk", "gpu")][0] == gen_df_data_nbytes
+
+
 def test_spill_df_index(manager: SpillManager):
     df = single_column_df()
     df.index = [1, 3, 2]  # use a materialized index
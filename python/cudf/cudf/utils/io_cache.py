@@ -0,0 +1,455 @@
+# Copyright (c) 2024, NVIDIA CORPORATION.
+
+"""
+Local cache of byte ranges read from remote filesystems.
+
+Enabled by the "io_cache_size" option, the cache keeps the byte ranges
+fetched by the remote transfer helpers of `cudf.utils.ioutils` in host
+memory, evicting the least recently used ranges to the directory of the
+"io_cache_directory" option, if any, and discarding them from there once
+the "io_cache_disk_size" option is exceeded.
+
+Ranges are keyed by the path of the file, its version (its ETag,
+generation or modification time, as reported by ``fs.info``), its size,
+and the offset and length of the range. The metadata of a file is
+queried once per read, so a modified file is never served from the
+cache. Files without version metadata are not cached.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable
+
+from fsspec.asyn import AsyncFileSystem, sync
+
+from cudf.options import get_option
+
+# Keys of `fs.info()` identifying the version of a file, by filesystem
+_VERSION_KEYS = (
+    "ETag",
+    "etag",
+    "generation",
+    "VersionId",
+    "version_id",
+    "md5Hash",
+    "LastModified",
+    "last_modified",
+    "mtime",
+    "updated",
+)
+
+_SUFFIX = ".range"
+
+
+def _file_version(info: dict) -> tuple | None:
+    # Return the version of a file from its metadata, or None if the
+    # filesystem doesn't report one
+    for key in _VERSION_KEYS:
+        value = info.get(key)
+        if value is not None:
+            return (key, str(value), info.get("size"))
+    return None
+
+
+class ByteRangeCache:
+    """Size-bounded LRU cache of byte ranges of remote files
+
+    Parameters
+    ----------
+    memory_limit : int
+        The maximum number of bytes kept in host memory.
+    directory : str, optional
+        The directory ranges evicted from host memory are written to.
+        Ranges already in the directory, e.g., written by another
+        process, are reused. If None, evicted ranges are discarded.
+    disk_limit : int, optional
+        The maximum number of bytes kept in `directory`. If None, there
+        is no limit.
+    """
+
+    def __init__(
+        self,
+        memory_limit: int,
+        directory: str | None = None,
+        disk_limit: int | None = None,
+    ):
+        self.memory_limit = memory_limit
+        self.directory = directory
+        self.disk_limit = disk_limit
+        self._lock = threading.Lock()
+        self._memory: OrderedDict[tuple, bytes] = OrderedDict()
+        self._memory_nbytes = 0
+        # Map file name in `directory` to the number of bytes of the range
+        self._disk: OrderedDict[str, int] = OrderedDict()
+        self._disk_nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.hit_nbytes = 0
+        self.miss_nbytes = 0
+        self.evictions = 0
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+            self._scan_directory()
+
+    def _scan_directory(self) -> None:
+        # Index the ranges left by previous processes, oldest first
+        entries = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.name.endswith(_SUFFIX) and entry.is_file():
+                    st = entry.stat()
+                    entries.append((st.st_mtime, entry.name, st.st_size))
+        for _, name, nbytes in sorted(entries):
+            self._disk[name] = nbytes
+            self._disk_nbytes += nbytes
+        self._evict_disk()
+
+    @staticmethod
+    def _filename(key: tuple) -> str:
+        return hashlib.sha256(repr(key).encode()).hexdigest() + _SUFFIX
+
+    def get(self, key: tuple) -> bytes | None:
+        """Get the range `key`, None if it isn't cached"""
+        name = self._filename(key)
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+            elif name in self._disk:
+                self._disk.move_to_end(name)
+        if data is None and self.directory is not None:
+            try:
+                with open(os.path.join(self.directory, name), "rb") as f:
+                    data = f.read()
+            except FileNotFoundError:
+                # Evicted concurrently, or never written
+                pass
+        with self._lock:
+            if data is None:
+                self.misses += 1
+                self.miss_nbytes += key[-1]
+            else:
+                self.hits += 1
+                self.hit_nbytes += len(data)
+        return data
+
+    def put(self, key: tuple, data: bytes) -> None:
+        """Cache `data`, the range `key`"""
+        data = bytes(data)
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return
+            self._memory[key] = data
+            self._memory_nbytes += len(data)
+            evicted = self._evict_memory()
+        for evicted_key, evicted_data in evicted:
+            self._write(evicted_key, evicted_data)
+
+    def _evict_memory(self) -> list[tuple[tuple, bytes]]:
+        # Pop the least recently used ranges exceeding the memory limit,
+        # the caller writes them to disk without holding the lock
+        ret = []
+        while self._memory_nbytes > self.memory_limit and self._memory:
+            key, data = self._memory.popitem(last=False)
+            self._memory_nbytes -= len(data)
+            self.evictions += 1
+            if self.directory is not None:
+                ret.append((key, data))
+        return ret
+
+    def _write(self, key: tuple, data: bytes) -> None:
+        name = self._filename(key)
+        if self.disk_limit is not None and len(data) > self.disk_limit:
+            return
+        # Write to a temporary file first, so that concurrent readers
+        # (including other processes) never see a partial range
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, os.path.join(self.directory, name))
+        except BaseException:
+            try:
+                os.remove(tmp)
+            except FileNotFoundError:
+                pass
+            raise
+        with self._lock:
+            self._disk_nbytes += len(data) - self._disk.pop(name, 0)
+            self._disk[name] = len(data)
+            self._evict_disk()
+
+    def _evict_disk(self) -> None:
+        if self.disk_limit is None:
+            return
+        while self._disk_nbytes > self.disk_limit and self._disk:
+            name, nbytes = self._disk.popitem(last=False)
+            self._disk_nbytes -= nbytes
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                pass
+
+    def clear(self) -> None:
+        """Remove all cached ranges and reset the statistics"""
+        with self._lock:
+            self._memory.clear()
+            self._memory_nbytes = 0
+            names = list(self._disk)
+            self._disk.clear()
+            self._disk_nbytes = 0
+            self.hits = self.misses = self.evictions = 0
+            self.hit_nbytes = self.miss_nbytes = 0
+        for name in names:
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                pass
+
+    def statistics(self) -> dict[str, Any]:
+        """Return the statistics of the cache
+
+        Return
+        ------
+        dict
+            A dict with the keys ``hits``, ``misses``, ``hit_rate`` (the
+            fraction of lookups that were hits), ``hit_nbytes`` and
+            ``miss_nbytes`` (the bytes served from the cache and read
+            from the filesystem), ``evictions`` (the ranges evicted from
+            host memory), ``memory_nbytes`` and ``disk_nbytes``.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "hit_nbytes": self.hit_nbytes,
+                "miss_nbytes": self.miss_nbytes,
+                "evictions": self.evictions,
+                "memory_nbytes": self._memory_nbytes,
+                "disk_nbytes": self._disk_nbytes,
+            }
+
+    def __repr__(self) -> str:
+        stats = self.statistics()
+        return (
+            f"<ByteRangeCache memory={stats['memory_nbytes']}/"
+            f"{self.memory_limit} disk={stats['disk_nbytes']} "
+            f"hit_rate={stats['hit_rate']:.2f}>"
+        )
+
+
+class CachedFileSystem:
+    """Filesystem serving `cat_file` and `cat_ranges` from a cache
+
+    Wraps an fsspec filesystem for the duration of a read, every other
+    attribute is the one of the wrapped filesystem. The metadata of each
+    file is queried once, on first use, to validate the cached ranges.
+    It bypasses the listings cached by the filesystem, which may be
+    stale.
+
+    `cat_file` and `cat_ranges` take an optional `on_fetch` callback,
+    called with the number of bytes read from the wrapped filesystem by
+    the call, i.e., missing the cache, and the duration in seconds of
+    that read, if any.
+
+    Parameters
+    ----------
+    fs : fsspec.AbstractFileSystem
+        The filesystem to read from.
+    cache : ByteRangeCache
+        The cache.
+    """
+
+    def __init__(self, fs, cache: ByteRangeCache):
+        self.fs = fs
+        self.cache = cache
+        self._infos: dict[str, dict] = {}
+
+    def __getattr__(self, name):
+        return getattr(self.fs, name)
+
+    def info(self, path, **kwargs):
+        path = self.fs._strip_protocol(path)
+        ret = self._infos.get(path)
+        if ret is None:
+            # Not all filesystems take `refresh=True`, but all can drop
+            # their cached listings of a path
+            self.fs.invalidate_cache(path)
+            ret = self._infos[path] = self.fs.info(path, **kwargs)
+        return ret
+
+    def _fetch_infos(self, paths) -> None:
+        # Query the metadata of all `paths` not queried yet at once,
+        # concurrently if the filesystem is asynchronous. Errors are
+        # left for `info()` to raise.
+        missing = list(
+            dict.fromkeys(
+                path
+                for path in map(self.fs._strip_protocol, paths)
+                if path not in self._infos
+            )
+        )
+        if (
+            len(missing) < 2
+            or not isinstance(self.fs, AsyncFileSystem)
+            or self.fs.asynchronous
+        ):
+            return
+        for path in missing:
+            self.fs.invalidate_cache(path)
+
+        async def gather():
+            return await asyncio.gather(
+                *(self.fs._info(path) for path in missing),
+                return_exceptions=True,
+            )
+
+        for path, info in zip(missing, sync(self.fs.loop, gather)):
+            if not isinstance(info, BaseException):
+                self._infos[path] = info
+
+    def size(self, path):
+        return self.info(path).get("size")
+
+    def sizes(self, paths):
+        self._fetch_infos(paths)
+        return [self.size(path) for path in paths]
+
+    def _key(self, path, start, end) -> tuple:
+        # Return the cache key of a range and its normalized start and
+        # end, the key is None if the file can't be cached
+        info = self.info(path)
+        size = info.get("size")
+        if size is None:
+            return None, start, end
+        start = 0 if start is None else start
+        end = size if end is None else end
+        if start < 0:
+            start = max(size + start, 0)
+        if end < 0:
+            end = size + end
+        start, end = min(start, size), max(min(end, size), start)
+        version = _file_version(info)
+        if version is None:
+            return None, start, end
+        path = self.fs._strip_protocol(path)
+        key = (str(self.fs.protocol), path, version, start, end - start)
+        return key, start, end
+
+    def cat_file(
+        self,
+        path,
+        start=None,
+        end=None,
+        on_fetch: Callable[[int, float], None] | None = None,
+        **kwargs,
+    ):
+        key, start, end = self._key(path, start, end)
+        data = None if key is None else self.cache.get(key)
+        if data is None:
+            start_time = time.perf_counter()
+            data = self.fs.cat_file(path, start=start, end=end, **kwargs)
+            if on_fetch is not None:
+                on_fetch(len(data), time.perf_counter() - start_time)
+            if key is not None:
+                self.cache.put(key, data)
+        return data
+
+    def cat_ranges(
+        self,
+        paths,
+        starts,
+        ends,
+        *args,
+        on_fetch: Callable[[int, float], None] | None = None,
+        **kwargs,
+    ):
+        if not isinstance(starts, list):
+            starts = [starts] * len(paths)
+        if not isinstance(ends, list):
+            ends = [ends] * len(paths)
+        ret: list = [None] * len(paths)
+        keys: list = [None] * len(paths)
+        missing = []
+        self._fetch_infos(paths)
+        for i, (path, start, end) in enumerate(zip(paths, starts, ends)):
+            key, start, end = self._key(path, start, end)
+            if key is not None:
+                ret[i] = self.cache.get(key)
+                keys[i] = key
+            if ret[i] is None:
+                missing.append((i, path, start, end))
+        if missing:
+            # Fetch all missing ranges at once, to keep the concurrency
+            # of the wrapped filesystem
+            _, mpaths, mstarts, mends = map(list, zip(*missing))
+            start_time = time.perf_counter()
+            datas = self.fs.cat_ranges(mpaths, mstarts, mends, *args, **kwargs)
+            seconds = time.perf_counter() - start_time
+            nbytes = 0
+            for (i, *_), data in zip(missing, datas):
+                ret[i] = data
+                if isinstance(data, bytes):
+                    nbytes += len(data)
+                    if keys[i] is not None:
+                        self.cache.put(keys[i], data)
+            if on_fetch is not None:
+                on_fetch(nbytes, seconds)
+        return ret
+
+
+_cache: ByteRangeCache | None = None
+_cache_config: tuple | None = None
+_cache_lock = threading.Lock()
+
+
+def get_io_cache() -> ByteRangeCache | None:
+    """Get the cache configured by the "io_cache_*" options
+
+    Return
+    ------
+    ByteRangeCache or None
+        The cache, None if disabled. It is replaced when the options
+        change.
+    """
+    global _cache, _cache_config
+    config = (
+        get_option("io_cache_size"),
+        get_option("io_cache_directory"),
+        get_option("io_cache_disk_size"),
+    )
+    if config[0] is None or config[0] <= 0:
+        return None
+    with _cache_lock:
+        if _cache is None or _cache_config != config:
+            _cache = ByteRangeCache(*config)
+            _cache_config = config
+        return _cache
+
+
+def cached_filesystem(fs):
+    """Wrap `fs` in a `CachedFileSystem` if the cache is enabled
+
+    Local filesystems and filesystems already wrapped are returned as-is.
+    """
+    if fs is None or isinstance(fs, CachedFileSystem):
+        return fs
+    protocol = fs.protocol
+    if isinstance(protocol, str):
+        protocol = (protocol,)
+    if "file" in protocol or "local" in protocol:
+        return fs
+    cache = get_io_cache()
+    if cache is None:
+        return fs
+    return CachedFileSystem(fs, cache)
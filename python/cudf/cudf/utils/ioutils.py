@@ -2,21 +2,25 @@
 
 import datetime
 import os
+import threading
+import time
 import urllib
 import warnings
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import partial
 from io import BufferedWriter, BytesIO, IOBase, TextIOWrapper
-from threading import Thread
 
 import fsspec
 import fsspec.implementations.local
-import numpy as np
 import pandas as pd
 from fsspec.core import get_fs_token_paths
 from pyarrow import PythonFile as ArrowPythonFile
 from pyarrow.lib import NativeFile
 
 from cudf.core._compat import PANDAS_LT_300
+from cudf.options import _env_get_int
 from cudf.utils.docutils import docfmt_partial
+from cudf.utils.io_cache import CachedFileSystem, cached_filesystem
 
 try:
     import fsspec.parquet as fsspec_parquet
@@ -26,6 +30,21 @@ except ImportError:
 
 
 _BYTES_PER_THREAD_DEFAULT = 256 * 1024 * 1024
+# Maximum number of threads transferring remote data
+_IO_MAX_WORKERS = _env_get_int(
+    "CUDF_IO_MAX_WORKERS", min(32, (os.cpu_count() or 1) + 4)
+)
+# Coalescing of byte ranges until transfers of a filesystem are measured
+_MAX_GAP_DEFAULT = 64_000
+_MAX_BLOCK_DEFAULT = 256_000_000
+# Bounds of the coalescing parameters derived from measured transfers
+_MAX_GAP_LIMITS = (4_096, 64 * 1024 * 1024)
+_MAX_BLOCK_LIMITS = (8 * 1024 * 1024, 1024 * 1024 * 1024)
+# Maximum number of bytes requested but not yet transferred by all remote
+# data transfers, 0 for no limit
+_IO_MAX_INFLIGHT_BYTES = _env_get_int(
+    "CUDF_IO_MAX_INFLIGHT_BYTES", 1024 * 1024 * 1024
+)
 _ROW_GROUP_SIZE_BYTES_DEFAULT = 128 * 1024 * 1024
 
 _docstring_remote_sources = """
@@ -1605,6 +1624,65 @@ def _set_context(obj, stack):
     return stack.enter_context(obj)
 
 
+# Options of `fsspec.parquet.open_parquet_file` determining the byte
+# ranges to collect
+_PARQUET_BYTE_RANGE_OPTIONS = frozenset(
+    {
+        "metadata",
+        "columns",
+        "engine",
+        "max_gap",
+        "max_block",
+        "footer_sample_size",
+    }
+)
+
+
+def _open_parquet_files(paths, fs, row_groups, precache_options, **kwargs):
+    # Open the parquet files `paths` like `fsspec.parquet.open_parquet_file`
+    # but collect the "known" byte ranges of all files at once: the footers
+    # of all files with one `cat_ranges` call, then the column chunks of
+    # all files with another. Files are grouped by their row groups since
+    # these apply to all the files of a call. Return None if the options
+    # aren't supported by the batched path.
+    get_byte_ranges = getattr(fsspec_parquet, "_get_parquet_byte_ranges", None)
+    if (
+        get_byte_ranges is None
+        or not _PARQUET_BYTE_RANGE_OPTIONS.issuperset(precache_options)
+        or precache_options.get("columns", None) == []
+    ):
+        return None
+
+    groups = {}
+    for i, rgs in enumerate(row_groups):
+        key = None if rgs is None else tuple(rgs)
+        groups.setdefault(key, []).append(i)
+
+    data = {}
+    for indices in groups.values():
+        group_paths = [paths[i] for i in indices]
+        data.update(
+            get_byte_ranges(
+                group_paths,
+                fs,
+                row_groups=row_groups[indices[0]],
+                **precache_options,
+            )
+        )
+
+    cache_options = kwargs.pop("cache_options", {})
+    return [
+        fs.open(
+            path,
+            mode="rb",
+            cache_type="parts",
+            cache_options={**cache_options, "data": data.get(path, {})},
+            **kwargs,
+        )
+        for path in paths
+    ]
+
+
 def _open_remote_files(
     paths,
     fs,
@@ -1662,12 +1740,25 @@ def _open_remote_files(
         precache = None
 
     if precache == "parquet":
+        # Coalesce byte ranges according to the measured transfers of `fs`
+        # unless specified
+        plan = _coalescing_plan(_protocol_name(fs))
+        precache_options.setdefault("max_gap", plan["max_gap"])
+        precache_options.setdefault("max_block", plan["max_block"])
+        # Serve the byte ranges collected by `open_parquet_file` from the
+        # cache, if enabled, and measure the transfers of the others
+        fs = _TimedFileSystem(cached_filesystem(fs))
         # Use fsspec.parquet module.
-        # TODO: Use `cat_ranges` to collect "known"
-        # parts for all files at once.
         row_groups = precache_options.pop("row_groups", None) or (
             [None] * len(paths)
         )
+        files = _open_parquet_files(
+            paths, fs, row_groups, precache_options, **kwargs
+        )
+        if files is not None:
+            return [
+                ArrowPythonFile(_set_context(f, context_stack)) for f in files
+            ]
         return [
             ArrowPythonFile(
                 _set_context(
@@ -1810,18 +1901,19 @@ def get_reader_filepath_or_buffer(
                     fs,
                     **(open_file_options or {}),
                 )
-            else:
+            elif len(paths) == 1:
                 path_or_data = [
-                    BytesIO(
-                        _fsspec_data_transfer(
-                            fpath,
-                            fs=fs,
-                            mode=mode,
-                            bytes_per_thread=bytes_per_thread,
-                        )
+                    _fsspec_data_transfer(
+                        paths[0],
+                        fs=fs,
+                        mode=mode,
+                        bytes_per_thread=bytes_per_thread,
                     )
-                    for fpath in paths
                 ]
+            else:
+                path_or_data = _fsspec_data_transfer_many(
+                    paths, fs, bytes_per_thread=bytes_per_thread
+                )
             if len(path_or_data) == 1:
                 path_or_data = path_or_data[0]
 
@@ -1831,10 +1923,8 @@ def get_reader_filepath_or_buffer(
         if use_python_file_object:
             path_or_data = ArrowPythonFile(path_or_data)
         else:
-            path_or_data = BytesIO(
-                _fsspec_data_transfer(
-                    path_or_data, mode=mode, bytes_per_thread=bytes_per_thread
-                )
+            path_or_data = _fsspec_data_transfer(
+                path_or_data, mode=mode, bytes_per_thread=bytes_per_thread
             )
 
     return path_or_data, compression
@@ -2076,6 +2166,234 @@ def _ensure_filesystem(passed_filesystem, path, storage_options):
 #
 
 
+_io_executor = None
+_io_executor_lock = threading.Lock()
+
+
+def _get_io_executor():
+    # The thread pool shared by all remote data transfers, bounded by
+    # `CUDF_IO_MAX_WORKERS`
+    global _io_executor
+    if _io_executor is None:
+        with _io_executor_lock:
+            if _io_executor is None:
+                _io_executor = ThreadPoolExecutor(
+                    max_workers=max(_IO_MAX_WORKERS, 1),
+                    thread_name_prefix="cudf-io",
+                )
+    return _io_executor
+
+
+class _ByteBudget:
+    # Bound the number of bytes in flight, i.e., requested from a remote
+    # filesystem but not yet copied to their destination. A request
+    # larger than the limit is allowed when nothing else is in flight.
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.inflight = 0
+        self._cond = threading.Condition()
+
+    def acquire(self, nbytes):
+        # Block until `nbytes` fit in the budget, return the number of
+        # bytes to `release()` once transferred
+        if self.limit <= 0:
+            return 0
+        nbytes = min(nbytes, self.limit)
+        with self._cond:
+            self._cond.wait_for(lambda: self.inflight + nbytes <= self.limit)
+            self.inflight += nbytes
+        return nbytes
+
+    def release(self, nbytes):
+        if nbytes > 0:
+            with self._cond:
+                self.inflight -= nbytes
+                self._cond.notify_all()
+
+
+# Shared by all remote data transfers
+_io_budget = _ByteBudget(_IO_MAX_INFLIGHT_BYTES)
+
+
+class _TransferModel:
+    # Running least-squares fit of the duration of the transfers of a
+    # filesystem, `seconds = latency + nbytes / bandwidth`
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.count = 0
+        self._sum_x = self._sum_y = self._sum_xx = self._sum_xy = 0.0
+
+    def record(self, nbytes, seconds):
+        with self._lock:
+            self.count += 1
+            self._sum_x += nbytes
+            self._sum_y += seconds
+            self._sum_xx += nbytes * nbytes
+            self._sum_xy += nbytes * seconds
+
+    def estimate(self):
+        # Return the latency in seconds and the bandwidth in bytes per
+        # second, or None if the transfers don't determine them (too few
+        # or all of the same size)
+        with self._lock:
+            n, sx, sy = self.count, self._sum_x, self._sum_y
+            sxx, sxy = self._sum_xx, self._sum_xy
+        denom = n * sxx - sx * sx
+        # Relative bound, rounding errors leave `denom` slightly positive
+        # when all sizes are the same
+        if n < 2 or denom <= 1e-9 * n * sxx:
+            return None
+        slope = (n * sxy - sx * sy) / denom
+        if slope <= 0:
+            return None
+        latency = max((sy - slope * sx) / n, 0.0)
+        return latency, 1 / slope
+
+
+_transfer_models = {}
+_transfer_models_lock = threading.Lock()
+
+
+def _protocol_name(fs):
+    protocol = fs.protocol
+    return protocol if isinstance(protocol, str) else protocol[0]
+
+
+def _record_transfer(fs, nbytes, seconds):
+    # Record a transfer of `nbytes` from `fs` that took `seconds`
+    protocol = _protocol_name(fs)
+    model = _transfer_models.get(protocol)
+    if model is None:
+        with _transfer_models_lock:
+            model = _transfer_models.setdefault(protocol, _TransferModel())
+    model.record(nbytes, seconds)
+
+
+class _TransferTimer:
+    # Context manager recording the `nbytes` bytes, set by the caller,
+    # fetched from `fs` within it as a single transfer, see
+    # `_record_transfer`. Concurrent requests thus count as one, rather
+    # than each taking longer by sharing bandwidth.
+
+    def __init__(self, fs):
+        self.fs = fs
+        self.nbytes = 0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        seconds = time.perf_counter() - self._start
+        if exc_type is None and self.nbytes > 0:
+            _record_transfer(self.fs, self.nbytes, seconds)
+
+
+class _TimedFileSystem:
+    # Filesystem recording each `cat_ranges` call, whose requests are
+    # concurrent, as a single transfer. Every other attribute is the one
+    # of the wrapped filesystem.
+
+    def __init__(self, fs):
+        self.fs = fs
+
+    def __getattr__(self, name):
+        return getattr(self.fs, name)
+
+    def cat_ranges(self, paths, starts, ends, *args, **kwargs):
+        if isinstance(self.fs, CachedFileSystem):
+            # Only the ranges missing the cache are transferred
+            return self.fs.cat_ranges(
+                paths,
+                starts,
+                ends,
+                *args,
+                on_fetch=partial(_record_transfer, self.fs),
+                **kwargs,
+            )
+        with _TransferTimer(self.fs) as timer:
+            ret = self.fs.cat_ranges(paths, starts, ends, *args, **kwargs)
+            timer.nbytes = sum(len(d) for d in ret if isinstance(d, bytes))
+        return ret
+
+
+def _clip(value, limits):
+    return min(max(value, limits[0]), limits[1])
+
+
+def _coalescing_plan(protocol):
+    # Return the parameters of the coalescing of byte ranges read with
+    # the filesystem `protocol`, see `coalescing_plans`
+    model = _transfer_models.get(protocol)
+    estimate = None if model is None else model.estimate()
+    if estimate is None:
+        return {
+            "protocol": protocol,
+            "source": "default",
+            "samples": 0 if model is None else model.count,
+            "latency": None,
+            "bandwidth": None,
+            "max_gap": _MAX_GAP_DEFAULT,
+            "max_block": _MAX_BLOCK_DEFAULT,
+        }
+    latency, bandwidth = estimate
+    # Reading a gap is cheaper than a separate request when it takes less
+    # time than the latency, i.e., up to the bandwidth-delay product.
+    # Blocks are large enough for the latency to be at most ~1/64 of the
+    # duration of their transfer.
+    bdp = latency * bandwidth
+    max_gap = int(_clip(bdp, _MAX_GAP_LIMITS))
+    max_block = int(max(_clip(64 * bdp, _MAX_BLOCK_LIMITS), max_gap))
+    return {
+        "protocol": protocol,
+        "source": "measured",
+        "samples": model.count,
+        "latency": latency,
+        "bandwidth": bandwidth,
+        "max_gap": max_gap,
+        "max_block": max_block,
+    }
+
+
+def coalescing_plans():
+    """
+    Return the coalescing of remote byte ranges chosen per filesystem.
+
+    Byte ranges of remote files (e.g., Parquet column chunks) separated
+    by at most ``max_gap`` bytes are read by a single request of at most
+    ``max_block`` bytes. Both are derived from the latency and bandwidth
+    of the transfers measured so far for each filesystem protocol, or
+    are 64000 and 256000000 before these are known. They can be
+    overridden by the ``max_gap`` and ``max_block`` entries of the
+    ``precache_options`` of ``open_file_options``.
+
+    Returns
+    -------
+    dict
+        Mapping of filesystem protocol to a dict with the keys
+        ``protocol``, ``source`` (``"measured"`` or ``"default"``),
+        ``samples`` (the number of transfers measured), ``latency`` (in
+        seconds), ``bandwidth`` (in bytes per second), ``max_gap`` and
+        ``max_block``.
+    """
+    with _transfer_models_lock:
+        protocols = list(_transfer_models)
+    return {protocol: _coalescing_plan(protocol) for protocol in protocols}
+
+
+def _allocate_bytesio(nbytes):
+    # Return a `BytesIO` of `nbytes` bytes to be filled in place through
+    # `getbuffer()`. Unlike `BytesIO(buffer)`, the data is not copied.
+    buf = BytesIO()
+    if nbytes > 0:
+        buf.seek(nbytes - 1)
+        buf.write(b"\0")
+        buf.seek(0)
+    return buf
+
+
 def _fsspec_data_transfer(
     path_or_fob,
     fs=None,
@@ -2093,6 +2411,7 @@ def _fsspec_data_transfer(
         raise ValueError(
             "fs must be defined if `path_or_fob` is not file-like"
         )
+    fs = cached_filesystem(fs)
 
     # Calculate total file size
     if file_like:
@@ -2101,35 +2420,83 @@ def _fsspec_data_transfer(
         except AttributeError:
             # If we cannot find the size of path_or_fob
             # just read it.
-            return path_or_fob.read()
+            return BytesIO(path_or_fob.read())
     file_size = file_size or fs.size(path_or_fob)
 
     # Check if a direct read makes the most sense
     if bytes_per_thread >= file_size:
         if file_like:
-            return path_or_fob.read()
-        else:
-            return fs.open(path_or_fob, mode=mode, cache_type="all").read()
+            return BytesIO(path_or_fob.read())
+        if isinstance(fs, CachedFileSystem):
+            return BytesIO(
+                fs.cat_file(
+                    path_or_fob, on_fetch=partial(_record_transfer, fs)
+                )
+            )
+        with _TransferTimer(fs) as timer:
+            data = fs.open(path_or_fob, mode=mode, cache_type="all").read()
+            timer.nbytes = len(data)
+        return BytesIO(data)
 
     # Threaded read into "local" buffer
-    buf = np.zeros(file_size, dtype="b")
+    buf = _allocate_bytesio(file_size)
 
     byte_ranges = [
         (b, min(bytes_per_thread, file_size - b))
         for b in range(0, file_size, bytes_per_thread)
     ]
-    _read_byte_ranges(
-        path_or_fob,
-        byte_ranges,
-        buf,
-        fs=fs,
-    )
+    with buf.getbuffer() as local_buffer:
+        _read_byte_ranges(
+            path_or_fob,
+            byte_ranges,
+            local_buffer,
+            fs=fs,
+        )
 
-    return buf.tobytes()
+    return buf
 
 
-def _merge_ranges(byte_ranges, max_block=256_000_000, max_gap=64_000):
-    # Simple utility to merge small/adjacent byte ranges
+def _fsspec_data_transfer_many(
+    paths,
+    fs,
+    bytes_per_thread=_BYTES_PER_THREAD_DEFAULT,
+):
+    # Transfer the remote files `paths` to a list of `BytesIO`, fetching
+    # all files concurrently. Like `_fsspec_data_transfer`, each file is
+    # split into ranges of `bytes_per_thread` bytes.
+    if bytes_per_thread is None:
+        bytes_per_thread = _BYTES_PER_THREAD_DEFAULT
+    bytes_per_thread = max(bytes_per_thread, 1)
+
+    fs = cached_filesystem(fs)
+    sizes = fs.sizes(paths)
+    bufs = [_allocate_bytesio(size) for size in sizes]
+    local_buffers = [buf.getbuffer() for buf in bufs]
+    blocks = (
+        (path, local_buffer, offset, min(bytes_per_thread, size - offset))
+        for path, local_buffer, size in zip(paths, local_buffers, sizes)
+        for offset in range(0, size, bytes_per_thread)
+    )
+    try:
+        _transfer_blocks(fs, blocks)
+    finally:
+        for local_buffer in local_buffers:
+            local_buffer.release()
+    return bufs
+
+
+def _merge_ranges(byte_ranges, max_block=None, max_gap=None, fs=None):
+    # Simple utility to merge small/adjacent byte ranges. Unless given,
+    # `max_block` and `max_gap` are those planned for `fs`, see
+    # `coalescing_plans`
+    if max_block is None or max_gap is None:
+        plan = (
+            {"max_block": _MAX_BLOCK_DEFAULT, "max_gap": _MAX_GAP_DEFAULT}
+            if fs is None
+            else _coalescing_plan(_protocol_name(fs))
+        )
+        max_block = plan["max_block"] if max_block is None else max_block
+        max_gap = plan["max_gap"] if max_gap is None else max_gap
     new_ranges = []
     if not byte_ranges:
         # Early return
@@ -2150,21 +2517,40 @@ def _merge_ranges(byte_ranges, max_block=256_000_000, max_gap=64_000):
 
 
 def _assign_block(fs, path_or_fob, local_buffer, offset, nbytes):
+    # Copy a byte range into `local_buffer`, return the number of bytes
+    # fetched from `fs`, i.e., 0 for a hit of a `CachedFileSystem`
     if fs is None:
         # We have an open fsspec file object
         path_or_fob.seek(offset)
-        local_buffer[offset : offset + nbytes] = np.frombuffer(
-            path_or_fob.read(nbytes),
-            dtype="b",
+        dst = local_buffer[offset : offset + nbytes]
+        if not hasattr(path_or_fob, "readinto"):
+            dst[:] = path_or_fob.read(nbytes)
+            return
+        # Read directly into the buffer, `readinto` may read less
+        while dst.nbytes > 0:
+            n = path_or_fob.readinto(dst)
+            if not n:
+                raise EOFError(
+                    f"Unexpected end of file reading {nbytes} bytes "
+                    f"at offset {offset}"
+                )
+            dst = dst[n:]
+        return nbytes
+    elif isinstance(fs, CachedFileSystem):
+        fetched = []
+        local_buffer[offset : offset + nbytes] = fs.cat_file(
+            path_or_fob,
+            start=offset,
+            end=offset + nbytes,
+            on_fetch=lambda n, _: fetched.append(n),
         )
+        return sum(fetched)
     else:
         # We have an fsspec filesystem and a path
-        with fs.open(path_or_fob, mode="rb", cache_type="none") as fob:
-            fob.seek(offset)
-            local_buffer[offset : offset + nbytes] = np.frombuffer(
-                fob.read(nbytes),
-                dtype="b",
-            )
+        local_buffer[offset : offset + nbytes] = fs.cat_file(
+            path_or_fob, start=offset, end=offset + nbytes
+        )
+        return nbytes
 
 
 def _read_byte_ranges(
@@ -2174,19 +2560,63 @@ def _read_byte_ranges(
     fs=None,
 ):
     # Simple utility to copy remote byte ranges
-    # into a local buffer for IO in libcudf
-    workers = []
-    for offset, nbytes in ranges:
-        if len(ranges) > 1:
-            workers.append(
-                Thread(
-                    target=_assign_block,
-                    args=(fs, path_or_fob, local_buffer, offset, nbytes),
-                )
-            )
-            workers[-1].start()
-        else:
+    # into a local buffer (a writable memoryview) for IO in libcudf
+    if fs is None:
+        # An open file object cannot be read concurrently
+        for offset, nbytes in ranges:
             _assign_block(fs, path_or_fob, local_buffer, offset, nbytes)
+        return
+    if len(ranges) == 1:
+        # Not worth a round trip through the thread pool
+        ((offset, nbytes),) = ranges
+        with _TransferTimer(fs) as timer:
+            timer.nbytes = _assign_block(
+                fs, path_or_fob, local_buffer, offset, nbytes
+            )
+        return
+
+    _transfer_blocks(
+        fs,
+        (
+            (path_or_fob, local_buffer, offset, nbytes)
+            for offset, nbytes in ranges
+        ),
+    )
+
+
+def _transfer_blocks(fs, blocks):
+    # Copy the byte ranges `blocks`, tuples of (path, local_buffer, offset,
+    # nbytes), on the shared thread pool within the shared byte budget.
+    # All blocks are submitted from the calling thread, tasks never submit
+    # tasks themselves so they can't deadlock waiting for a worker. The
+    # blocks are recorded as a single transfer, see `_TransferTimer`.
+    with _TransferTimer(fs) as timer:
+        _submit_blocks(fs, blocks, timer)
 
-    for worker in workers:
-        worker.join()
+
+def _submit_blocks(fs, blocks, timer):
+    executor = _get_io_executor()
+    futures = []
+    try:
+        for path, local_buffer, offset, nbytes in blocks:
+            reserved = _io_budget.acquire(nbytes)
+            try:
+                future = executor.submit(
+                    _assign_block, fs, path, local_buffer, offset, nbytes
+                )
+            except BaseException:
+                # E.g., the executor is shut down at interpreter exit
+                _io_budget.release(reserved)
+                raise
+            future.add_done_callback(
+                lambda _, reserved=reserved: _io_budget.release(reserved)
+            )
+            futures.append(future)
+        for future in futures:
+            timer.nbytes += future.result()
+    except BaseException:
+        # Don't leave tasks writing to buffers the caller is releasing
+        for future in futures:
+            future.cancel()
+        wait(futures)
+        raise
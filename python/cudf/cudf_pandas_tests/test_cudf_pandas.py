@@ -12,6 +12,8 @@ import pickle
 import subprocess
 import tempfile
 import types
+import warnings
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO, StringIO
 
 import numpy as np
@@ -20,7 +22,7 @@ import pytest
 from numba import NumbaDeprecationWarning
 from pytz import utc
 
-from cudf.pandas import LOADED, Profiler
+from cudf.pandas import LOADED, Profiler, debugging
 from cudf.pandas.fast_slow_proxy import _Unusable, is_proxy_object
 
 if not LOADED:
@@ -1252,6 +1254,57 @@ def test_pickle_groupby(dataframe):
     tm.assert_equal(pgb.sum(), gb.sum())
 
 
+@pytest.mark.parametrize("slow", [False, True])
+def test_pickle_out_of_band_buffers(dataframe, slow):
+    pdf, df = dataframe
+    if slow:
+        # Make the proxy wrap the pandas object
+        df._fsproxy_slow
+    buffers = []
+    pickled = pickle.dumps(df, protocol=5, buffer_callback=buffers.append)
+    assert len(buffers) > 0
+    tm.assert_equal(pdf, pickle.loads(pickled, buffers=buffers))
+
+    # Without a buffer_callback the buffers are written in band
+    tm.assert_equal(pdf, pickle.loads(pickle.dumps(df, protocol=5)))
+
+
+def test_pickle_groupby_out_of_band_buffers(dataframe):
+    pdf, df = dataframe
+    buffers = []
+    gb = df.groupby("a")
+    pickled = pickle.dumps(gb, protocol=5, buffer_callback=buffers.append)
+    gb = pickle.loads(pickled, buffers=buffers)
+    tm.assert_equal(pdf.groupby("a").sum(), gb.sum())
+
+
+def test_string_columns_bulk_conversion():
+    from cudf.pandas._wrappers.pandas import (
+        _STRING_COLUMNS,
+        _from_pandas,
+        _to_pandas,
+    )
+    from cudf.pandas.fast_slow_proxy import _note_mutation
+
+    pdf = pd.DataFrame(
+        {"a": ["x", "y", "z"], "b": [1, 2, 3], "c": ["u", None, "w"]}
+    )
+    gdf = _from_pandas(pdf)
+    assert _STRING_COLUMNS.get(pdf) == frozenset({0})
+    tm.assert_frame_equal(gdf.to_pandas(), cudf.from_pandas(pdf).to_pandas())
+
+    result = _to_pandas(gdf)
+    tm.assert_frame_equal(result, pdf)
+    assert _STRING_COLUMNS.get(result) == frozenset({0})
+
+    # Any mutation through a proxy invalidates what is known
+    _note_mutation()
+    assert _STRING_COLUMNS.get(result) is None
+
+    ps = pd.Series(["a", "b"], index=[2, 3], name="s")
+    tm.assert_series_equal(_from_pandas(ps).to_pandas(), ps)
+
+
 def test_numpy_extension_array():
     np_array = np.array([0, 1, 2, 3])
     try:
@@ -1524,6 +1577,90 @@ def test_cudf_pandas_debugging_failed(monkeypatch):
     monkeypatch.setattr(xpd.Series.mean, "_fsproxy_slow", pd_mean)
 
 
+@pytest.mark.parametrize("asynchronous", [False, True])
+def test_cudf_pandas_debugging_report(monkeypatch, asynchronous):
+    cudf_mean = cudf.Series.mean
+
+    def mock_mean_one(self, *args, **kwargs):
+        return np.float64(1.0)
+
+    debugging.reset()
+    with monkeypatch.context() as monkeycontext:
+        monkeypatch.setattr(xpd.Series.mean, "_fsproxy_fast", mock_mean_one)
+        monkeycontext.setenv("CUDF_PANDAS_DEBUGGING", "True")
+        monkeycontext.setattr(debugging._VERIFIER, "budget", 2)
+        monkeycontext.setattr(
+            debugging._VERIFIER, "asynchronous", asynchronous
+        )
+        s = xpd.Series([1, 2])
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            for _ in range(3):
+                assert s.mean() == 1.0
+        debugging.flush()
+    # Must explicitly undo the patch. Proxy dispatch doesn't work with monkeypatch contexts.
+    monkeypatch.setattr(xpd.Series.mean, "_fsproxy_fast", cudf_mean)
+
+    # Only synchronous verification warns
+    assert len(w) == (0 if asynchronous else 2)
+    report = debugging.snapshot()
+    debugging.reset()
+    assert report["verified"]["Series.mean"] == 2
+    (mismatch,) = (
+        m for m in report["mismatches"] if m["function"] == "Series.mean"
+    )
+    assert mismatch["kind"] == "mismatch"
+    assert mismatch["count"] == 2
+    assert mismatch["arg_shapes"] == [[2]]
+    assert "were different" in mismatch["first_diff"]
+
+
+def test_cudf_pandas_debugging_async_detached(monkeypatch):
+    debugging.reset()
+    with monkeypatch.context() as monkeycontext:
+        monkeycontext.setenv("CUDF_PANDAS_DEBUGGING", "True")
+        monkeycontext.setattr(debugging._VERIFIER, "budget", 0)
+        monkeycontext.setattr(debugging._VERIFIER, "asynchronous", True)
+        # Queue the verifications without running them
+        monkeycontext.setattr(
+            debugging._VERIFIER, "_start_worker", lambda: None
+        )
+        s = xpd.Series([1.0, 2.0])
+        assert s.mean() == 1.5
+        # The series is converted to pandas by the verification only
+        assert isinstance(s._fsproxy_wrapped, cudf.Series)
+        _, _, check = debugging._VERIFIER._queue.get_nowait()
+        assert check() is None
+        assert isinstance(s._fsproxy_wrapped, cudf.Series)
+
+        # Verifications of objects modified in the meantime are stale
+        assert s.mean() == 1.5
+        s[0] = 10.0
+        _, _, check = debugging._VERIFIER._queue.get_nowait()
+        with pytest.raises(debugging._StaleVerification):
+            check()
+
+        # Calls modifying objects in place are verified synchronously
+        s = xpd.Series([1.0, None])
+        s.fillna(0.0, inplace=True)
+        assert debugging._VERIFIER._queue.empty()
+    report = debugging.snapshot()
+    debugging.reset()
+    assert report["verified"]["Series.fillna"] == 1
+
+
+def test_cudf_pandas_debugging_budget_threads():
+    verifier = debugging._Verifier(
+        sample_rate=1.0, budget=10, asynchronous=False
+    )
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        verified = list(
+            executor.map(lambda _: verifier.should_verify("f"), range(100))
+        )
+    assert sum(verified) == 10
+    assert verifier.report.snapshot()["verified"] == {"f": 10}
+
+
 def test_excelwriter_pathlike():
     assert isinstance(pd.ExcelWriter("foo.xlsx"), os.PathLike)
 
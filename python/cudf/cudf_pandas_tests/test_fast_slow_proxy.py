@@ -11,8 +11,13 @@ import numpy as np
 import pytest
 
 from cudf.pandas.fast_slow_proxy import (
+    _FALLBACK_CACHE,
+    _PLANS,
+    _TWINS,
     _fast_arg,
     _FunctionProxy,
+    _maybe_wrap_result,
+    _ProxyManifest,
     _slow_arg,
     _transform_arg,
     _Unusable,
@@ -546,3 +551,332 @@ def test_tuple_with_attrs_transform():
     assert b == bprime and b is not bprime
     assert c == cprime and c is not cprime
     assert d == dprime and d is not dprime
+
+
+@pytest.fixture
+def fallback_cache(monkeypatch):
+    monkeypatch.setattr(_FALLBACK_CACHE, "enabled", True)
+    _FALLBACK_CACHE.clear()
+    yield _FALLBACK_CACHE
+    _FALLBACK_CACHE.clear()
+
+
+def test_fallback_cache_skips_fast_path(fallback_cache):
+    fast_calls = []
+
+    class Fast:
+        def method(self, x):
+            fast_calls.append(x)
+            raise NotImplementedError()
+
+    class Slow:
+        def method(self, x):
+            return x
+
+    Pxy = make_final_proxy_type(
+        "Pxy",
+        Fast,
+        Slow,
+        fast_to_slow=lambda fast: Slow(),
+        slow_to_fast=lambda slow: Fast(),
+    )
+    pxy = Pxy()
+    assert pxy.method(1) == 1
+    assert pxy.method(1) == 1
+    assert fast_calls == [1]
+    assert fallback_cache.info().hits == 1
+
+    # A different argument value is a different signature
+    assert pxy.method(2) == 2
+    assert fast_calls == [1, 2]
+
+
+def test_fallback_cache_not_populated_on_success(fallback_cache):
+    class Fast:
+        def method(self):
+            return "fast"
+
+    class Slow:
+        def method(self):
+            return "slow"
+
+    Pxy = make_final_proxy_type(
+        "Pxy",
+        Fast,
+        Slow,
+        fast_to_slow=lambda fast: Slow(),
+        slow_to_fast=lambda slow: Fast(),
+    )
+    pxy = Pxy()
+    assert pxy.method() == "fast"
+    assert pxy.method() == "fast"
+    info = fallback_cache.info()
+    assert info.hits == 0
+    assert info.currsize == 0
+
+
+def test_fallback_cache_eviction():
+    cache = type(_FALLBACK_CACHE)(maxsize=2, enabled=True)
+    cache.add("a")
+    cache.add("b")
+    assert "a" in cache
+    cache.add("c")
+    assert "b" not in cache
+    assert "a" in cache
+    assert "c" in cache
+    assert cache.info() == (3, 1, 2, 2)
+
+
+@pytest.fixture
+def plans(monkeypatch):
+    monkeypatch.setattr(_PLANS, "enabled", True)
+    _PLANS.clear()
+    yield _PLANS
+    _PLANS.clear()
+
+
+def test_plan_mode_runs_call_site_slow(plans):
+    fast_calls = []
+
+    class Fast:
+        def works(self):
+            fast_calls.append("works")
+            return self
+
+        def fails(self):
+            fast_calls.append("fails")
+            raise NotImplementedError()
+
+    class Slow:
+        def works(self):
+            return self
+
+        def fails(self):
+            return self
+
+    Pxy = make_final_proxy_type(
+        "Pxy",
+        Fast,
+        Slow,
+        fast_to_slow=lambda fast: Slow(),
+        slow_to_fast=lambda slow: Fast(),
+    )
+    pxy = Pxy()
+    for _ in range(2):
+        # Once a step falls back, the rest of the line runs on the
+        # slow path, now and in later executions
+        pxy.works().fails().works()
+    assert fast_calls == ["works", "fails"]
+    assert plans.info().currsize == 1
+
+    # Other call sites are unaffected
+    pxy.works()
+    assert fast_calls == ["works", "fails", "works"]
+
+
+@pytest.fixture
+def twins(monkeypatch):
+    monkeypatch.setattr(_TWINS, "enabled", True)
+    monkeypatch.setattr(_TWINS, "limit", 0)
+    yield _TWINS
+    _TWINS.clear()
+
+
+@pytest.fixture
+def counting_proxy():
+    conversions = []
+
+    class Fast:
+        def __init__(self, x):
+            self.x = x
+
+        def fast_method(self):
+            return self.x
+
+        def __setitem__(self, key, value):
+            self.x = value
+
+        def isetitem(self, loc, value):
+            self.x = value
+
+        def replace(self, value, inplace=False):
+            if inplace:
+                self.x = value
+            else:
+                return type(self)(value)
+
+    class Slow:
+        def __init__(self, x):
+            self.x = x
+
+        def fast_method(self):
+            return self.x
+
+        def slow_method(self):
+            return self.x
+
+        def __setitem__(self, key, value):
+            self.x = value
+
+        def isetitem(self, loc, value):
+            self.x = value
+
+        def replace(self, value, inplace=False):
+            if inplace:
+                self.x = value
+            else:
+                return type(self)(value)
+
+    def fast_to_slow(fast):
+        conversions.append("fast_to_slow")
+        return Slow(fast.x)
+
+    def slow_to_fast(slow):
+        conversions.append("slow_to_fast")
+        return Fast(slow.x)
+
+    Pxy = make_final_proxy_type(
+        "Pxy",
+        Fast,
+        Slow,
+        fast_to_slow=fast_to_slow,
+        slow_to_fast=slow_to_fast,
+    )
+    return Pxy, conversions
+
+
+def test_dual_residency_reuses_twin(twins, counting_proxy):
+    Pxy, conversions = counting_proxy
+    pxy = Pxy(1)
+    for _ in range(3):
+        assert pxy.slow_method() == 1
+        assert pxy.fast_method() == 1
+    assert conversions == ["fast_to_slow"]
+
+
+def test_dual_residency_mutation_invalidates_twin(twins, counting_proxy):
+    Pxy, conversions = counting_proxy
+    pxy = Pxy(1)
+    assert pxy.slow_method() == 1
+    pxy["a"] = 2
+    assert conversions == ["fast_to_slow", "slow_to_fast"]
+    assert pxy.slow_method() == 2
+    assert conversions == ["fast_to_slow", "slow_to_fast", "fast_to_slow"]
+
+
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        lambda pxy: pxy.isetitem(0, 2),
+        lambda pxy: pxy.replace(2, inplace=True),
+        lambda pxy: pxy.replace(2, True),
+    ],
+)
+def test_dual_residency_mutating_methods(twins, counting_proxy, mutate):
+    Pxy, _ = counting_proxy
+    pxy = Pxy(1)
+    assert pxy.slow_method() == 1
+    mutate(pxy)
+    # The twin retained before the mutation isn't used anymore
+    assert pxy.slow_method() == 2
+
+
+def test_dual_residency_limit(twins, counting_proxy, monkeypatch):
+    Pxy, conversions = counting_proxy
+    monkeypatch.setattr("cudf.pandas.fast_slow_proxy._nbytes", lambda obj: 10)
+    monkeypatch.setattr(twins, "limit", 15)
+    a = Pxy(1)
+    b = Pxy(2)
+    a.slow_method()
+    assert twins.nbytes == 10
+    b.slow_method()
+    # a's twin was evicted to make space for b's
+    assert twins.nbytes == 10
+    assert a._fsproxy_twin is None
+    assert b._fsproxy_twin is not None
+
+
+@pytest.mark.parametrize(
+    "arg",
+    [
+        [1, 2.0, "a", None],
+        (1, 2.0, "a", None),
+        {"a": 1, 2: "b"},
+        np.array([1, "a", None], dtype=object),
+    ],
+)
+def test_transform_arg_leaves_only(arg):
+    result = _fast_arg(arg)
+    assert type(result) is type(arg)
+    # Mutable containers are copied
+    assert (result is arg) == isinstance(arg, tuple)
+    if isinstance(arg, np.ndarray):
+        np.testing.assert_array_equal(result, arg)
+    else:
+        assert result == arg
+
+
+def test_fast_arg_closure_cache(final_proxy):
+    _, _, y = final_proxy
+
+    def func():
+        return y
+
+    g = _fast_arg(func)
+    assert g is not func
+    assert _fast_arg(func) is g
+    assert _slow_arg(func) is not g
+
+    # Converting y to slow and back to fast creates a new fast object,
+    # which the cached function must not capture
+    y._fsproxy_slow
+    h = _fast_arg(func)
+    assert h is not g
+    assert h() is y._fsproxy_wrapped
+    assert h() is not g()
+
+
+def test_fast_slow_arg_list_of_proxies(final_proxy):
+    fast, slow, pxy = final_proxy
+    assert _fast_arg([pxy, pxy]) == [fast, fast]
+    assert _slow_arg([pxy, pxy]) == [slow, slow]
+
+
+def test_maybe_wrap_result_list(final_proxy):
+    fast, _, pxy = final_proxy
+    labels = [1, "a", None]
+    assert _maybe_wrap_result(labels, None) is labels
+
+    result = _maybe_wrap_result([fast, fast], None)
+    assert all(type(r) is type(pxy) for r in result)
+    assert [r._fsproxy_fast for r in result] == [fast, fast]
+
+
+def test_proxy_manifest(tmp_path):
+    class Slow:
+        """Slow docstring"""
+
+        def __len__(self):
+            return 0
+
+        def method(self):
+            pass
+
+    manifest = _ProxyManifest(str(tmp_path))
+    expected = _ProxyManifest._introspect(Slow)
+    assert expected[:2] == (dir(Slow), "Slow docstring")
+    assert "__len__" in expected[2]
+    assert manifest.describe(Slow) == expected
+    manifest.save()
+    assert list(tmp_path.iterdir()) == [tmp_path / manifest.path]
+
+    # A new manifest is loaded from the file
+    manifest = _ProxyManifest(str(tmp_path))
+    assert manifest.describe(Slow) == expected
+    assert not manifest._dirty
+
+    # Changing the slow type invalidates its entry
+    Slow.other = lambda self: None
+    slow_dir, _, _ = manifest.describe(Slow)
+    assert "other" in slow_dir
+    assert manifest._dirty
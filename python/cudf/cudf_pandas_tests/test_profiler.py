@@ -2,10 +2,14 @@
 # All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
+import json
 import os
 import subprocess
+import sys
 
-from cudf.pandas import LOADED, Profiler
+import pytest
+
+from cudf.pandas import LOADED, Profiler, call_stats
 
 if not LOADED:
     raise ImportError("These tests must be run with cudf.pandas loaded")
@@ -14,9 +18,22 @@ import numpy as np
 import pandas as pd
 
 
-def test_profiler():
+@pytest.mark.parametrize(
+    "backend",
+    [
+        "settrace",
+        pytest.param(
+            "monitoring",
+            marks=pytest.mark.skipif(
+                sys.version_info < (3, 12),
+                reason="sys.monitoring requires Python 3.12",
+            ),
+        ),
+    ],
+)
+def test_profiler(backend):
     np.random.seed(42)
-    with Profiler() as profiler:
+    with Profiler(backend=backend) as profiler:
         df = pd.DataFrame(
             {
                 "idx": np.random.randint(0, 10, 1000),
@@ -64,10 +81,42 @@ def test_profiler():
         assert line_stats[3] == 0 if "Time" not in call else line_stats[2] == 0
 
 
-def test_profiler_hasattr_exception():
-    with Profiler():
+def test_profiler_conversion_stats():
+    with Profiler() as profiler:
+        df = pd.DataFrame({"a": [1, 2, 3]})
+        df.sum()
+        df.infer_objects()
+        df.sum()
+
+    stats = profiler.conversion_stats
+    assert {
+        (line.strip(), proxy_type, direction)
+        for _, line, proxy_type, direction, *_ in stats
+    } == {
+        ("df.infer_objects()", "DataFrame", "fast_to_slow"),
+        ("df.sum()", "DataFrame", "slow_to_fast"),
+    }
+    for *_, count, nbytes, seconds in stats:
+        assert count == 1
+        assert nbytes > 0
+        assert seconds > 0
+
+
+@pytest.mark.parametrize("backend", ["settrace", "auto"])
+def test_profiler_hasattr_exception(backend):
+    with Profiler(backend=backend) as profiler:
         df = pd.DataFrame({"data": [1, 2, 3]})
         hasattr(df, "this_does_not_exist")
+        df = pd.DataFrame({"data": [1, 2, 3]})
+    assert len(profiler.per_function_stats["DataFrame"]["gpu"]) == 2
+
+
+@pytest.mark.skipif(
+    sys.version_info >= (3, 12), reason="sys.monitoring is available"
+)
+def test_profiler_monitoring_unavailable():
+    with pytest.raises(ValueError):
+        Profiler(backend="monitoring")
 
 
 def test_profiler_fast_slow_name_mismatch():
@@ -112,3 +161,49 @@ def test_profiler_commandline():
         "CPU percall",
     ]:
         assert string in output
+
+
+@pytest.fixture
+def enabled_call_stats():
+    call_stats.reset()
+    call_stats.enable(sample_rate=1)
+    yield
+    call_stats.disable()
+    call_stats.reset()
+
+
+def test_call_stats(enabled_call_stats, tmp_path):
+    df = pd.DataFrame({"a": [1, 2, 3]})
+    df.sum()
+    df.sum()
+    pd.Timestamp(2020, 1, 1)
+
+    stats = call_stats.snapshot()
+    assert stats["DataFrame.sum"]["fast_calls"] == 2
+    assert stats["DataFrame.sum"]["slow_calls"] == 0
+    assert stats["DataFrame.sum"]["timed_fast_calls"] == 2
+    assert stats["DataFrame.sum"]["fast_time"] > 0
+    assert stats["Timestamp"]["slow_calls"] == 1
+
+    path = tmp_path / "stats.jsonl"
+    call_stats.dump(path)
+    with open(path) as f:
+        records = {record["function"]: record for record in map(json.loads, f)}
+    assert records["DataFrame.sum"]["fast_calls"] == 2
+
+
+def test_call_stats_sampling(enabled_call_stats):
+    call_stats.enable(sample_rate=0)
+    df = pd.DataFrame({"a": [1, 2, 3]})
+    df.sum()
+    stats = call_stats.snapshot()["DataFrame.sum"]
+    assert stats["fast_calls"] == 1
+    assert stats["timed_fast_calls"] == 0
+
+
+def test_call_stats_conversion_bytes(enabled_call_stats):
+    df = pd.DataFrame({"a": [1, 2, 3]})
+    # Force the frame to be on the CPU before calling a method on it
+    df._fsproxy_slow
+    df.sum()
+    assert call_stats.snapshot()["DataFrame.sum"]["conversion_bytes"] > 0